@@ -0,0 +1,3 @@
+"""
+Benchmarks of the grid over all the tilings (see 'benchmarks.__main__').
+"""
@@ -0,0 +1,159 @@
+"""
+Benchmark suite of the grid.
+
+Run from the root of the repository:
+    python -m benchmarks [--profile quick|full] [--filter TEXT]
+                         [--output results.json]
+                         [--compare baseline.json] [--tolerance 0.25]
+
+Every case is run repeatedly (at least 'min_time' of the profile and at
+least 3 times) and its best time is reported. The results are written as
+JSON - to the '--output' file or to the standard output (the progress goes
+to the standard error). With '--compare', the results are compared with a
+baseline written before by '--output': the cases slower than the baseline
+by more than the '--tolerance' are reported as regressions.
+
+The import of 'semigrid' is checked too - it must fit the budget and must not
+load the lazily imported modules (see 'cases.import_time').
+
+The exit status is 1 if there is a regression or a failed check.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Tuple, Dict, List, Any, Optional
+
+import numpy as np
+
+from benchmarks.cases import PROFILES, IMPORT_BUDGET, Operation, \
+    case_parameters, import_time
+
+Results = Dict[str, Dict[str, Any]]
+
+MIN_REPEATS = 3
+MAX_REPEATS = 1000
+IMPORT_REPEATS = 5
+
+
+def _measure(operation: Operation, min_time: float) -> Tuple[float, int]:
+    """Best time of the 'operation' and the number of its runs."""
+    best = float('inf')
+    total = 0.0
+    repeats = 0
+    while repeats < MIN_REPEATS or \
+            (total < min_time and repeats < MAX_REPEATS):
+        start = time.perf_counter()
+        operation()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        repeats += 1
+    return best, repeats
+
+
+def _log(message: str) -> None:
+    print(message, file=sys.stderr, flush=True)
+
+
+def run(profile_name: str, name_filter: Optional[str] = None) \
+        -> Tuple[Results, List[str]]:
+    """Results of the benchmarks of the profile and the failed checks."""
+    profile = PROFILES[profile_name]
+    results: Results = {}
+    failures: List[str] = []
+
+    for name, notation, case, params in case_parameters(profile):
+        if name_filter is not None and name_filter not in name:
+            continue
+        try:
+            operation, items = case(notation, params)
+        except ImportError as error:
+            # optional dependencies (e.g. matplotlib of the visualisation)
+            _log(f"{name}: skipped ({error})")
+            continue
+        seconds, repeats = _measure(operation, profile['min_time'])
+        results[name] = {'seconds': seconds, 'repeats': repeats,
+                         'items': items,
+                         'seconds_per_item': seconds / max(items, 1)}
+        _log(f"{name}: {seconds * 1000:.3f} ms ({items} items)")
+
+    if name_filter is None or name_filter == 'import':
+        seconds, loaded = min(import_time() for _ in range(IMPORT_REPEATS))
+        results['import'] = {'seconds': seconds, 'repeats': IMPORT_REPEATS,
+                             'items': 1, 'seconds_per_item': seconds,
+                             'loaded': loaded}
+        _log(f"import: {seconds * 1000:.1f} ms")
+        if seconds > IMPORT_BUDGET:
+            failures.append(f"import: {seconds * 1000:.1f} ms exceeds the "
+                            f"budget of {IMPORT_BUDGET * 1000:.0f} ms")
+        if loaded:
+            failures.append(f"import: loads {', '.join(loaded)}")
+
+    return results, failures
+
+
+def compare(results: Results, baseline: Results, tolerance: float) \
+        -> List[str]:
+    """Regressions of the 'results' against the 'baseline'."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result['seconds'] / baseline[name]['seconds']
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{name}: {ratio:.2f}x slower "
+                f"({baseline[name]['seconds'] * 1000:.3f} ms -> "
+                f"{result['seconds'] * 1000:.3f} ms)")
+    return regressions
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description="Benchmarks of semigrid.")
+    parser.add_argument('--profile', choices=sorted(PROFILES),
+                        default='full')
+    parser.add_argument('--filter', help="run only the cases whose name "
+                                         "contains the text ('import' "
+                                         "runs only the import check)")
+    parser.add_argument('--output', help="JSON file of the results "
+                                         "(standard output by default)")
+    parser.add_argument('--compare', help="JSON file of the baseline results")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown against the baseline")
+    args = parser.parse_args(arguments)
+
+    results, failures = run(args.profile, args.filter)
+    document = {
+        'profile': args.profile,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'results': results,
+    }
+    text = json.dumps(document, indent=1, sort_keys=True)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, 'w') as output_file:
+            output_file.write(text + '\n')
+
+    if args.compare is not None:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get('profile') != args.profile:
+            _log(f"Baseline profile '{baseline.get('profile')}' differs "
+                 f"from '{args.profile}'.")
+        regressions = compare(results, baseline['results'], args.tolerance)
+        _log(f"{len(regressions)} regressions against {args.compare}")
+        failures.extend(regressions)
+
+    for failure in failures:
+        _log(f"FAILED {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
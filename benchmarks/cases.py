@@ -0,0 +1,249 @@
+"""
+Benchmark cases of the grid.
+
+Every case is measured for each tiling of 'POSSIBLE_RDGNT' and for each
+combination of the parameters of the profile - area sizes (the side of the
+square area around the origin), edge sizes and grid rotations - so the
+results of one operation over the area sizes form its scaling curve.
+
+A case is a function of (notation, parameters) that prepares everything it
+needs and returns the measured operation (without arguments) and the number
+of items (cells, points, ...) the operation processes.
+"""
+import math
+import os
+import random
+import subprocess
+import sys
+from typing import Tuple, List, Dict, Callable, Any, Iterator
+
+import numpy as np
+
+from semigrid import SemiregularGrid
+from semigrid.constants import POSSIBLE_RDGNT
+from semigrid.registry import Topology
+from semigrid.topology_generator import _ConfigurationTables
+
+
+Params = Dict[str, Any]
+Operation = Callable[[], Any]
+Case = Callable[[str, Params], Tuple[Operation, int]]
+
+# budget of 'import semigrid' and the modules it must not load
+IMPORT_BUDGET = 0.25
+# modules 'import semigrid' must not load (the optional dependencies, the
+# process pool and the modules of the visualisation and the tile server)
+LAZY_MODULES = ('matplotlib', 'shapely', 'multiprocessing',
+                'concurrent.futures', 'http.server', 'semigrid.visualisation',
+                'semigrid.raster', 'semigrid.tileserver')
+
+PROFILES: Dict[str, Params] = {
+    'quick': {'area_sizes': (200, 400), 'edge_sizes': (25,),
+              'rotations': (0.0,), 'points': 500, 'min_time': 0.05},
+    'full': {'area_sizes': (250, 500, 1000, 2000), 'edge_sizes': (20, 50),
+             'rotations': (0.0, math.pi / 7), 'points': 2000,
+             'min_time': 0.2},
+}
+
+NOTATIONS = ['.'.join(map(str, vertex_configuration))
+             for vertex_configuration in POSSIBLE_RDGNT]
+
+
+def _area(size: float) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    """Square area range of the side 'size' around the origin."""
+    return (-size / 2, -size / 2), (size / 2, size / 2)
+
+
+def _grid(notation: str, params: Params) -> SemiregularGrid:
+    return SemiregularGrid(notation, params['edge_size'],  # type: ignore
+                           params['rotation'])
+
+
+def _points(params: Params) -> List[Tuple[float, float]]:
+    """Random points within the area (the same for every run)."""
+    generator = random.Random(0)
+    half = params['area_size'] / 2
+    return [(generator.uniform(-half, half), generator.uniform(-half, half))
+            for _ in range(params['points'])]
+
+
+def construct(notation: str, params: Params) -> Tuple[Operation, int]:
+    """Construction of the grid (the topology is shared)."""
+    return lambda: _grid(notation, params), 1
+
+
+def topology(notation: str, params: Params) -> Tuple[Operation, int]:
+    """Construction of the topology of the tiling (not shared)."""
+    vertex_configuration = tuple(map(int, notation.split('.')))
+    return lambda: Topology(vertex_configuration), 1
+
+
+def topology_tables(notation: str, params: Params) -> Tuple[Operation, int]:
+    """
+    Derivation of the topology tables (adjacency shifts, edge templates and
+    half-planes) of the tiling.
+    """
+    vertex_configuration = tuple(map(int, notation.split('.')))
+    return lambda: _ConfigurationTables(vertex_configuration), 1
+
+
+def _generation(method: str) -> Case:
+    def case(notation: str, params: Params) -> Tuple[Operation, int]:
+        grid = _grid(notation, params)
+        area_range = _area(params['area_size'])
+        cells = len(grid.generate_centres(area_range))
+        return lambda: getattr(grid, method)(area_range), cells
+
+    case.__doc__ = f"'{method}' of the area."
+    return case
+
+
+def coords_to_index(notation: str, params: Params) -> Tuple[Operation, int]:
+    """Conversion of random points into the indices of their cells."""
+    grid = _grid(notation, params)
+    points = _points(params)
+    return lambda: [grid.coords_to_index(xy) for xy in points], len(points)
+
+
+def coords_to_indices(notation: str, params: Params) \
+        -> Tuple[Operation, int]:
+    """Conversion of an array of random points at once."""
+    grid = _grid(notation, params)
+    points = np.array(_points(params) * 32)
+    return lambda: grid._coords_to_indices(points), len(points)
+
+
+def _sampling(method: str) -> Case:
+    def case(notation: str, params: Params) -> Tuple[Operation, int]:
+        grid = _grid(notation, params)
+        area_range = _area(params['area_size'])
+        for n, xy in enumerate(grid.generate_centres(area_range)):
+            grid[grid.coords_to_index(xy)] = n
+        points = np.array(_points(params) * 32)
+        return lambda: grid.sample(points, 'num', method), len(points)
+
+    case.__doc__ = f"Sampling of the values at random points by '{method}'."
+    return case
+
+
+def index_to_coords(notation: str, params: Params) -> Tuple[Operation, int]:
+    """Conversion of indices into the centres of their cells."""
+    grid = _grid(notation, params)
+    indices = [grid.coords_to_index(xy) for xy in _points(params)]
+    return lambda: [grid.index_to_coords(index) for index in indices], \
+        len(indices)
+
+
+def adjacents(notation: str, params: Params) -> Tuple[Operation, int]:
+    """Adjacents of the cells of random points."""
+    grid = _grid(notation, params)
+    indices = [grid.coords_to_index(xy) for xy in _points(params)]
+    return lambda: [grid.adjacents(index) for index in indices], \
+        len(indices)
+
+
+def dual_graph(notation: str, params: Params) -> Tuple[Operation, int]:
+    """Dual graph (CSR) of the area."""
+    grid = _grid(notation, params)
+    area_range = _area(params['area_size'])
+    cells = len(grid.generate_centres(area_range))
+    return lambda: grid.dual_graph(area_range), cells
+
+
+def filter_values(notation: str, params: Params) -> Tuple[Operation, int]:
+    """Filtering of the numerical values of the cells of random points."""
+    grid = _grid(notation, params)
+    for n, xy in enumerate(_points(params)):
+        grid[grid.coords_to_index(xy)] = n
+    return lambda: grid.filter_num_values(lambda value: value % 2 == 0), \
+        len(grid.numerical_values)
+
+
+def draw(notation: str, params: Params) -> Tuple[Operation, int]:
+    """
+    Drawing of the interactive visualisation of the area (with coloured
+    cells) by the Agg backend.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from semigrid.visualisation import Visualisation
+
+    grid = _grid(notation, params)
+    for n, xy in enumerate(_points(params)):
+        grid[grid.coords_to_index(xy)] = (n % 2, 0.5, 1 - n % 2, 1)
+    area_range = _area(params['area_size'])
+    cells = len(grid.generate_centres(area_range))
+
+    def operation() -> None:
+        visualisation = Visualisation((grid,), area_range)
+        visualisation._visualise_grid()
+        visualisation.fig.canvas.draw()
+        plt.close(visualisation.fig)
+
+    return operation, cells
+
+
+# cases measured only once per tiling (they do not depend on the area)
+TILING_CASES: Dict[str, Case] = {
+    'construct': construct,
+    'topology': topology,
+    'topology_tables': topology_tables,
+}
+
+AREA_CASES: Dict[str, Case] = {
+    'generate': _generation('generate'),
+    'generate_centres': _generation('generate_centres'),
+    'generate_polygons': _generation('generate_polygons'),
+    'generate_edges': _generation('generate_edges'),
+    'coords_to_index': coords_to_index,
+    'coords_to_indices': coords_to_indices,
+    'index_to_coords': index_to_coords,
+    'sample_nearest': _sampling('nearest'),
+    'sample_idw': _sampling('idw'),
+    'sample_barycentric': _sampling('barycentric'),
+    'adjacents': adjacents,
+    'dual_graph': dual_graph,
+    'filter_values': filter_values,
+    'draw': draw,
+}
+
+
+def case_parameters(profile: Params) \
+        -> Iterator[Tuple[str, str, Case, Params]]:
+    """(name, notation, case, parameters) of every benchmark of the profile."""
+    base = {'points': profile['points'], 'area_size': 0,
+            'edge_size': profile['edge_sizes'][0],
+            'rotation': profile['rotations'][0]}
+    for notation in NOTATIONS:
+        for case_name, case in TILING_CASES.items():
+            yield f"{case_name}/{notation}", notation, case, base
+
+        for area_size in profile['area_sizes']:
+            for edge_size in profile['edge_sizes']:
+                for rotation in profile['rotations']:
+                    params = dict(base, area_size=area_size,
+                                  edge_size=edge_size, rotation=rotation)
+                    for case_name, case in AREA_CASES.items():
+                        yield f"{case_name}/{notation}/area={area_size}/" \
+                              f"edge={edge_size}/rotation={rotation:.3f}", \
+                              notation, case, params
+
+
+def import_time() -> Tuple[float, List[str]]:
+    """
+    Time of 'import semigrid' in a new interpreter (with the compiled
+    modules already cached) and the modules of LAZY_MODULES it loaded.
+    """
+    script = "import sys, time\n" \
+             "start = time.perf_counter()\n" \
+             "import semigrid\n" \
+             "print(time.perf_counter() - start)\n" \
+             f"print(' '.join(m for m in {LAZY_MODULES!r} " \
+             "if m in sys.modules))\n"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, '-c', script], check=True,
+                            capture_output=True, text=True,
+                            cwd=root).stdout
+    lines = output.split('\n')
+    return float(lines[0]), lines[1].split()
@@ -1,4 +1,13 @@
+from typing import Any
+
 from semigrid.semiregulargrid import SemiregularGrid
-from semigrid.visualisation import matplotlib_visualisation
 
 __all__ = ["SemiregularGrid", "matplotlib_visualisation"]
+
+
+def __getattr__(name: str) -> Any:
+    # the visualisation (and matplotlib) is imported on the first use only
+    if name == "matplotlib_visualisation":
+        from semigrid.visualisation import matplotlib_visualisation
+        return matplotlib_visualisation
+    raise AttributeError(f"module 'semigrid' has no attribute '{name}'")
@@ -0,0 +1,90 @@
+"""
+Packed 64-bit ids of the cells.
+
+The id of the cell (i, j, k) interleaves the bits of the (biased) 'i' and
+'j' - Z-order (Morton) code - above the bits of 'k':
+    id = morton(i + IJ_BIAS, j + IJ_BIAS) << K_BITS | k
+Sorting the ids therefore orders the cells along the Z-order curve of their
+unit blocks, so the cells of nearby blocks get nearby ids.
+
+The vertices (i, j, v) and the edges (i, j, e) of the grid are packed the
+same way, with ELEMENT_K_BITS bits of their type.
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+# bits of the cell type 'k' and of each of the block indices 'i' and 'j'
+K_BITS = 4
+ELEMENT_K_BITS = 5
+IJ_BITS = 29
+# 'i' and 'j' within [-IJ_BIAS, IJ_BIAS) can be packed
+IJ_BIAS = 1 << (IJ_BITS - 1)
+
+# (shift, mask) steps of the bit interleaving
+_SPREAD_STEPS = ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF),
+                 (4, 0x0F0F0F0F0F0F0F0F), (2, 0x3333333333333333),
+                 (1, 0x5555555555555555))
+_COMPACT_STEPS = ((1, 0x3333333333333333), (2, 0x0F0F0F0F0F0F0F0F),
+                  (4, 0x00FF00FF00FF00FF), (8, 0x0000FFFF0000FFFF),
+                  (16, 0x00000000FFFFFFFF))
+
+
+def _spread_bits(x: np.ndarray) -> np.ndarray:
+    """Move the n-th bit of (uint64) 'x' to the 2n-th bit."""
+    for shift, mask in _SPREAD_STEPS:
+        x = (x | (x << np.uint64(shift))) & np.uint64(mask)
+    return x
+
+
+def _compact_bits(x: np.ndarray) -> np.ndarray:
+    """Move the 2n-th bit of (uint64) 'x' to the n-th bit."""
+    x = x & np.uint64(0x5555555555555555)
+    for shift, mask in _COMPACT_STEPS:
+        x = (x | (x >> np.uint64(shift))) & np.uint64(mask)
+    return x
+
+
+def pack_indices(indices: np.ndarray, k_bits: int = K_BITS) -> np.ndarray:
+    """
+    Pack the (N, 3) array of (i, j, k) 'indices' into (N,) int64 ids (with
+    'k_bits' bits of 'k').
+    """
+    indices = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+    ij = indices[:, :2] + IJ_BIAS
+    if np.any((ij < 0) | (ij >= 2 * IJ_BIAS)) or \
+            np.any((indices[:, 2] < 0) | (indices[:, 2] >= 1 << k_bits)):
+        raise Exception("Index is out of the range of the cell ids.")
+
+    ij = ij.astype(np.uint64)
+    morton = _spread_bits(ij[:, 0]) | (_spread_bits(ij[:, 1]) <<
+                                       np.uint64(1))
+    ids: np.ndarray = ((morton << np.uint64(k_bits)) |
+                       indices[:, 2].astype(np.uint64)).astype(np.int64)
+    return ids
+
+
+def unpack_indices(ids: np.ndarray, k_bits: int = K_BITS) -> np.ndarray:
+    """
+    Unpack the (N,) int64 'ids' into an (N, 3) array of (i, j, k) (with
+    'k_bits' bits of 'k').
+    """
+    ids = np.asarray(ids, dtype=np.int64).reshape(-1).astype(np.uint64)
+    morton = ids >> np.uint64(k_bits)
+    i = _compact_bits(morton).astype(np.int64) - IJ_BIAS
+    j = _compact_bits(morton >> np.uint64(1)).astype(np.int64) - IJ_BIAS
+    k = (ids & np.uint64((1 << k_bits) - 1)).astype(np.int64)
+    return np.stack((i, j, k), axis=1)
+
+
+def pack_index(index: Tuple[int, int, int], k_bits: int = K_BITS) -> int:
+    """Pack the (i, j, k) 'index' into its id."""
+    return int(pack_indices(np.array([index]), k_bits)[0])
+
+
+def unpack_index(cell_id: int, k_bits: int = K_BITS) \
+        -> Tuple[int, int, int]:
+    """Unpack the id into its (i, j, k) index."""
+    i, j, k = unpack_indices(np.array([cell_id]), k_bits)[0].tolist()
+    return i, j, k
@@ -0,0 +1,87 @@
+"""
+Opt-in log of the changes of the values of the grid.
+
+Every write and deletion of a value is appended to the log as (layer,
+index). A token is the number of the changes logged so far, so the cells
+changed since a token are the entries of the log after it. The log keeps at
+most 'max_changes' of the latest changes - the consumers whose token is
+older than the oldest kept change have to scan all the values again. A new
+log of the same grid starts after the tokens of the previous one ('start'),
+so the tokens taken before the changes stopped being logged are too old.
+"""
+from typing import Tuple, Dict, List, Optional, Iterable
+
+import numpy as np
+
+from semigrid.cellid import IJ_BIAS, pack_indices
+from semigrid.pyramid import Layer
+
+DEFAULT_MAX_CHANGES = 1_000_000
+
+
+class ChangeLog:
+    """Latest changes of the values of both layers ('rgba' and 'num')."""
+    def __init__(self, max_changes: int = DEFAULT_MAX_CHANGES,
+                 start: int = 0) -> None:
+        if max_changes < 1:
+            raise Exception("The log must keep at least one change.")
+        self.max_changes = max_changes
+        # token of the start of the log plus the number of the changes
+        # dropped from it
+        self._dropped = start
+        self._layers: List[Layer] = []
+        self._indices: List[Tuple[int, int, int]] = []
+
+    @property
+    def token(self) -> int:
+        """Token of the current state (the number of the logged changes)."""
+        return self._dropped + len(self._indices)
+
+    def record(self, layer: Layer, index: Tuple[int, int, int]) -> None:
+        """Log the change of the value of the cell with the 'index'."""
+        self._layers.append(layer)
+        self._indices.append(index)
+        self._trim()
+
+    def record_many(self, layer: Layer,
+                    indices: Iterable[Tuple[int, int, int]]) -> None:
+        """Log the changes of the values of the cells with the 'indices'."""
+        indices = list(indices)
+        self._layers.extend([layer] * len(indices))
+        self._indices.extend(indices)
+        self._trim()
+
+    def _trim(self) -> None:
+        """Drop the oldest changes over the limit (half of the log at once)."""
+        if len(self._indices) <= self.max_changes:
+            return
+        drop = len(self._indices) - self.max_changes // 2
+        del self._layers[:drop]
+        del self._indices[:drop]
+        self._dropped += drop
+
+    def changes_since(self, token: int) \
+            -> Optional[Dict[Layer, np.ndarray]]:
+        """
+        Sorted unique ids (see 'cellid') of the cells changed since the
+        'token' per layer, None if the changes are no longer logged.
+        The cells outside the range of the ids are left out (they are too
+        far to be visible).
+        """
+        if token > self.token:
+            raise Exception("Invalid token: it is newer than the log.")
+        if token < self._dropped:
+            return None
+
+        start = token - self._dropped
+        changes: Dict[Layer, np.ndarray] = {}
+        layers: Tuple[Layer, ...] = ('rgba', 'num')
+        for layer in layers:
+            indices = np.array(
+                [index for index, changed_layer in zip(
+                    self._indices[start:], self._layers[start:])
+                 if changed_layer == layer], dtype=np.int64).reshape(-1, 3)
+            ij = indices[:, :2]
+            packable = np.all((-IJ_BIAS <= ij) & (ij < IJ_BIAS), axis=1)
+            changes[layer] = np.unique(pack_indices(indices[packable]))
+        return changes
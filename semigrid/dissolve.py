@@ -0,0 +1,206 @@
+"""
+Dissolving of a set of cells into the outline polygons of the region.
+
+The edges of the cells are counted by their ids (see 'SemiregularGrid.
+cell_edges') - an edge counted once is on the boundary of the region (its
+other cell is not in the set). Every boundary edge is directed along its
+cell (counterclockwise, from its vertex m to the vertex m + 1), so the
+region is on its left, and followed by the boundary edge starting at its
+end vertex. At a vertex where more boundary edges start (cells touching by
+a vertex only), the edge bounding the same corner of the region is taken -
+the first one clockwise from the reversed incoming edge - so the rings never
+cross. The rings are the cycles of the successors, ranked by pointer jumping
+(all the steps are vectorised, the cost is linear in the number of cells up
+to a logarithmic factor). A ring passing such a vertex twice (around a hole
+touching the exterior by the vertex) is split there into simple rings.
+
+The counterclockwise rings are the exteriors, the clockwise ones are the
+holes (assigned to the smallest exterior containing them). The vertices are
+the exact vertices of the grid - neighbouring rings share them.
+"""
+from typing import Tuple, Dict, List, TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.cellid import ELEMENT_K_BITS, pack_indices, unpack_indices
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+# (exterior, holes) - (N, 2) arrays of the vertices of the rings (not closed)
+OutlinePolygon = Tuple[np.ndarray, List[np.ndarray]]
+
+
+def _boundary_edges(grid: 'SemiregularGrid', cells: np.ndarray) \
+        -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ids of the start and end vertices of the boundary edges of the cells
+    (directed counterclockwise along their cells).
+    """
+    topology = grid._topology
+    edges: List[np.ndarray] = []
+    starts: List[np.ndarray] = []
+    ends: List[np.ndarray] = []
+    for k, (cell_edges, cell_vertices) in enumerate(zip(
+            topology.cell_edges, topology.cell_vertices)):
+        rows = cells[cells[:, 2] == k]
+        if len(rows) == 0:
+            continue
+        for shifts, elements in ((cell_edges, edges),
+                                 (cell_vertices, starts),
+                                 (cell_vertices[1:] + cell_vertices[:1],
+                                  ends)):
+            shifts_array = np.array(shifts, dtype=np.int64)
+            indices = rows[:, None, :] + shifts_array
+            indices[:, :, 2] = shifts_array[:, 2]
+            elements.append(pack_indices(indices.reshape(-1, 3),
+                                         ELEMENT_K_BITS))
+
+    edge_ids = np.concatenate(edges)
+    _, inverse, counts = np.unique(edge_ids, return_inverse=True,
+                                   return_counts=True)
+    boundary = counts[inverse.reshape(-1)] == 1
+    return np.concatenate(starts)[boundary], np.concatenate(ends)[boundary]
+
+
+def _vertex_coords(grid: 'SemiregularGrid', vertex_ids: np.ndarray) \
+        -> np.ndarray:
+    """(N, 2) coordinates of the vertices with the ids (see 'mesh')."""
+    vertices = unpack_indices(vertex_ids, ELEMENT_K_BITS)
+    u, v = grid._unit_vectors
+    coords: np.ndarray = np.round(np.stack((
+        vertices[:, 0] * u[0] + vertices[:, 1] * v[0],
+        vertices[:, 0] * u[1] + vertices[:, 1] * v[1]), axis=1) +
+        np.array(grid._vertices_offsets)[vertices[:, 2]], 5)
+    return coords
+
+
+def _successors(starts: np.ndarray, ends: np.ndarray,
+                start_coords: np.ndarray, end_coords: np.ndarray) \
+        -> np.ndarray:
+    """The boundary edge following each boundary edge."""
+    order = np.argsort(starts, kind='stable')
+    first = np.searchsorted(starts, ends, sorter=order)
+    last = np.searchsorted(starts, ends, side='right', sorter=order)
+    successors = order[np.minimum(first, len(order) - 1)]
+
+    # vertices shared by several corners of the region
+    for edge in np.flatnonzero(last - first > 1):
+        candidates = order[first[edge]:last[edge]]
+        back = start_coords[edge] - end_coords[edge]
+        out = end_coords[candidates] - start_coords[candidates]
+        turns = (np.arctan2(back[1], back[0]) -
+                 np.arctan2(out[:, 1], out[:, 0])) % (2 * np.pi)
+        successors[edge] = candidates[np.argmin(turns)]
+    return successors
+
+
+def _rank_cycles(successors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Label of the cycle of each edge (its smallest edge) and the position of
+    the edge within the cycle (counted from the labelling edge).
+    """
+    labels = np.arange(len(successors))
+    jumps = successors.copy()
+    steps = max(1, int(np.ceil(np.log2(max(len(successors), 2)))))
+    for _ in range(steps + 1):
+        labels = np.minimum(labels, labels[jumps])
+        jumps = jumps[jumps]
+
+    # distances to the last edge of the cycle (the one before its label)
+    last = successors == labels
+    remaining = np.where(last, 0, 1)
+    jumps = np.where(last, np.arange(len(successors)), successors)
+    for _ in range(steps + 1):
+        remaining = remaining + remaining[jumps]
+        remaining[last] = 0
+        jumps = jumps[jumps]
+    return labels, -remaining
+
+
+def _simple_rings(vertex_ids: List[int]) -> List[List[int]]:
+    """
+    Split the closed walk through the vertices into simple cycles (lists of
+    the positions within the walk).
+    """
+    rings = []
+    path: List[int] = []
+    # {vertex: its position within the path}
+    seen: Dict[int, int] = {}
+    for position, vertex in enumerate(vertex_ids):
+        if vertex in seen:
+            start = seen[vertex]
+            rings.append(path[start:])
+            for loop_position in path[start:]:
+                del seen[vertex_ids[loop_position]]
+            path = path[:start]
+        seen[vertex] = len(path)
+        path.append(position)
+    rings.append(path)
+    return rings
+
+
+def _signed_area(ring: np.ndarray) -> float:
+    x, y = ring[:, 0], ring[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def _contains(ring: np.ndarray, point: np.ndarray) -> bool:
+    """Whether the 'point' is inside the ring (not on it)."""
+    x, y = ring[:, 0], ring[:, 1]
+    next_x, next_y = np.roll(x, -1), np.roll(y, -1)
+    crossing = (y > point[1]) != (next_y > point[1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        at_x = x + (point[1] - y) * (next_x - x) / (next_y - y)
+    return bool(np.count_nonzero(crossing & (point[0] < at_x)) % 2)
+
+
+def dissolve(grid: 'SemiregularGrid', cells: np.ndarray) \
+        -> List[OutlinePolygon]:
+    """
+    Outline polygons of the region of the cells with the (N, 3) indices
+    'cells' - [(exterior, holes)], the exteriors counterclockwise, the holes
+    clockwise.
+    """
+    cells = unpack_indices(np.unique(pack_indices(cells)))
+    if len(cells) == 0:
+        return []
+    starts, ends = _boundary_edges(grid, cells)
+    start_coords = _vertex_coords(grid, starts)
+    end_coords = _vertex_coords(grid, ends)
+    labels, positions = _rank_cycles(_successors(starts, ends, start_coords,
+                                                 end_coords))
+    unique_starts, counts = np.unique(starts, return_counts=True)
+    # edges starting at a vertex shared by several corners of the region
+    shared = np.isin(starts, unique_starts[counts > 1])
+
+    order = np.lexsort((positions, labels))
+    splits = np.flatnonzero(np.diff(labels[order])) + 1
+    exteriors: List[np.ndarray] = []
+    holes: List[np.ndarray] = []
+    for ring_edges in np.split(order, splits):
+        if np.any(shared[ring_edges]):
+            rings = [start_coords[ring_edges[simple_ring]] for simple_ring
+                     in _simple_rings(starts[ring_edges].tolist())]
+        else:
+            rings = [start_coords[ring_edges]]
+        for ring in rings:
+            (exteriors if _signed_area(ring) > 0 else holes).append(ring)
+
+    polygons: List[OutlinePolygon] = [(ring, []) for ring in exteriors]
+    areas = [_signed_area(ring) for ring in exteriors]
+    bboxes = np.array([[ring[:, 0].min(), ring[:, 1].min(),
+                        ring[:, 0].max(), ring[:, 1].max()]
+                       for ring in exteriors])
+    for hole in holes:
+        # the midpoint of an edge of the hole lies on no other ring
+        point = (hole[0] + hole[1]) / 2
+        candidates = np.flatnonzero(
+            (bboxes[:, 0] <= point[0]) & (point[0] <= bboxes[:, 2]) &
+            (bboxes[:, 1] <= point[1]) & (point[1] <= bboxes[:, 3]))
+        containing = [n for n in candidates
+                      if _contains(exteriors[n], point)]
+        if containing:
+            polygons[min(containing, key=lambda n: areas[n])][1].append(hole)
+    return polygons
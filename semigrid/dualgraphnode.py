@@ -10,7 +10,10 @@ class DualGraphNode:
     the grid = nodes of the dual graph of the grid.
 
     Each node (=centre of the n-gon) has coordinates, a state and a type.
+    The generated cells are stored compactly, the nodes are their views
+    created on demand.
     """
+    __slots__ = ('_coords', '_rdgnt_name', '_fully_explored')
 
     def __init__(self, coordinates: Tuple[float, float],
                  rdgnt_name: Tuple[int, ...]) -> None:
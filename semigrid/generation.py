@@ -0,0 +1,161 @@
+"""
+Result of one generation of the grid within an area range.
+"""
+from typing import Tuple, List, Iterator, Mapping, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.dualgraphnode import DualGraphNode
+from semigrid.cellid import K_BITS, pack_index, pack_indices, \
+    unpack_indices
+from semigrid.tiles import AreaRange, to_edge_list, to_point_list
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+Edge = Tuple[Tuple[float, float], Tuple[float, float]]
+
+
+class GeneratedCells(Mapping[Tuple[int, int, int], DualGraphNode]):
+    """
+    Compact set of the generated cells stored in parallel arrays:
+    * ids - (N,) int64 array of the cell ids (see 'cellid')
+    * types - (N,) uint8 array of the cell types ('k' of the indices)
+    * centres - (N, 2) float64 array of the centres
+    It is a mapping {(i, j, k): DualGraphNode} in the order of generation;
+    the nodes are views created on demand.
+    """
+    def __init__(self, ids: np.ndarray, centres: np.ndarray,
+                 rdgnt_names: List[Tuple[int, ...]]) -> None:
+        self._ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        self._types = (self._ids & ((1 << K_BITS) - 1)).astype(np.uint8)
+        self._centres = np.asarray(centres, dtype=np.float64).reshape(-1, 2)
+        self._rdgnt_names = rdgnt_names
+
+        # sorted ids for the lookups
+        self._order = np.argsort(self._ids)
+        self._sorted_ids = self._ids[self._order]
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids
+
+    @property
+    def types(self) -> np.ndarray:
+        return self._types
+
+    @property
+    def centres(self) -> np.ndarray:
+        return self._centres
+
+    @property
+    def indices(self) -> np.ndarray:
+        """(N, 3) int64 array of the (i, j, k) indices."""
+        return unpack_indices(self._ids)
+
+    @property
+    def nbytes(self) -> int:
+        return self._ids.nbytes + self._types.nbytes + self._centres.nbytes
+
+    def contains(self, ids: np.ndarray) -> np.ndarray:
+        """Answer (for each of the 'ids') whether the cell is in the set."""
+        if len(self._sorted_ids) == 0:
+            return np.zeros(len(ids), dtype=bool)
+        positions = np.minimum(np.searchsorted(self._sorted_ids, ids),
+                               len(self._sorted_ids) - 1)
+        found: np.ndarray = self._sorted_ids[positions] == ids
+        return found
+
+    def _row(self, index: Tuple[int, int, int]) -> int:
+        """Row of the cell with the given 'index' (-1 if it is not in set)."""
+        try:
+            cell_id = pack_index(index)
+        except Exception:
+            return -1
+        position = int(np.searchsorted(self._sorted_ids, cell_id))
+        if position == len(self._sorted_ids) or \
+                self._sorted_ids[position] != cell_id:
+            return -1
+        return int(self._order[position])
+
+    def __getitem__(self, index: Tuple[int, int, int]) -> DualGraphNode:
+        row = self._row(index)
+        if row < 0:
+            raise KeyError(index)
+        node = DualGraphNode(tuple(self._centres[row].tolist()),
+                             self._rdgnt_names[self._types[row]])
+        node.mark_as_explored()
+        return node
+
+    def __contains__(self, index: object) -> bool:
+        return isinstance(index, tuple) and len(index) == 3 and \
+            self._row(index) >= 0
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        return iter(map(tuple, self.indices.tolist()))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class Generation:
+    """
+    Self-contained result of generating the grid within 'area_range'.
+    It is not changed by any later generation of the grid.
+
+    The cells are always known; the edges, polygons and the dual graph are
+    either provided by the generation or computed from the cells on the first
+    access.
+    """
+    def __init__(self, grid: 'SemiregularGrid', area_range: AreaRange,
+                 cells: GeneratedCells,
+                 edges: Optional[List[Edge]] = None,
+                 polygons: Optional[List[List[Tuple[float, float]]]] = None,
+                 dual_graph: Optional[List[Edge]] = None) -> None:
+        self._grid = grid
+        self._area_range = area_range
+        self._cells = cells
+        self._edges = edges
+        self._polygons = polygons
+        self._dual_graph = dual_graph
+
+    @property
+    def area_range(self) -> AreaRange:
+        return self._area_range
+
+    @property
+    def cells(self) -> GeneratedCells:
+        return self._cells
+
+    @property
+    def centres(self) -> List[Tuple[float, float]]:
+        return to_point_list(self._cells.centres)
+
+    @property
+    def polygons(self) -> List[List[Tuple[float, float]]]:
+        if self._polygons is None:
+            self._polygons = [
+                self._grid._cell_polygon(centre, k) for centre, k in
+                zip(self.centres, self._cells.types.tolist())]
+        return self._polygons
+
+    @property
+    def edges(self) -> List[Edge]:
+        if self._edges is None:
+            self._edges = to_edge_list(
+                self._grid._get_tile_builder().owned_edges(
+                    self._cells.indices, within=lambda adjacents:
+                    self._cells.contains(pack_indices(adjacents))))
+        return self._edges
+
+    @property
+    def dual_graph(self) -> List[Edge]:
+        if self._dual_graph is None:
+            self._dual_graph = to_edge_list(
+                self._grid._get_tile_builder().dual_edges(
+                    self._cells.indices, self._cells.centres))
+        return self._dual_graph
+
+    def __len__(self) -> int:
+        return len(self._cells)
@@ -0,0 +1,67 @@
+"""
+Dual graph of the grid in the compressed sparse row (CSR) form.
+"""
+from typing import Tuple, Any, TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.cellid import pack_indices
+from semigrid.tiles import AreaRange
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+def dual_graph_csr(grid: 'SemiregularGrid', area_range: AreaRange) \
+        -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the dual graph of the cells visible within the 'area_range' as
+    (cell ids, indptr, indices):
+        * cell ids - sorted (N) array of the ids of the cells (see 'cellid')
+        * indptr, indices - the adjacents of the n-th cell are the cells
+            indices[indptr[n]:indptr[n + 1]] (in the order of 'adjacents')
+    Only the adjacents visible within the range are included, so every edge
+    is stored once in each direction.
+    """
+    cells, _, _ = grid._get_tile_builder().cells_in_range(area_range)
+    if len(cells) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(1, dtype=np.int64), \
+            np.zeros(0, dtype=np.int64)
+
+    ids = pack_indices(cells)
+    order = np.argsort(ids)
+    cells, ids = cells[order], ids[order]
+
+    rows, columns, slots = [], [], []
+    for k, rdgnt_name in enumerate(grid._rdgnt_names):
+        k_rows = np.flatnonzero(cells[:, 2] == k)
+        for slot, (di, dj, dk) in enumerate(
+                grid.adj_indices_shift[rdgnt_name]):
+            adjacents = cells[k_rows] + (di, dj, 0)
+            adjacents[:, 2] = dk
+            adj_ids = pack_indices(adjacents)
+            positions = np.minimum(np.searchsorted(ids, adj_ids),
+                                   len(ids) - 1)
+            found = ids[positions] == adj_ids
+            rows.append(k_rows[found])
+            columns.append(positions[found])
+            slots.append(np.full(found.sum(), slot))
+
+    row = np.concatenate(rows)
+    column = np.concatenate(columns)
+    order = np.lexsort((np.concatenate(slots), row))
+    indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(row, minlength=len(ids)), out=indptr[1:])
+    return ids, indptr, column[order].astype(np.int64)
+
+
+def to_sparse_matrix(indptr: np.ndarray, indices: np.ndarray) -> Any:
+    """Create SciPy sparse adjacency matrix from the CSR arrays."""
+    try:
+        from scipy.sparse import csr_matrix
+    except ImportError:
+        raise Exception("SciPy is required for the sparse adjacency matrix.")
+
+    n = len(indptr) - 1
+    return csr_matrix((np.ones(len(indices), dtype=np.int8), indices,
+                       indptr), shape=(n, n))
@@ -0,0 +1,64 @@
+"""
+Indexed mesh of the grid - a shared vertex buffer and a face index buffer.
+"""
+from typing import Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.cellid import ELEMENT_K_BITS, pack_indices, unpack_indices
+from semigrid.tiles import AreaRange
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+def indexed_mesh(grid: 'SemiregularGrid', area_range: AreaRange) \
+        -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the polygons of the cells visible within the 'area_range' as
+    (vertices, face offsets, face indices, cell ids):
+        * vertices - (V, 2) array of the coordinates of the vertices, each
+            vertex shared by several cells once (sorted by the vertex ids,
+            see 'SemiregularGrid.cell_vertices')
+        * face offsets, face indices - the n-th face (polygon) consists of
+            the vertices face_indices[face_offsets[n]:face_offsets[n + 1]]
+            (counterclockwise)
+        * cell ids - sorted (N) array of the ids of the faces' cells (see
+            'cellid')
+    """
+    cells, _, _ = grid._get_tile_builder().cells_in_range(area_range)
+    if len(cells) == 0:
+        return np.zeros((0, 2)), np.zeros(1, dtype=np.int64), \
+            np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    ids = pack_indices(cells)
+    order = np.argsort(ids)
+    cells, ids = cells[order], ids[order]
+
+    topology = grid._topology
+    counts = np.array([len(vertices) for vertices in
+                       topology.cell_vertices])[cells[:, 2]]
+    offsets = np.zeros(len(cells) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    vertex_ids = np.zeros(offsets[-1], dtype=np.int64)
+    for k, cell_vertices in enumerate(topology.cell_vertices):
+        rows = np.flatnonzero(cells[:, 2] == k)
+        if len(rows) == 0:
+            continue
+        shifts = np.array(cell_vertices, dtype=np.int64)
+        vertices = cells[rows][:, None, :] + shifts
+        vertices[:, :, 2] = shifts[:, 2]
+        positions = offsets[rows][:, None] + np.arange(len(shifts))
+        vertex_ids[positions.reshape(-1)] = pack_indices(
+            vertices.reshape(-1, 3), ELEMENT_K_BITS)
+
+    unique_ids, face_indices = np.unique(vertex_ids, return_inverse=True)
+    vertices = unpack_indices(unique_ids, ELEMENT_K_BITS)
+    u, v = grid._unit_vectors
+    vertex_offsets = np.array(grid._vertices_offsets)[vertices[:, 2]]
+    coords = np.round(np.stack((
+        vertices[:, 0] * u[0] + vertices[:, 1] * v[0],
+        vertices[:, 0] * u[1] + vertices[:, 1] * v[1]), axis=1) +
+        vertex_offsets, 5)
+    return coords, offsets, face_indices.astype(np.int64).reshape(-1), ids
@@ -0,0 +1,140 @@
+"""
+Parallel generation of the grid across lattice-aligned tiles.
+
+Only the grid's configuration (class, notation, edge size and rotation) is
+sent to the worker processes. Each worker rebuilds the grid once and keeps it
+(together with its 'TileBuilder') for the following tasks.
+
+The pools are kept for the following calls and shut down at exit (or by
+'shutdown_workers'); a pool broken by a dead worker is replaced.
+"""
+import atexit
+from threading import Lock
+from typing import Tuple, List, Dict, Any, Callable, Literal, Type, \
+    TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.tiles import TileBuilder, TileId, AreaRange, Output, \
+    group_tiles, concatenate
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+# vertex configurations of the grids (see 'constants')
+Notation = Literal['3.3.3.3.3.3', '4.4.4.4', '6.6.6', '3.3.3.3.6',
+                   '3.3.3.4.4', '3.3.4.3.4', '3.4.6.4', '3.6.3.6', '3.12.12',
+                   '4.6.12', '4.8.8']
+
+GridConfig = Tuple[Notation, int, float]
+
+# tasks per worker, more of them balance the load between the workers better
+TASKS_PER_WORKER = 4
+
+# {workers: executor} shared by all grids of this process
+_executors: Dict[int, 'ProcessPoolExecutor'] = {}
+# guards '_executors' (concurrent calls must not create two pools)
+_executors_lock = Lock()
+
+# {(grid class, config): builder} of the worker process
+_worker_builders: Dict[Tuple[Type['SemiregularGrid'], GridConfig],
+                       TileBuilder] = {}
+
+
+def _get_executor(workers: int) -> 'ProcessPoolExecutor':
+    """Return the process pool with the given number of 'workers'."""
+    with _executors_lock:
+        executor = _executors.get(workers)
+        if executor is None:
+            # multiprocessing is imported only when the pool is needed
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=workers)
+            _executors[workers] = executor
+        return executor
+
+
+def shutdown_workers() -> None:
+    """Shut down the process pools of this process."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+
+atexit.register(shutdown_workers)
+
+
+def run_tasks(workers: int, function: Callable[..., Any],
+              tasks: List[Tuple[Any, ...]]) -> List[Any]:
+    """
+    Results of 'function(*task)' of the 'tasks' run by the pool of 'workers'
+    processes. If the pool breaks (a worker dies), it is replaced and the
+    tasks are run once more.
+    """
+    from concurrent.futures.process import BrokenProcessPool
+    for attempt in range(2):
+        executor = _get_executor(workers)
+        try:
+            futures = [executor.submit(function, *task) for task in tasks]
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            with _executors_lock:
+                if _executors.get(workers) is executor:
+                    del _executors[workers]
+            executor.shutdown(wait=False)
+            if attempt:
+                raise
+    return []
+
+
+def _worker_builder(grid_class: Type['SemiregularGrid'],
+                    config: GridConfig) -> TileBuilder:
+    """Return the tile builder of the grid of the given configuration."""
+    builder = _worker_builders.get((grid_class, config))
+    if builder is None:
+        builder = TileBuilder(grid_class(*config))
+        _worker_builders[(grid_class, config)] = builder
+    return builder
+
+
+def worker_grid(grid_class: Type['SemiregularGrid'],
+                config: GridConfig) -> 'SemiregularGrid':
+    """
+    Return the grid of the given configuration kept by the worker process
+    (for the tasks of 'run_tasks').
+    """
+    return _worker_builder(grid_class, config).grid
+
+
+def _generate_tiles(grid_class: Type['SemiregularGrid'], config: GridConfig,
+                    tile_ids: List[TileId], area_range: AreaRange,
+                    output: Output) -> Tuple[np.ndarray, ...]:
+    """
+    Generate the 'output' of the given tiles within the 'area_range'
+    (runs in the worker process).
+    """
+    builder = _worker_builder(grid_class, config)
+    return concatenate([builder.build(tile_id).select(area_range, output)
+                        for tile_id in tile_ids], output)
+
+
+def generate_parallel(grid: 'SemiregularGrid', area_range: AreaRange,
+                      output: Output, workers: int) -> Tuple[Any, ...]:
+    """
+    Generate the 'output' (centres, polygons or edges) of the 'grid' within
+    the 'area_range' by 'workers' processes and return the concatenated
+    arrays:
+        * centres - (cell ids, centres)
+        * polygons - (cell ids, polygon offsets, polygon vertices)
+        * edges - (edges, )
+    """
+    tile_ids = grid._get_tile_builder().tiles_for_range(area_range)
+    groups = group_tiles(tile_ids, workers * TASKS_PER_WORKER)
+
+    return concatenate(run_tasks(
+        workers, _generate_tiles, [(type(grid), grid.config, group,
+                                    area_range, output)
+                                   for group in groups]), output)
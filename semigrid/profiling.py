@@ -0,0 +1,177 @@
+"""
+Opt-in profiling of the search of the grid.
+
+Profiling replaces the probed methods of one grid (and of its tile builder)
+by counting and timing wrappers (instance attributes that shadow the methods
+of the class) and disabling it removes them again - a grid that is not
+profiled runs exactly the same code as before, so the probes cost nothing
+when disabled.
+
+The timings are inclusive (e.g. the time of the searches includes the time
+of their expansions). Only the calls made in the process of the grid are
+profiled (not those of the parallel generation's workers).
+"""
+import time
+from threading import Lock
+from typing import Tuple, Dict, Callable, Optional, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+    from semigrid.tiles import TileBuilder
+
+
+# probe name: probed method of the grid
+PROBES = {
+    'searches': '_search_area',
+    'expansions': '_search_adjacents',
+    'visibility_tests': '_is_polygon_visible',
+    'point_locations': 'coords_to_index',
+    'array_point_locations': '_coords_to_indices',
+    'polygon_coords': '_polygon_coords',
+    'tile_cache_lookups': '_cached_tile',
+}
+
+# probe name: probed method of the grid's tile builder (the tile cache, the
+# parallel generation and the vectorised queries)
+BUILDER_PROBES = {
+    'tile_builds': 'build',
+    'tile_plans': 'tiles_for_range',
+    'tile_queries': 'cells_in_range',
+}
+
+# called after every probed call with the probe name and its duration
+ProfileCallback = Callable[[str, float], None]
+
+
+class ProfileStats:
+    """
+    Statistics of the profiled grid - number of calls and their total time
+    (in seconds) per probe, and hits and misses of the cache of the polygons'
+    vertices and of the tile cache.
+    """
+    def __init__(self, calls: Dict[str, int], seconds: Dict[str, float],
+                 polygon_cache_hits: int, polygon_cache_misses: int,
+                 tile_cache_hits: int = 0, tile_cache_misses: int = 0) \
+            -> None:
+        self.calls = calls
+        self.seconds = seconds
+        self.polygon_cache_hits = polygon_cache_hits
+        self.polygon_cache_misses = polygon_cache_misses
+        self.tile_cache_hits = tile_cache_hits
+        self.tile_cache_misses = tile_cache_misses
+
+    @property
+    def polygon_cache_hit_rate(self) -> float:
+        requests = self.polygon_cache_hits + self.polygon_cache_misses
+        return self.polygon_cache_hits / requests if requests else 0.0
+
+    @property
+    def tile_cache_hit_rate(self) -> float:
+        requests = self.tile_cache_hits + self.tile_cache_misses
+        return self.tile_cache_hits / requests if requests else 0.0
+
+    def __repr__(self) -> str:
+        probes = ', '.join(f"{probe}={self.calls[probe]} \
+({self.seconds[probe]:.6f} s)" for probe in self.calls)
+        return f"ProfileStats({probes}, \
+polygon_cache_hits={self.polygon_cache_hits}, \
+polygon_cache_misses={self.polygon_cache_misses}, \
+tile_cache_hits={self.tile_cache_hits}, \
+tile_cache_misses={self.tile_cache_misses})"
+
+
+class Profiler:
+    """
+    Counters and timings of the probed calls of one grid (updated under a
+    lock, the grid may be used by many threads).
+    """
+    def __init__(self, callback: Optional[ProfileCallback] = None) -> None:
+        self.callback = callback
+        self._lock = Lock()
+        self.reset()
+
+    @property
+    def stats(self) -> ProfileStats:
+        with self._lock:
+            return ProfileStats(dict(self._calls), dict(self._seconds),
+                                self._polygon_cache_hits,
+                                self._polygon_cache_misses,
+                                self._tile_cache_hits,
+                                self._tile_cache_misses)
+
+    def reset(self) -> None:
+        """Set all the counters and timings to zero."""
+        with self._lock:
+            self._calls = {probe: 0 for probe in (*PROBES, *BUILDER_PROBES)}
+            self._seconds = {probe: 0.0
+                             for probe in (*PROBES, *BUILDER_PROBES)}
+            self._polygon_cache_hits = 0
+            self._polygon_cache_misses = 0
+            self._tile_cache_hits = 0
+            self._tile_cache_misses = 0
+
+    def _count_cache(self, grid: 'SemiregularGrid', probe: str,
+                     args: Tuple[Any, ...]) -> None:
+        """Count the hit or miss of the cache the probed call looks into."""
+        if probe == 'polygon_coords':
+            # the polygon is cached by its (n, rotation)
+            hit = (args[1], args[2]) in grid._polygons_coords
+            with self._lock:
+                if hit:
+                    self._polygon_cache_hits += 1
+                else:
+                    self._polygon_cache_misses += 1
+        elif probe == 'tile_cache_lookups':
+            # the tile is cached by the grid's config and its id
+            hit = grid._tile_cache is not None and \
+                (*grid.config, args[1]) in grid._tile_cache
+            with self._lock:
+                if hit:
+                    self._tile_cache_hits += 1
+                else:
+                    self._tile_cache_misses += 1
+
+    def _probe(self, grid: 'SemiregularGrid', target: Any, method_name: str,
+               probe: str) -> Callable[..., Any]:
+        """Counting and timing wrapper of the probed method of the target."""
+        method = getattr(type(target), method_name).__get__(target)
+        cached = probe in ('polygon_coords', 'tile_cache_lookups')
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if cached:
+                self._count_cache(grid, probe, args)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self._calls[probe] += 1
+                    self._seconds[probe] += elapsed
+                if self.callback is not None:
+                    self.callback(probe, elapsed)
+
+        return wrapper
+
+    def attach(self, grid: 'SemiregularGrid') -> None:
+        """
+        Replace the probed methods of the grid and of its tile builder by
+        the wrappers.
+        """
+        for probe, method_name in PROBES.items():
+            setattr(grid, method_name,
+                    self._probe(grid, grid, method_name, probe))
+        builder = grid._get_tile_builder()
+        for probe, method_name in BUILDER_PROBES.items():
+            setattr(builder, method_name,
+                    self._probe(grid, builder, method_name, probe))
+
+    @staticmethod
+    def detach(grid: 'SemiregularGrid') -> None:
+        """Restore the probed methods of the grid and of its tile builder."""
+        for method_name in PROBES.values():
+            grid.__dict__.pop(method_name, None)
+        builder: Optional['TileBuilder'] = grid._tile_builder
+        if builder is not None:
+            for method_name in BUILDER_PROBES.values():
+                builder.__dict__.pop(method_name, None)
@@ -0,0 +1,181 @@
+"""
+Multi-resolution pyramid of the values of a grid.
+
+The level L aggregates the values of the cells (i, j, k) by the blocks
+(i >> L, j >> L): the level 0 blocks are the unit blocks and every next
+level merges 2 x 2 blocks of the previous one. Zoomed-out rendering and
+region statistics therefore cost O(blocks) instead of O(cells).
+"""
+from typing import Tuple, List, Dict, Mapping, Optional, Literal, Union, \
+    TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.tiles import AreaRange
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+Layer = Literal['rgba', 'num']
+BlockId = Tuple[int, int]
+# num - (count, sum, min, max); rgba - (count, sums of red, green, blue,
+# alpha)
+BlockStats = Tuple[float, ...]
+Value = Union[float, Tuple[float, float, float, float]]
+
+DEFAULT_LEVELS = 8
+
+
+class ValuePyramid:
+    """
+    Aggregated values of one layer ('rgba' or 'num') of the grid per block
+    of each level:
+    * num - (count, sum, min, max)
+    * rgba - (count, sum of red, sum of green, sum of blue, sum of alpha),
+        the mean colour is the sums divided by the count
+    The grid keeps the pyramid up to date on every write; a write updates
+    one block of each level.
+    """
+    def __init__(self, grid: 'SemiregularGrid', layer: Layer,
+                 levels: int = DEFAULT_LEVELS) -> None:
+        if layer not in ('rgba', 'num'):
+            raise Exception("Layer must be 'rgba' or 'num'.")
+        if levels < 1:
+            raise Exception("Pyramid must have at least one level.")
+        self._grid = grid
+        self._layer = layer
+        self._blocks: List[Dict[BlockId, BlockStats]] = [
+            {} for _ in range(levels)]
+
+    @property
+    def layer(self) -> Layer:
+        return self._layer
+
+    @property
+    def levels(self) -> int:
+        return len(self._blocks)
+
+    def _cell_stats(self, value: Value) -> BlockStats:
+        """Statistics of a single value."""
+        if isinstance(value, tuple):
+            return (1, *value)
+        return 1, value, value, value
+
+    def _merge(self, stats: List[Optional[BlockStats]]) \
+            -> Optional[BlockStats]:
+        """Merge the statistics of several blocks (or cells)."""
+        present = [s for s in stats if s is not None]
+        if not present:
+            return None
+        if self._layer == 'num':
+            return sum(s[0] for s in present), sum(s[1] for s in present), \
+                min(s[2] for s in present), max(s[3] for s in present)
+        return tuple(sum(s[n] for s in present) for n in range(5))
+
+    def _set(self, level: int, block: BlockId,
+             stats: Optional[BlockStats]) -> None:
+        if stats is None:
+            self._blocks[level].pop(block, None)
+        else:
+            self._blocks[level][block] = stats
+
+    def rebuild(self, values: Mapping[Tuple[int, int, int], Value]) -> None:
+        """Aggregate all the 'values' of the layer again."""
+        cells: Dict[BlockId, List[Optional[BlockStats]]] = {}
+        for (i, j, _), value in values.items():
+            cells.setdefault((i, j), []).append(self._cell_stats(value))
+
+        self._blocks[0] = {block: stats for block, stats in (
+            (block, self._merge(cell_stats))
+            for block, cell_stats in cells.items()) if stats is not None}
+        for level in range(1, self.levels):
+            children: Dict[BlockId, List[Optional[BlockStats]]] = {}
+            for (i, j), stats in self._blocks[level - 1].items():
+                children.setdefault((i >> 1, j >> 1), []).append(stats)
+            self._blocks[level] = {
+                block: stats for block, stats in (
+                    (block, self._merge(child_stats))
+                    for block, child_stats in children.items())
+                if stats is not None}
+
+    def update(self, index: Tuple[int, int, int],
+               values: Mapping[Tuple[int, int, int], Value]) -> None:
+        """
+        Update the blocks containing the cell with the 'index' after its
+        value in 'values' has changed.
+        """
+        i, j, _ = index
+        cells = (values.get((i, j, k))
+                 for k in range(self._grid.total_cell_types))
+        self._set(0, (i, j), self._merge(
+            [None if value is None else self._cell_stats(value)
+             for value in cells]))
+
+        for level in range(1, self.levels):
+            i, j = i >> 1, j >> 1
+            self._set(level, (i, j), self._merge(
+                [self._blocks[level - 1].get((2 * i + di, 2 * j + dj))
+                 for di in (0, 1) for dj in (0, 1)]))
+
+    def block_stats(self, level: int, block: BlockId) \
+            -> Optional[BlockStats]:
+        """Statistics of the 'block' of the 'level' (None if it is empty)."""
+        return self._blocks[level].get(block)
+
+    def _block_bounds(self, area_range: AreaRange, level: int) \
+            -> Tuple[int, int, int, int]:
+        """Bounds (min_i, max_i, min_j, max_j) of the blocks of the level."""
+        min_i, max_i, min_j, max_j = \
+            self._grid._get_tile_builder()._ij_bounds(area_range)
+        return min_i >> level, max_i >> level, min_j >> level, max_j >> level
+
+    def level_for(self, area_range: AreaRange, max_blocks: int) -> int:
+        """
+        The finest level whose blocks covering the 'area_range' are at most
+        'max_blocks' (the coarsest level if there is no such level).
+        """
+        for level in range(self.levels):
+            min_i, max_i, min_j, max_j = self._block_bounds(area_range, level)
+            if (max_i - min_i + 1) * (max_j - min_j + 1) <= max_blocks:
+                return level
+        return self.levels - 1
+
+    def blocks_in_range(self, area_range: AreaRange, level: int) \
+            -> List[Tuple[BlockId, BlockStats]]:
+        """Non-empty blocks of the 'level' that may overlap the range."""
+        blocks = self._blocks[level]
+        min_i, max_i, min_j, max_j = self._block_bounds(area_range, level)
+        if (max_i - min_i + 1) * (max_j - min_j + 1) > len(blocks):
+            return [(block, stats) for block, stats in blocks.items()
+                    if min_i <= block[0] <= max_i and
+                    min_j <= block[1] <= max_j]
+
+        return [((i, j), blocks[(i, j)])
+                for j in range(min_j, max_j + 1)
+                for i in range(min_i, max_i + 1) if (i, j) in blocks]
+
+    def region_stats(self, area_range: AreaRange, level: int) \
+            -> Optional[BlockStats]:
+        """
+        Statistics of the values within the blocks of the 'level' that may
+        overlap the range (the coarser the level, the larger the margin).
+        """
+        return self._merge([stats for _, stats in
+                            self.blocks_in_range(area_range, level)])
+
+    def block_centres(self, level: int, blocks: List[BlockId]) -> np.ndarray:
+        """(M, 2) array of the centres of the 'blocks' of the 'level'."""
+        size = 1 << level
+        ij = (np.array(blocks, dtype=np.float64).reshape(-1, 2) + 0.5) * size
+        u, v = self._grid._unit_vectors
+        return np.stack((ij[:, 0] * u[0] + ij[:, 1] * v[0],
+                         ij[:, 0] * u[1] + ij[:, 1] * v[1]), axis=1)
+
+    @staticmethod
+    def mean(stats: BlockStats) -> Value:
+        """Mean value (or colour) of the statistics."""
+        if len(stats) == 4:
+            return stats[1] / stats[0]
+        count, red, green, blue, alpha = stats
+        return red / count, green / count, blue / count, alpha / count
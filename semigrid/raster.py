@@ -0,0 +1,128 @@
+"""
+Rasterisation of the values of a grid.
+
+Every pixel takes the value of the cell containing its centre. The cells of
+the pixels are located at once (see 'SemiregularGrid._coords_to_indices')
+and their values are looked up in the spatial index of the layer, so the
+cost depends on the number of pixels, not on the number of cells or values.
+
+The pixels are first located on a coarser lattice (every step-th row and
+column, the step up to SAMPLING_STEP so that a cell spans a few steps); the
+cells are convex, so the pixels between four lattice pixels of the same cell
+belong to it too and only the other pixels are located one by one.
+"""
+from typing import Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.cellid import IJ_BIAS, pack_indices
+from semigrid.pyramid import Layer
+from semigrid.tiles import AreaRange
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+SAMPLING_STEP = 8
+
+
+def pixel_centres(area_range: AreaRange, shape: Tuple[int, int]) \
+        -> np.ndarray:
+    """
+    (H * W, 2) array of the centres of the pixels of the 'area_range'
+    divided into 'shape' (height, width) pixels, row by row from the bottom.
+    """
+    (min_x, min_y), (max_x, max_y) = area_range
+    height, width = shape
+    x = min_x + (np.arange(width) + 0.5) * (max_x - min_x) / width
+    y = min_y + (np.arange(height) + 0.5) * (max_y - min_y) / height
+    return np.stack((np.tile(x, height), np.repeat(y, width)), axis=1)
+
+
+def _locate(grid: 'SemiregularGrid', points: np.ndarray) -> np.ndarray:
+    """Ids of the cells containing the 'points', -1 where none was located."""
+    indices = grid._coords_to_indices(points)
+    ij = indices[:, :2]
+    located = (indices[:, 2] >= 0) & \
+        np.all((-IJ_BIAS <= ij) & (ij < IJ_BIAS), axis=1)
+    ids = np.full(len(indices), -1, dtype=np.int64)
+    ids[located] = pack_indices(indices[located])
+    return ids
+
+
+def pixel_ids(grid: 'SemiregularGrid', area_range: AreaRange,
+              shape: Tuple[int, int]) -> np.ndarray:
+    """
+    (H, W) array of the ids of the cells containing the centres of the
+    pixels (see 'pixel_centres'), -1 where no cell was located.
+    """
+    height, width = shape
+    (min_x, min_y), (max_x, max_y) = area_range
+    cell_pixels = abs(grid._determinant) / len(grid._rdgnt_names) * \
+        height * width / ((max_x - min_x) * (max_y - min_y))
+    step = SAMPLING_STEP
+    while step > 1 and 4 * step ** 2 > cell_pixels:
+        step //= 2
+    rows = np.unique(np.append(np.arange(0, height, step), height - 1))
+    columns = np.unique(np.append(np.arange(0, width, step), width - 1))
+    if step == 1 or len(rows) < 2 or len(columns) < 2:
+        # cells of a few pixels
+        return _locate(grid, pixel_centres(area_range, shape)).reshape(shape)
+
+    x = min_x + (np.arange(width) + 0.5) * (max_x - min_x) / width
+    y = min_y + (np.arange(height) + 0.5) * (max_y - min_y) / height
+    lattice = _locate(grid, np.stack((
+        np.tile(x[columns], len(rows)), np.repeat(y[rows], len(columns))),
+        axis=1)).reshape(len(rows), len(columns))
+    # the parts between four lattice pixels of the same cell
+    uniform = (lattice[:-1, :-1] == lattice[1:, :-1]) & \
+        (lattice[:-1, :-1] == lattice[:-1, 1:]) & \
+        (lattice[:-1, :-1] == lattice[1:, 1:]) & (lattice[:-1, :-1] >= 0)
+
+    part_rows = np.minimum(np.searchsorted(rows, np.arange(height), 'right'),
+                           len(rows) - 1) - 1
+    part_columns = np.minimum(np.searchsorted(columns, np.arange(width),
+                                              'right'), len(columns) - 1) - 1
+    ids: np.ndarray = lattice[:-1, :-1][np.ix_(part_rows, part_columns)]
+    rest_rows, rest_columns = np.nonzero(
+        ~uniform[np.ix_(part_rows, part_columns)])
+    ids[rest_rows, rest_columns] = _locate(grid, np.stack((
+        x[rest_columns], y[rest_rows]), axis=1))
+    return ids
+
+
+def _value_runs(grid: 'SemiregularGrid', area_range: AreaRange,
+                shape: Tuple[int, int], layer: Layer) \
+        -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Values of the runs of the pixels (row by row) of the same cell (see
+    'rasterise') and the lengths of the runs - the values are looked up
+    once per run.
+    """
+    ids = pixel_ids(grid, area_range, shape).reshape(-1)
+    starts = np.flatnonzero(np.append(True, ids[1:] != ids[:-1]))
+    run_ids = ids[starts]
+    with grid._values_lock:
+        found, values = grid._value_index(layer).lookup(run_ids)
+    found &= run_ids >= 0
+
+    runs: np.ndarray
+    if layer == 'rgba':
+        runs = np.zeros((len(run_ids), 4))
+    else:
+        runs = np.full(len(run_ids), np.nan)
+    runs[found] = values[found]
+    return runs, np.diff(np.append(starts, len(ids)))
+
+
+def rasterise(grid: 'SemiregularGrid', area_range: AreaRange,
+              shape: Tuple[int, int], layer: Layer = 'rgba') -> np.ndarray:
+    """
+    Image of the values of the 'layer' within the 'area_range' divided into
+    'shape' (height, width) pixels, rows from the bottom:
+    * rgba - (H, W, 4) array of colours, transparent where there is no value
+    * num - (H, W) array of numerical values, NaN where there is no value
+    """
+    runs, lengths = _value_runs(grid, area_range, shape, layer)
+    image = np.repeat(runs, lengths, axis=0)
+    return image.reshape(*shape, *image.shape[1:])
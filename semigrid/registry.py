@@ -0,0 +1,284 @@
+"""
+Registry of the topology of the grids.
+
+Everything that does not depend on the size of edges and the grid rotation is
+computed once per vertex configuration (in the unit space - edges of size 1,
+no rotation) and shared by all grids of that configuration. The adjacency,
+edges and point location come from the precomputed 'topology_tables'.
+"""
+import math
+from threading import Lock
+from typing import Tuple, Dict, List, Optional
+
+import numpy as np
+
+from semigrid.constants import POSSIBLE_RDGNT, UNIT_VECTORS, \
+    UNIT_BLOCK_CELLS_OFFSET
+from semigrid.dualgraphnode import RotatedDualGraphNodeType
+from semigrid.topology_tables import ADJ_INDICES_SHIFT, EDGE_TEMPLATES, \
+    HALF_PLANES, CELL_VERTICES, CELL_EDGES
+
+# tolerance of the point location (points on the boundary are covered)
+EPSILON = 1e-9
+# the unit block is divided into LOCATION_GRID x LOCATION_GRID parts for
+# the point location of many points at once
+LOCATION_GRID = 64
+
+
+class Topology:
+    """
+    Scale and rotation independent description of a vertex configuration:
+    * rdgnt_names - types of the cells, the 'k' of the index is their order
+    * rdgnt_dic - 'RotatedDualGraphNodeType's of edges of size 1
+    * unit_vectors, cells_offsets - the lattice in the unit space
+    * adj_indices_shift - (i, j) differences and 'k' of the adjacents
+    * edge_templates - vertices (b, a) of the edge shared with each adjacent
+        and whether the edge is owned by the cell
+    * point location - half-planes of the cells near the origin used to find
+        the cell containing a point
+    * cell_vertices, cell_edges - (i, j) differences and types of the
+        vertices and the edges of each cell type
+    * vertex_cells, vertex_edges, edge_cells, edge_vertices - incidence of
+        the vertices and the edges of the unit block at the origin (the
+        cells and the edges of a vertex counterclockwise)
+    """
+    def __init__(self, vertex_configuration: Tuple[int, ...]) -> None:
+        self.rdgnt_names = POSSIBLE_RDGNT[vertex_configuration]
+        # the first vertex of each polygon (and so the vertex and edge
+        # numbering of the tables) is that of edges of size 1 for all grids;
+        # the polygons of the hexagons of '3.3.3.3.6' and '3.6.3.6' used to
+        # start at 0 or 60 degrees depending on the rounding of the grid's
+        # edge size, now they start at 60 degrees (the same vertices)
+        self.rdgnt_dic = {
+            rdgnt_name: RotatedDualGraphNodeType(
+                rdgnt_name[0], rdgnt_name[1:-1], 1, 0, rdgnt_name[-1])
+            for rdgnt_name in self.rdgnt_names}
+        self.unit_vectors = UNIT_VECTORS[vertex_configuration]
+        offsets = UNIT_BLOCK_CELLS_OFFSET[vertex_configuration]
+        self.cells_offsets = [offsets[rdgnt_name]
+                              for rdgnt_name in self.rdgnt_names]
+
+        u, v = self.unit_vectors
+        self._determinant = u[0] * v[1] - v[0] * u[1]
+        self._half_planes = HALF_PLANES[vertex_configuration]
+        self._location_table: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.adj_indices_shift = ADJ_INDICES_SHIFT[vertex_configuration]
+        self.edge_templates = EDGE_TEMPLATES[vertex_configuration]
+
+        self.cell_vertices = [CELL_VERTICES[vertex_configuration][rdgnt_name]
+                              for rdgnt_name in self.rdgnt_names]
+        self.cell_edges = [CELL_EDGES[vertex_configuration][rdgnt_name]
+                           for rdgnt_name in self.rdgnt_names]
+        self._calculate_incidence()
+
+    def polygon_template(self, k: int) -> List[Tuple[float, float]]:
+        """Vertices of the polygon of the k-th type centred at the origin."""
+        rdgnt = self.rdgnt_dic[self.rdgnt_names[k]]
+        polygon = rdgnt.polygon
+        initial_rotation = math.radians(rdgnt.polygon_rotation)
+        return [(polygon.r * math.cos(alpha), polygon.r * math.sin(alpha))
+                for alpha in (polygon.central_angle * i + initial_rotation
+                              for i in range(polygon.n))]
+
+    def _calculate_incidence(self) -> None:
+        """
+        Positions of the vertices of the unit block at the origin and the
+        incidence of its vertices and edges.
+        """
+        vertices = 1 + max(v for cell in self.cell_vertices
+                           for _, _, v in cell)
+        edges = 1 + max(e for cell in self.cell_edges for _, _, e in cell)
+        self.vertex_offsets: List[Tuple[float, float]] = [(0.0, 0.0)] * \
+            vertices
+        self.vertex_cells: List[List[Tuple[int, int, int]]] = [
+            [] for _ in range(vertices)]
+        self.edge_cells: List[List[Tuple[int, int, int]]] = [
+            [] for _ in range(edges)]
+        for k, (cell_vertices, cell_edges) in enumerate(zip(
+                self.cell_vertices, self.cell_edges)):
+            template = self.polygon_template(k)
+            for (vi, vj, v), (ei, ej, e), (x, y) in zip(
+                    cell_vertices, cell_edges, template):
+                cx, cy = self.index_to_coords((-vi, -vj, k))
+                self.vertex_offsets[v] = cx + x, cy + y
+                self.vertex_cells[v].append((-vi, -vj, k))
+                self.edge_cells[e].append((-ei, -ej, k))
+
+        self.edge_vertices: List[Tuple[Tuple[int, int, int], ...]] = []
+        self.vertex_edges: List[List[Tuple[int, int, int]]] = [
+            [] for _ in range(vertices)]
+        for e, cells in enumerate(self.edge_cells):
+            cells.sort()
+            ci, cj, k = cells[0]
+            m = self.cell_edges[k].index((-ci, -cj, e))
+            n = len(self.cell_vertices[k])
+            ends = tuple((ci + vi, cj + vj, v) for vi, vj, v in (
+                self.cell_vertices[k][m], self.cell_vertices[k][(m + 1) % n]))
+            self.edge_vertices.append(ends)
+            for vi, vj, v in ends:
+                self.vertex_edges[v].append((-vi, -vj, e))
+
+        # counterclockwise around the vertex
+        for v, (x, y) in enumerate(self.vertex_offsets):
+            self.vertex_cells[v].sort(key=lambda index: math.atan2(
+                self.index_to_coords(index)[1] - y,
+                self.index_to_coords(index)[0] - x) % (2 * math.pi))
+            self.vertex_edges[v].sort(key=lambda index: math.atan2(
+                self.edge_midpoint(index)[1] - y,
+                self.edge_midpoint(index)[0] - x) % (2 * math.pi))
+
+    def vertex_to_coords(self, vertex: Tuple[int, int, int]) \
+            -> Tuple[float, float]:
+        """Position of the 'vertex' (i, j, v) in the unit space."""
+        i, j, v = vertex
+        u, w = self.unit_vectors
+        x_offset, y_offset = self.vertex_offsets[v]
+        return i * u[0] + j * w[0] + x_offset, i * u[1] + j * w[1] + y_offset
+
+    def edge_midpoint(self, edge: Tuple[int, int, int]) \
+            -> Tuple[float, float]:
+        """Midpoint of the 'edge' (i, j, e) in the unit space."""
+        i, j, e = edge
+        (x1, y1), (x2, y2) = [self.vertex_to_coords((i + vi, j + vj, v))
+                              for vi, vj, v in self.edge_vertices[e]]
+        return (x1 + x2) / 2, (y1 + y2) / 2
+
+    def index_to_coords(self, index: Tuple[int, int, int]) \
+            -> Tuple[float, float]:
+        """Centre of the cell with the given 'index' in the unit space."""
+        i, j, k = index
+        u, v = self.unit_vectors
+        x_offset, y_offset = self.cells_offsets[k]
+        return i * u[0] + j * v[0] + x_offset, i * u[1] + j * v[1] + y_offset
+
+    def locate_near_origin(self, xy: Tuple[float, float]) \
+            -> Optional[Tuple[int, int, int]]:
+        """
+        Index of the cell containing the point 'xy' (of the unit space) that
+        lies within the unit block at the origin.
+        """
+        x, y = xy
+        for ijk, half_planes in self._half_planes:
+            if all(a * x + b * y <= c + EPSILON for a, b, c in half_planes):
+                return ijk
+        return None
+
+    def _block_parts(self, x: np.ndarray, y: np.ndarray) \
+            -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parts (of the LOCATION_GRID x LOCATION_GRID parts of the unit block
+        at the origin) of the points (x, y) of the block.
+        """
+        u, v = self.unit_vectors
+        parts = []
+        for fraction in ((x * v[1] - y * v[0]) / self._determinant,
+                         (u[0] * y - x * u[1]) / self._determinant):
+            parts.append(np.clip(np.floor(fraction * LOCATION_GRID),
+                                 0, LOCATION_GRID - 1).astype(np.int64))
+        return parts[0], parts[1]
+
+    def _get_location_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        For each part of the unit block at the origin, the position (within
+        the half-planes) of the polygon covering the whole part with a margin
+        (so no other polygon covers any of its points), -1 if there is none;
+        and for each polygon, the parts it may intersect.
+        """
+        if self._location_table is not None:
+            return self._location_table
+
+        u, v = self.unit_vectors
+        fractions = np.arange(LOCATION_GRID + 1) / LOCATION_GRID
+        fi, fj = np.meshgrid(fractions, fractions, indexing='ij')
+        x, y = fi * u[0] + fj * v[0], fi * u[1] + fj * v[1]
+
+        table = np.full((LOCATION_GRID, LOCATION_GRID), -1, dtype=np.int64)
+        candidates = np.ones((len(self._half_planes), LOCATION_GRID,
+                              LOCATION_GRID), dtype=bool)
+        for position, (_, half_planes) in enumerate(self._half_planes):
+            corners = np.ones(x.shape, dtype=bool)
+            for a, b, c in half_planes:
+                corners &= a * x + b * y <= c - 2 * EPSILON
+                # a part with all the corners outside one of the half-planes
+                # is not intersected
+                outside = a * x + b * y > c + 2 * EPSILON
+                candidates[position] &= ~(
+                    outside[:-1, :-1] & outside[1:, :-1] &
+                    outside[:-1, 1:] & outside[1:, 1:])
+            # the polygons are convex, so covering the corners of the part
+            # means covering the whole part
+            covered = corners[:-1, :-1] & corners[1:, :-1] & \
+                corners[:-1, 1:] & corners[1:, 1:]
+            table[covered] = position
+        self._location_table = table, candidates
+        return self._location_table
+
+    def locate_near_origin_array(self, xy: np.ndarray) -> np.ndarray:
+        """
+        (N, 3) array of the indices of the cells containing the (N, 2)
+        points 'xy' (of the unit space) that lie within the unit block at
+        the origin; the rows of the points not located are (0, 0, -1).
+        The points in the parts of the block covered by a single polygon are
+        located by a table, the rest by the half-planes of the polygons that
+        may intersect their parts.
+        """
+        x, y = xy[:, 0], xy[:, 1]
+        indices = np.zeros((len(xy), 3), dtype=np.int64)
+        indices[:, 2] = -1
+
+        table, candidates = self._get_location_table()
+        parts = self._block_parts(x, y)
+        positions = table[parts]
+        covered = positions >= 0
+        indices[covered] = np.array(
+            [ijk for ijk, _ in self._half_planes],
+            dtype=np.int64).reshape(-1, 3)[positions[covered]]
+
+        rows = np.flatnonzero(~covered)
+        parts = parts[0][rows], parts[1][rows]
+        for position, (ijk, half_planes) in enumerate(self._half_planes):
+            tested = np.flatnonzero(candidates[position][parts])
+            x_tested, y_tested = x[rows[tested]], y[rows[tested]]
+            inside = np.ones(len(tested), dtype=bool)
+            for a, b, c in half_planes:
+                inside &= a * x_tested + b * y_tested <= c + EPSILON
+            indices[rows[tested[inside]]] = ijk
+            remaining = np.ones(len(rows), dtype=bool)
+            remaining[tested[inside]] = False
+            rows = rows[remaining]
+            parts = parts[0][remaining], parts[1][remaining]
+            if len(rows) == 0:
+                break
+        return indices
+
+    def coords_to_index(self, xy: Tuple[float, float]) \
+            -> Tuple[int, int, int]:
+        """Index of the cell containing the point 'xy' of the unit space."""
+        u, v = self.unit_vectors
+        i = (xy[0] * v[1] - xy[1] * v[0]) / self._determinant
+        j = (u[0] * xy[1] - xy[0] * u[1]) / self._determinant
+        r_i, r_j = math.floor(i), math.floor(j)
+        near_xy = xy[0] - r_i * u[0] - r_j * v[0], \
+            xy[1] - r_i * u[1] - r_j * v[1]
+
+        ijk = self.locate_near_origin(near_xy)
+        if ijk is None:
+            print(f"\n{xy} -> {near_xy}\n")
+            raise Exception("Conversion 'coordinates' to 'index' failed.")
+        return ijk[0] + r_i, ijk[1] + r_j, ijk[2]
+
+
+_topologies: Dict[Tuple[int, ...], Topology] = {}
+_topologies_lock = Lock()
+
+
+def get_topology(vertex_configuration: Tuple[int, ...]) -> Topology:
+    """Return the (shared) topology of the 'vertex_configuration'."""
+    topology = _topologies.get(vertex_configuration)
+    if topology is None:
+        with _topologies_lock:
+            topology = _topologies.get(vertex_configuration)
+            if topology is None:
+                topology = Topology(vertex_configuration)
+                _topologies[vertex_configuration] = topology
+    return topology
@@ -0,0 +1,257 @@
+"""
+Sampling of the values of a grid at arbitrary points.
+
+All the points are located at once (see 'SemiregularGrid._coords_to_indices')
+and the values of their cells (and of the neighbouring cells) are looked up
+in the spatial index of the layer, so the cost depends on the number of the
+points, not on the number of the values. The methods:
+    * nearest - the value of the cell containing the point
+    * idw - inverse distance weighting of the values of the cell containing
+        the point and of its adjacents (weights 1 / distance^IDW_POWER of the
+        point from their centres)
+    * barycentric - linear interpolation within a triangle of the centres of
+        the cells around the vertex nearest to the point (the cells around a
+        vertex form a face of the dual graph, which is split into triangles
+        by a fan from its first cell), continuous across the whole plane
+
+The positions of the neighbours relative to a cell (or a vertex) depend only
+on its type, so they are tabulated once per call and the values of the
+neighbours are looked up once per distinct cell (or vertex), not per point.
+
+The cells without a value are left out of the interpolation (the weights of
+the others are normalised). A point with no value at all gets NaN ('num')
+or a transparent colour ('rgba').
+"""
+from typing import Tuple, List, TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.cellid import ELEMENT_K_BITS, IJ_BIAS, K_BITS, pack_indices, \
+    unpack_indices
+from semigrid.pyramid import Layer
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+METHODS = ('nearest', 'idw', 'barycentric')
+IDW_POWER = 2
+# distances shorter than this fraction of the edge size count as zero
+_MIN_DISTANCE = 1e-9
+
+
+def _lookup(grid: 'SemiregularGrid', layer: Layer, indices: np.ndarray) \
+        -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Answer (for each of the (..., 3) 'indices') whether the cell has a value,
+    and the values (arbitrary rows where there is none).
+    """
+    shape = indices.shape[:-1]
+    indices = indices.reshape(-1, 3)
+    ij = indices[:, :2]
+    located = (indices[:, 2] >= 0) & \
+        np.all((-IJ_BIAS <= ij) & (ij < IJ_BIAS), axis=1)
+    ids = np.full(len(indices), -1, dtype=np.int64)
+    ids[located] = pack_indices(indices[located])
+    found, values = grid._value_index(layer).lookup(ids)
+    return (found & located).reshape(shape), \
+        values.reshape(*shape, *values.shape[1:])
+
+
+def _unique(indices: np.ndarray, k_bits: int) \
+        -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct rows of the (M, 3) 'indices' and the inverse of them."""
+    ids, inverse = np.unique(pack_indices(indices, k_bits),
+                             return_inverse=True)
+    return unpack_indices(ids, k_bits), inverse.reshape(-1)
+
+
+def _block_origins(grid: 'SemiregularGrid', ij: np.ndarray) -> np.ndarray:
+    """(..., 2) origins of the unit blocks of the (..., 2) 'ij'."""
+    u, v = grid._unit_vectors
+    origins: np.ndarray = ij[..., :1] * np.array(u) + \
+        ij[..., 1:2] * np.array(v)
+    return origins
+
+
+def _shift_table(grid: 'SemiregularGrid',
+                 shifts: List[List[Tuple[int, int, int]]],
+                 origins: np.ndarray, offsets: np.ndarray) \
+        -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Table of the neighbours (i, j, type) 'shifts' of every type of cells (or
+    vertices) - their (T, W, 3) shifts, (T, W, 2) positions relative to the
+    cell (whose position within its block is in 'origins') and (T, W) mask
+    of the real neighbours (the rows are padded to the same width W). The
+    positions within the block of the types of the neighbours are in
+    'offsets'.
+    """
+    width = max(len(type_shifts) for type_shifts in shifts)
+    table = np.zeros((len(shifts), width, 3), dtype=np.int64)
+    valid = np.zeros((len(shifts), width), dtype=bool)
+    for t, type_shifts in enumerate(shifts):
+        table[t, :len(type_shifts)] = type_shifts
+        valid[t, :len(type_shifts)] = True
+    positions = _block_origins(grid, table[..., :2]) + \
+        offsets[table[..., 2]] - origins[:, None, :]
+    return table, positions, valid
+
+
+def _neighbours(cells: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """(U, W, 3) indices of the neighbours of the cells (or vertices)."""
+    neighbours = cells[:, None, :2] + table[cells[:, 2], :, :2]
+    return np.concatenate((neighbours, table[cells[:, 2], :, 2:]), axis=2)
+
+
+def _nearest(grid: 'SemiregularGrid', layer: Layer, points: np.ndarray,
+             cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Values of the cells containing the points and where there are some."""
+    found, values = _lookup(grid, layer, cells)
+    return values, found
+
+
+def _idw(grid: 'SemiregularGrid', layer: Layer, points: np.ndarray,
+         cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Inverse distance weighting over the cells and their adjacents."""
+    cell_offsets = grid._get_tile_builder()._offsets
+    table, positions, valid = _shift_table(
+        grid, [[(0, 0, k)] + list(grid.adj_indices_shift[rdgnt_name])
+               for k, rdgnt_name in enumerate(grid._rdgnt_names)],
+        cell_offsets, cell_offsets)
+    unique_cells, inverse = _unique(cells, K_BITS)
+    found, values = _lookup(grid, layer, _neighbours(unique_cells, table))
+
+    k = cells[:, 2]
+    local = points - _block_origins(grid, cells[:, :2]) - cell_offsets[k]
+    numerator = np.zeros((len(points), *values.shape[2:]))
+    denominator = np.zeros(len(points))
+    for n in range(table.shape[1]):
+        weights = np.maximum(
+            np.hypot(*(positions[k, n] - local).T),
+            _MIN_DISTANCE * grid.edge_size) ** -IDW_POWER
+        weights[~(valid[k, n] & found[inverse, n])] = 0.0
+        numerator += (weights * values[inverse, n].T).T
+        denominator += weights
+    return (numerator.T / np.maximum(denominator, 1e-300)).T, \
+        denominator > 0
+
+
+def _barycentric_table(positions: np.ndarray, valid: np.ndarray) \
+        -> np.ndarray:
+    """
+    (V, W - 2, 2, 3) coefficients (c, cx, cy) of the barycentric coordinates
+    beta and gamma (of the corners t + 1 and t + 2) of a point (x, y) within
+    the triangles (0, t + 1, t + 2) of the fans of the faces with the
+    corners at the (V, W, 2) 'positions' (-inf of the missing triangles).
+    """
+    a = positions[:, :1]
+    ab, ac = positions[:, 1:-1] - a, positions[:, 2:] - a
+    determinant = ab[..., 0] * ac[..., 1] - ab[..., 1] * ac[..., 0]
+    determinant[~valid[:, 2:]] = 1.0
+    # beta = (p - a) x ac / determinant, gamma = ab x (p - a) / determinant
+    table: np.ndarray = np.stack((
+        np.stack((a[..., 1] * ac[..., 0] - a[..., 0] * ac[..., 1],
+                  ac[..., 1], -ac[..., 0]), axis=-1),
+        np.stack((a[..., 0] * ab[..., 1] - a[..., 1] * ab[..., 0],
+                  -ab[..., 1], ab[..., 0]), axis=-1)),
+        axis=-2) / determinant[..., None, None]
+    table[~valid[:, 2:]] = (-np.inf, 0.0, 0.0)
+    return table
+
+
+def _barycentric(grid: 'SemiregularGrid', layer: Layer, points: np.ndarray,
+                 cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Linear interpolation within the triangles of the dual graph."""
+    cell_offsets = grid._get_tile_builder()._offsets
+    vertex_offsets = np.array(grid._vertices_offsets)
+    k = cells[:, 2]
+    local = points - _block_origins(grid, cells[:, :2]) - cell_offsets[k]
+
+    # the nearest vertex of the cell (the cell is a regular polygon, so the
+    # point lies within the dual face of that vertex)
+    vertex_table, vertex_positions, vertex_valid = _shift_table(
+        grid, grid._topology.cell_vertices, cell_offsets, vertex_offsets)
+    vertex_positions[~vertex_valid] = np.inf
+    nearest = np.full(len(points), np.inf)
+    m = np.zeros(len(points), dtype=np.int64)
+    for n in range(vertex_table.shape[1]):
+        distances = np.hypot(vertex_positions[:, n, 0][k] - local[:, 0],
+                             vertex_positions[:, n, 1][k] - local[:, 1])
+        closer = distances < nearest
+        nearest[closer] = distances[closer]
+        m[closer] = n
+    vertices = np.concatenate((cells[:, :2] + vertex_table[k, m, :2],
+                               vertex_table[k, m, 2:]), axis=1)
+    x, y = (local - vertex_positions[k, m]).T
+
+    face_table, face_positions, face_valid = _shift_table(
+        grid, grid._topology.vertex_cells, vertex_offsets, cell_offsets)
+    unique_vertices, inverse = _unique(vertices, ELEMENT_K_BITS)
+    found, values = _lookup(grid, layer,
+                            _neighbours(unique_vertices, face_table))
+
+    # barycentric coordinates within each triangle (0, t + 1, t + 2) of the
+    # fan - affine functions of the position (x, y) of the point relative to
+    # the vertex; the triangle containing the point is the one the point is
+    # the least outside of (at the rounding errors)
+    triangles = _barycentric_table(face_positions, face_valid)
+    v = vertices[:, 2]
+    best = np.full(len(points), -np.inf)
+    t_best = np.zeros(len(points), dtype=np.int64)
+    for t in range(triangles.shape[1]):
+        beta, gamma = (triangles[:, t, n, 0][v] +
+                       triangles[:, t, n, 1][v] * x +
+                       triangles[:, t, n, 2][v] * y for n in (0, 1))
+        inside = np.minimum(1 - beta - gamma, np.minimum(beta, gamma))
+        better = inside > best
+        best[better] = inside[better]
+        t_best[better] = t
+    beta, gamma = (triangles[v, t_best, n, 0] +
+                   triangles[v, t_best, n, 1] * x +
+                   triangles[v, t_best, n, 2] * y for n in (0, 1))
+    coordinates = np.stack((1 - beta - gamma, beta, gamma), axis=1)
+    corners = np.stack((np.zeros_like(t_best), t_best + 1, t_best + 2),
+                       axis=1)
+
+    coordinates = np.clip(coordinates, 0.0, None)
+    numerator = np.zeros((len(points), *values.shape[2:]))
+    denominator = np.zeros(len(points))
+    for n in range(3):
+        weights = np.where(found[inverse, corners[:, n]],
+                           coordinates[:, n], 0.0)
+        numerator += (weights * values[inverse, corners[:, n]].T).T
+        denominator += weights
+    return (numerator.T / np.maximum(denominator, 1e-300)).T, \
+        denominator > 0
+
+
+_METHODS = {'nearest': _nearest, 'idw': _idw, 'barycentric': _barycentric}
+
+
+def sample(grid: 'SemiregularGrid', points: np.ndarray, layer: Layer = 'num',
+           method: str = 'nearest') -> np.ndarray:
+    """
+    Values of the 'layer' at the (N, 2) 'points' by the 'method' (see
+    METHODS) - (N,) array of numerical values (NaN where there is none) or
+    (N, 4) array of colours (transparent where there is none).
+    """
+    if layer not in ('rgba', 'num'):
+        raise Exception("Layer must be 'rgba' or 'num'.")
+    if method not in METHODS:
+        raise Exception(f"Method must be one of {', '.join(METHODS)}.")
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    result = np.zeros((len(points), 4)) if layer == 'rgba' else \
+        np.full(len(points), np.nan)
+
+    cells = grid._coords_to_indices(points)
+    ij = cells[:, :2]
+    # the neighbours of the located cells must be packable too
+    located = (cells[:, 2] >= 0) & \
+        np.all((2 - IJ_BIAS <= ij) & (ij < IJ_BIAS - 2), axis=1)
+    if not np.any(located):
+        return result
+    values, sampled = _METHODS[method](grid, layer, points[located],
+                                       cells[located])
+    rows = np.flatnonzero(located)[sampled]
+    result[rows] = values[sampled]
+    return result
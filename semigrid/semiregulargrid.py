@@ -1,14 +1,31 @@
 import math
-from typing import Tuple, Dict, List, Optional, Literal, Callable, Union, \
-    Any, Set
-from shapely.geometry import Point as ShapelyPoint, Polygon as ShapelyPolygon
+from collections import deque
+from threading import RLock
+from typing import Tuple, Dict, List, Optional, Callable, Union, Any, \
+    Set, Deque, Mapping, MutableMapping, Sequence
 import numpy as np
 
 from semigrid.semiregulargrid_interface import SemiregularGridInterface
 from semigrid.gridpolygon import GridPolygon
 from semigrid.dualgraphnode import DualGraphNode, RotatedDualGraphNodeType
-from semigrid.constants import POSSIBLE_RDGNT, \
-    UNIT_VECTORS, UNIT_BLOCK_CELLS_OFFSET
+from semigrid.registry import get_topology
+from semigrid.cellid import pack_indices, unpack_indices
+from semigrid.tiles import Tile, TileBuilder, TileId, Output, \
+    concatenate, split_polygons, to_edge_list, to_point_list
+from semigrid.generation import Generation, GeneratedCells
+from semigrid.graph import dual_graph_csr, to_sparse_matrix
+from semigrid.mesh import indexed_mesh
+from semigrid.dissolve import OutlinePolygon, dissolve
+from semigrid.sampling import sample
+from semigrid.zonal import zonal_stats
+from semigrid.tilecache import TileCache
+from semigrid.parallel import GridConfig, Notation, generate_parallel
+from semigrid.pyramid import ValuePyramid, Layer, DEFAULT_LEVELS
+from semigrid.valueindex import ValueIndex
+from semigrid.profiling import Profiler, ProfileStats, ProfileCallback
+from semigrid.changelog import ChangeLog, DEFAULT_MAX_CHANGES
+from semigrid.sharedlayer import SharedLayer, SharedNumValues, \
+    SharedRgbaValues, GridHandle
 
 
 AreaRange = Tuple[Tuple[float, float], Tuple[float, float]]
@@ -19,54 +36,88 @@ class SemiregularGrid(SemiregularGridInterface):
     Representation of (Semi-)Regular Grid with arbitrary 'size of edges'
     and 'grid rotation' (provided in radians).
     Its type is determined by 'vertex configuration'.
+
+    If a 'tile cache' is given, the generated tiles are stored in it and
+    the following generations of overlapping areas are stitched from them.
+
+    Concurrency: the grid's geometry is not changed after its creation and
+    the generation keeps no state on the grid - each call returns its own
+    'Generation' - so one grid can be shared by many threads. Writes of the
+    values (and the reads that iterate over them) are serialised by a lock;
+    the readers get copies of the values.
     """
     def __init__(self,
-                 vertex_configuration: Literal['3.3.3.3.3.3', '4.4.4.4',
-                                               '6.6.6', '3.3.3.3.6',
-                                               '3.3.3.4.4', '3.3.4.3.4',
-                                               '3.4.6.4', '3.6.3.6',
-                                               '3.12.12', '4.6.12', '4.8.8'],
+                 vertex_configuration: Notation,
                  edge_size: int = 50,
-                 grid_rotation: float = 0) -> None:
+                 grid_rotation: float = 0,
+                 tile_cache: Optional[TileCache] = None) -> None:
 
         if edge_size < 10:
             raise Exception("Edge size is too short.")
-        self._notation = str(vertex_configuration)
+        self._notation: Notation = vertex_configuration
         self._vertex_configuration: Tuple[int, ...] = tuple(
             int(n) for n in vertex_configuration.split("."))
 
         self._edge_size: int = edge_size
         self._grid_rotation: float = grid_rotation
-        self._rgba_values: Dict[Tuple[int, int, int],
-                                Tuple[float, float, float, float]] = {}
-        self._num_values: Dict[Tuple[int, int, int], float] = {}
+        # dictionaries (or views of the shared layers, see 'share_values')
+        self._rgba_values: MutableMapping[
+            Tuple[int, int, int], Tuple[float, float, float, float]] = {}
+        self._num_values: MutableMapping[Tuple[int, int, int], float] = {}
+        self._values_lock = RLock()
+        # {layer: pyramid} of the layers whose pyramid was requested
+        self._pyramids: Dict[Layer, ValuePyramid] = {}
+        # {layer: spatial index} of the layers queried by 'values_in_range'
+        self._value_indices: Dict[Layer, ValueIndex] = {}
+
+        # scale and rotation independent topology shared by all the grids
+        # of the same vertex configuration
+        self._topology = get_topology(self._vertex_configuration)
 
         # e.g. [(4, 3, 4, 3, 4, 90), (3, 3, 3, 4, 30), (3, 3, 3, 4, 210)]
-        self._rdgnt_names = POSSIBLE_RDGNT[self._vertex_configuration]
+        self._rdgnt_names = self._topology.rdgnt_names
 
         # optimalisation
         # {(polygon_n, rotation): [vertices]}
         self._polygons_coords: Dict[Tuple[int, float],
                                     List[Tuple[float, float]]] = {}
-        # e.g. {(3, 3, 3, 3, 30): RotatedDualGraphNodeType}
-        self._rdgnt_dic = self._build_rdgnt_dic()
+        # e.g. {(3, 3, 3, 3, 30): RotatedDualGraphNodeType} (of edges of
+        # size 1 and no rotation - only their type, polygon and its rotation
+        # are used)
+        self._rdgnt_dic = self._topology.rdgnt_dic
 
         # conversion
+        self._cos_rotation = math.cos(grid_rotation)
+        self._sin_rotation = math.sin(grid_rotation)
         self._unit_vectors = self._calculate_unit_vectors()
         self._cells_offsets = self._calculate_cells_offsets()
+        self._vertices_offsets = [self._scale_and_rotate(offset) for offset
+                                  in self._topology.vertex_offsets]
+        u, v = self._unit_vectors
+        self._determinant = u[0] * v[1] - v[0] * u[1]
+
+        # shared, must not be modified
+        self.adj_indices_shift = self._topology.adj_indices_shift
+
+        # the most recent generation (replaced as a whole, never modified)
+        self._last_generation: Optional[Generation] = None
+
+        # tiles (built on the first use)
+        self._tile_builder: Optional[TileBuilder] = None
+        self._tile_cache = tile_cache
 
-        self._shapely_polygons_near_origin: Dict[
-            Tuple[int, int, int],
-            ShapelyPolygon] = self._create_shapely_polygons()
+        # opt-in profiling (see 'enable_profiling')
+        self._profiler: Optional[Profiler] = None
 
-        self.adj_indices_shift = self._calculate_adj_indices_shift()
+        # opt-in log of the changes of the values (see 'track_changes')
+        self._change_log: Optional[ChangeLog] = None
+        # token the next log starts at (the tokens never repeat, even if the
+        # tracking is stopped and started again)
+        self._next_change_token = 0
 
-        # search
-        self._search_counter: int = 0
-        self._discovered_nodes: Dict[Tuple[int, int, int], DualGraphNode] = {}
-        self._edges: List[Tuple[Tuple[float, float], Tuple[float, float]]] = []
-        self._dual_graph: List[Tuple[Tuple[float, float],
-                                     Tuple[float, float]]] = []
+        # {layer: shared layer} of the layers in shared memory (see
+        # 'share_values')
+        self._shared_layers: Dict[Layer, SharedLayer] = {}
 
     @property
     def notation(self) -> str:
@@ -80,71 +131,69 @@ class SemiregularGrid(SemiregularGridInterface):
     def grid_rotation(self) -> float:
         return self._grid_rotation
 
+    @property
+    def config(self) -> GridConfig:
+        """The arguments the grid can be created from again."""
+        return self._notation, self._edge_size, self._grid_rotation
+
+    @property
+    def tile_cache(self) -> Optional[TileCache]:
+        return self._tile_cache
+
+    @property
+    def profile_stats(self) -> Optional[ProfileStats]:
+        """Statistics of the profiling (None if it was never enabled)."""
+        if self._profiler is None:
+            return None
+        return self._profiler.stats
+
     @property
     def total_cell_types(self) -> int:
         return len(self._rdgnt_names)
 
+    @property
+    def total_vertex_types(self) -> int:
+        return len(self._vertices_offsets)
+
+    @property
+    def total_edge_types(self) -> int:
+        return len(self._topology.edge_cells)
+
     @property
     def rgba_values(self) -> List[Tuple[Tuple[int, int, int],
                                         Tuple[float, float, float, float]]]:
-        return [(index, value) for index, value in self._rgba_values.items()]
+        with self._values_lock:
+            return [(index, value)
+                    for index, value in self._rgba_values.items()]
 
     @property
     def numerical_values(self) -> List[Tuple[Tuple[int, int, int],
                                              float]]:
-        return [(index, value) for index, value in self._num_values.items()]
+        with self._values_lock:
+            return [(index, value)
+                    for index, value in self._num_values.items()]
 
     @property
-    def generated_cells(self) -> Dict[Tuple[int, int, int], DualGraphNode]:
-        return self._discovered_nodes
-
-    def _calculate_origin_cells_range(self) -> AreaRange:
-        """
-        Calculate the rectangular area around the origin that will contain
-        the modulo unit vectors.
-        """
-        s1, s2 = self._unit_vectors
-        vts = [s1, s2, (0, 0), (s1[0] + s2[0], s1[1] + s2[1])]
-        min_x = min(vertex[0] for vertex in vts)
-        min_y = min(vertex[1] for vertex in vts)
-        max_x = max(vertex[0] for vertex in vts)
-        max_y = max(vertex[1] for vertex in vts)
-        return ((min_x, min_y), (max_x, max_y))
-
-    def _create_shapely_polygons(self) \
-            -> Dict[Tuple[int, int, int], ShapelyPolygon]:
-        """Create shapely polygons near the origin."""
-        pattern_polygons = {}
-        near_origin_area = self._calculate_origin_cells_range()
-
-        for i, j in [(i, j) for j in (-1, 0, 1) for i in (-1, 0, 1)]:
-            for k in range(self.total_cell_types):
-                coords = self.index_to_coords((i, j, k))
-                rdgnt_name = self._rdgnt_names[k]
-                rdgnt = self._rdgnt_dic[rdgnt_name]
-
-                if self._is_polygon_visible(coords, rdgnt, near_origin_area):
-                    vertices = self._polygon_coords(
-                        coords, rdgnt_name[0], rdgnt.polygon_rotation)
-                    pattern_polygons[(i, j, k)] = ShapelyPolygon(
-                        vertices)
-
-        return pattern_polygons
+    def generated_cells(self) -> Mapping[Tuple[int, int, int],
+                                         DualGraphNode]:
+        """
+        Cells of the most recently completed generation (use the result of
+        'generate' when the grid is shared by several threads).
+        """
+        generation = self._last_generation
+        return {} if generation is None else generation.cells
 
     def _calculate_cells_offsets(self) \
             -> Dict[Tuple[int, ...], Tuple[float, float]]:
         """Scale and rotate the offsets of the cells in the unit block."""
-        cells_offsets = dict(UNIT_BLOCK_CELLS_OFFSET[
-            self._vertex_configuration])
-        for rdgnt_name, offset in cells_offsets.items():
-            cells_offsets[rdgnt_name] = self._scale_and_rotate(offset)
-
-        return cells_offsets
+        return {rdgnt_name: self._scale_and_rotate(offset)
+                for rdgnt_name, offset in zip(self._rdgnt_names,
+                                              self._topology.cells_offsets)}
 
     def _calculate_unit_vectors(self) -> \
             Tuple[Tuple[float, float], Tuple[float, float]]:
         """Scale and rotate unit vectors accordingly."""
-        u, v = UNIT_VECTORS[self._vertex_configuration]
+        u, v = self._topology.unit_vectors
         return self._scale_and_rotate(u), self._scale_and_rotate(v)
 
     def _scale_and_rotate(self, vector: Tuple[float, float]) \
@@ -161,50 +210,10 @@ class SemiregularGrid(SemiregularGridInterface):
         Rotate vector '(ux, uy)' around centre by grid rotation and
         return its new coordinates.
         """
-        cos_alpha = math.cos(self._grid_rotation)
-        sin_alpha = math.sin(self._grid_rotation)
-        matrix = np.array([[cos_alpha, -sin_alpha], [sin_alpha, cos_alpha]])
-        new_ux, new_uy = np.dot(matrix, np.array([ux, uy]))
+        new_ux = self._cos_rotation * ux - self._sin_rotation * uy
+        new_uy = self._sin_rotation * ux + self._cos_rotation * uy
 
-        return (round(float(new_ux), 5), round(float(new_uy), 5))
-
-    def _build_rdgnt_dic(self) \
-            -> Dict[Tuple[int, ...], RotatedDualGraphNodeType]:
-        """
-        Build a dictionary for better availability
-        to the 'RotatedDualGraphNodeType's.
-        """
-        rdgnt_dic = {}
-        for rdgnt_name in self._rdgnt_names:
-            rdgnt_dic[rdgnt_name] = \
-                RotatedDualGraphNodeType(rdgnt_name[0], rdgnt_name[1:-1],
-                                         self._edge_size, self._grid_rotation,
-                                         rdgnt_name[-1])
-
-        return rdgnt_dic
-
-    def _calculate_adj_indices_shift(self) -> Dict[Tuple[int, ...],
-                                                   List[Tuple[int, int, int]]]:
-        """
-        For each polygon of RotatedDualGraphNodeType, compute the 'i' and 'j'
-        index differences between the central polygon and each of its adjacent
-        polygons. E.g. the only rdgnt type in square grid will be
-        [(+1, 0), (0, +1), (-1, 0), (0, -1)].
-        """
-        # |     |0, +1|     |
-        # |-----|-----|-----|
-        # |-1, 0| ### |+1, 0|
-        # |-----|-----|-----|
-        # |     |0, -1|     |
-        adj_indices = {}
-        for k in range(self.total_cell_types):
-            xy = self.index_to_coords((0, 0, k))
-            rdgnt_name = self._rdgnt_names[k]
-            adj_coords = self._adj_centres_coords(rdgnt_name, xy)
-            adj_indices[rdgnt_name] = [
-                self.coords_to_index(adj_xy) for adj_xy in adj_coords]
-
-        return adj_indices
+        return (round(new_ux, 5), round(new_uy, 5))
 
     def _move_vertices(self, vector: Tuple[float, float],
                        vertices: List[Tuple[float, float]]) \
@@ -213,17 +222,6 @@ class SemiregularGrid(SemiregularGridInterface):
         u, v = vector
         return [(x + u, y + v) for x, y in vertices]
 
-    def _adj_centres_coords(self, rdgnt_name: Tuple[int, ...],
-                            coords: Tuple[float, float]) \
-            -> List[Tuple[float, float]]:
-        """
-        Get coordinates of the adjacents' centres (of the given polygon's
-        centre 'coords').
-        """
-        rdgn = self._rdgnt_dic[rdgnt_name]
-        adj_centres_coords_origin = rdgn.adjacent_centres_coords
-        return self._move_vertices(coords, adj_centres_coords_origin)
-
     def _polygon_coords_origin(self, polygon: GridPolygon, alpha: float) \
             -> List[Tuple[float, float]]:
         """
@@ -289,38 +287,41 @@ class SemiregularGrid(SemiregularGridInterface):
         Get coordinates of the edge between the polygon (of 'rdgnt' type)
         and its i-th adjacent.
         """
-        central_angle = math.degrees(centre_rdgnt.polygon.central_angle)
-        index_a = int(i + centre_rdgnt.dgnt_rotation//central_angle)
-        index_b = index_a - 1 if centre_rdgnt.dgnt_rotation % \
-            central_angle < centre_rdgnt.polygon_rotation else index_a + 1
-
-        return polygon_vertices[index_b % centre_rdgnt.polygon.n], \
-            polygon_vertices[index_a % centre_rdgnt.polygon.n]
-
-    def _search_adjacents(self, node: DualGraphNode,
-                          queue: List[DualGraphNode], area_range: AreaRange,
-                          edges: bool = False) -> None:
-        """
-        Explore the adjacents of the given 'node'.
+        index_b, index_a, _ = \
+            self._topology.edge_templates[centre_rdgnt.rdgnt_name][i]
+        return polygon_vertices[index_b], polygon_vertices[index_a]
+
+    def _search_adjacents(self, node_ijk: Tuple[int, int, int],
+                          queue: Deque[Tuple[int, int, int]],
+                          discovered: Dict[Tuple[int, int, int], bool],
+                          dual_graph: List[Tuple[Tuple[float, float],
+                                                 Tuple[float, float]]],
+                          area_range: AreaRange,
+                          edges: Optional[List[Tuple[
+                              Tuple[float, float],
+                              Tuple[float, float]]]] = None) -> None:
+        """
+        Explore the adjacents of the cell with the given 'node_ijk' index.
+        The 'discovered' cells are stored with the answer whether they are
+        fully explored.
         If 'edges' is not None, the coordinates of edges discovered during the
         search will be stored.
         """
-        node_ijk = self.centre_coords_to_index(node.coords, node.rdgnt_name)
-        node_rdgnt = self._rdgnt_dic[node.rdgnt_name]
-        if edges:
+        node_xy = self.index_to_coords(node_ijk)
+        node_rdgnt = self._rdgnt_dic[self._rdgnt_names[node_ijk[2]]]
+        if edges is not None:
             polygon_vertices = self._polygon_coords(
-                node.coords, node.rdgnt_name[0], node_rdgnt.polygon_rotation)
+                node_xy, node_rdgnt.polygon.n, node_rdgnt.polygon_rotation)
 
         for i_, adj_node_ijk in enumerate(self.adjacents(node_ijk)):
             adj_node_xy = self.index_to_coords(adj_node_ijk)
 
-            self._dual_graph.append((node.coords, adj_node_xy))
+            dual_graph.append((node_xy, adj_node_xy))
 
-            if adj_node_ijk in self._discovered_nodes:
-                if edges and not self._discovered_nodes[adj_node_ijk
-                                                        ].is_fully_explored:
-                    self._edges.append(self._get_edge(i_, node_rdgnt,
-                                                      polygon_vertices))
+            if adj_node_ijk in discovered:
+                if edges is not None and not discovered[adj_node_ijk]:
+                    edges.append(self._get_edge(i_, node_rdgnt,
+                                                polygon_vertices))
                 continue
 
             adj_node_rdgnt = self._rdgnt_dic[self._rdgnt_names[adj_node_ijk[2]]
@@ -330,67 +331,203 @@ class SemiregularGrid(SemiregularGridInterface):
                                                 area_range):
                     continue
 
-            new_node = DualGraphNode(adj_node_xy, adj_node_rdgnt.rdgnt_name)
-            self._discovered_nodes[adj_node_ijk] = new_node
-            queue.append(new_node)
+            discovered[adj_node_ijk] = False
+            queue.append(adj_node_ijk)
 
-            if edges:
-                self._edges.append(self._get_edge(i_, node_rdgnt,
-                                                  polygon_vertices))
+            if edges is not None:
+                edges.append(self._get_edge(i_, node_rdgnt,
+                                            polygon_vertices))
 
-        self._discovered_nodes[node_ijk].mark_as_explored()
+        discovered[node_ijk] = True
 
     def _search_area(self, area_range: AreaRange, edges: bool = False) \
-            -> None:
+            -> Generation:
         """
         Explore the centres of the polygons in the grid visible within
-        the given 'area_range' (= nodes) and store them by their indices.
-        If 'edges' is not None, the coordinates of edges discovered during the
+        the given 'area_range' (= nodes) and return them by their indices.
+        If 'edges' is True, the coordinates of edges discovered during the
         search will be stored.
         """
-        self._search_counter += 1
-        self._discovered_nodes = {}
-        self._dual_graph = []
+        discovered: Dict[Tuple[int, int, int], bool] = {}
+        dual_graph: List[Tuple[Tuple[float, float],
+                               Tuple[float, float]]] = []
+        found_edges: Optional[List[Tuple[Tuple[float, float],
+                                         Tuple[float, float]]]] = \
+            [] if edges else None
+        if not self._is_range_valid(area_range):
+            return Generation(self, area_range, self._cells_of([]),
+                              edges=found_edges, dual_graph=dual_graph)
 
         min_xy, max_xy = area_range
-        if min_xy[0] >= max_xy[0] or min_xy[1] >= max_xy[1]:
-            print("Invalid area range", area_range)
-            return
-
         range_midpoint_coords = (max_xy[0] + min_xy[0])/2, \
             (max_xy[1] + min_xy[1])/2
         initial_index = self.coords_to_index(range_midpoint_coords)
-        initial_node_coords = self.index_to_coords(initial_index)
-        initial_node = DualGraphNode(initial_node_coords,
-                                     self._rdgnt_names[initial_index[-1]])
-        self._discovered_nodes[initial_index] = initial_node
-        queue: List[DualGraphNode] = [initial_node]
+        discovered[initial_index] = False
+        queue: Deque[Tuple[int, int, int]] = deque([initial_index])
+
+        while queue:
+            self._search_adjacents(queue.popleft(), queue, discovered,
+                                   dual_graph, area_range, found_edges)
+
+        return Generation(self, area_range, self._cells_of(list(discovered)),
+                          edges=found_edges, dual_graph=dual_graph)
+
+    def _cells_of(self, indices: List[Tuple[int, int, int]]) \
+            -> GeneratedCells:
+        """Store the cells with the given 'indices' compactly."""
+        index_array = np.array(indices, dtype=np.int64).reshape(-1, 3)
+        return GeneratedCells(
+            pack_indices(index_array),
+            self._get_tile_builder().centres(index_array), self._rdgnt_names)
+
+    def _get_tile_builder(self) -> TileBuilder:
+        """
+        Return the builder of the grid's tiles (concurrent first calls may
+        build it twice, the builders are equal).
+        """
+        if self._tile_builder is None:
+            self._tile_builder = TileBuilder(self)
+        return self._tile_builder
 
-        while queue != []:
-            node = queue.pop(0)
-            self._search_adjacents(node, queue, area_range, edges)
+    def _is_range_valid(self, area_range: AreaRange) -> bool:
+        """Answer whether the 'area_range' is valid (print it if not)."""
+        min_xy, max_xy = area_range
+        if min_xy[0] >= max_xy[0] or min_xy[1] >= max_xy[1]:
+            print("Invalid area range", area_range)
+            return False
+        return True
+
+    def _cached_tiles(self, area_range: AreaRange) -> List[Tile]:
+        """Get the tiles covering the 'area_range' from the tile cache."""
+        builder = self._get_tile_builder()
+        return [self._cached_tile(builder, tile_id)
+                for tile_id in builder.tiles_for_range(area_range)]
+
+    def _cached_tile(self, builder: TileBuilder, tile_id: TileId) -> Tile:
+        """Get the tile from the tile cache (build it if it is missing)."""
+        assert self._tile_cache is not None
+        return self._tile_cache.get((*self.config, tile_id),
+                                    lambda: builder.build(tile_id))
+
+    def _stitch_tiles(self, area_range: AreaRange, output: Output) \
+            -> Generation:
+        """
+        Stitch the cells of the cached tiles within the 'area_range' (and
+        their polygons or edges if they are the 'output').
+        """
+        if not self._is_range_valid(area_range):
+            return Generation(self, area_range, self._cells_of([]), [], [],
+                              [])
+
+        tiles = self._cached_tiles(area_range)
+        ids, centres = concatenate(
+            [tile.select_centres(area_range) for tile in tiles], 'centres')
+        cells = GeneratedCells(ids, centres, self._rdgnt_names)
+
+        if output == 'polygons':
+            _, offsets, vertices = concatenate(
+                [tile.select_polygons(area_range) for tile in tiles],
+                'polygons')
+            return Generation(self, area_range, cells,
+                              polygons=split_polygons(offsets, vertices))
+        if output == 'edges':
+            edges, = concatenate([(tile.select_edges(area_range),)
+                                  for tile in tiles], 'edges')
+            return Generation(self, area_range, cells,
+                              edges=to_edge_list(edges))
+        return Generation(self, area_range, cells)
+
+    def _generate(self, area_range: AreaRange, output: Output) \
+            -> Generation:
+        """
+        Generate the grid within the 'area_range' - stitch it from the tile
+        cache or search it (with its edges if they are the 'output').
+        """
+        if self._tile_cache is not None:
+            generation = self._stitch_tiles(area_range, output)
+        else:
+            generation = self._search_area(area_range,
+                                           edges=output == 'edges')
 
-    def generate_edges(self, area_range: AreaRange) \
+        self._last_generation = generation
+        return generation
+
+    def generate(self, area_range: AreaRange) -> Generation:
+        """
+        Generate the grid covering the 'area_range' and return the result
+        (its cells, centres, polygons, edges and dual graph).
+        The result is self-contained, generating the grid again (e.g. in
+        another thread) does not change it.
+        """
+        return self._generate(area_range, 'centres')
+
+    def generate_edges(self, area_range: AreaRange,
+                       workers: Optional[int] = None) \
             -> List[Tuple[Tuple[float, float], Tuple[float, float]]]:
-        self._edges = []
-        self._search_area(area_range, edges=True)
-        return self._edges
+        if workers is not None:
+            if not self._is_range_valid(area_range):
+                return []
+            edges, = generate_parallel(self, area_range, 'edges', workers)
+            return to_edge_list(edges)
+
+        return self._generate(area_range, 'edges').edges
 
-    def generate_centres(self, area_range: AreaRange) -> \
+    def generate_centres(self, area_range: AreaRange,
+                         workers: Optional[int] = None) -> \
             List[Tuple[float, float]]:
-        self._search_area(area_range)
-        return [node.coords for node in self._discovered_nodes.values()]
+        if workers is not None:
+            if not self._is_range_valid(area_range):
+                return []
+            _, centres = generate_parallel(self, area_range, 'centres',
+                                           workers)
+            return to_point_list(centres)
 
-    def generate_polygons(self, area_range: AreaRange) \
-            -> List[List[Tuple[float, float]]]:
-        polygons = []
-        self._search_area(area_range)
-        for node in self._discovered_nodes.values():
-            n = node.rdgnt_name[0]
-            rotation = self._rdgnt_dic[node.rdgnt_name].polygon_rotation
-            polygons.append(self._polygon_coords(node.coords, n, rotation))
+        return self._generate(area_range, 'centres').centres
 
-        return polygons
+    def generate_polygons(self, area_range: AreaRange,
+                          workers: Optional[int] = None) \
+            -> List[List[Tuple[float, float]]]:
+        if workers is not None:
+            if not self._is_range_valid(area_range):
+                return []
+            _, offsets, vertices = generate_parallel(
+                self, area_range, 'polygons', workers)
+            return split_polygons(offsets, vertices)
+
+        return self._generate(area_range, 'polygons').polygons
+
+    def dual_graph(self, area_range: AreaRange, sparse: bool = False) \
+            -> Tuple[Any, ...]:
+        if not self._is_range_valid(area_range):
+            cell_ids, indptr, indices = np.zeros(0, dtype=np.int64), \
+                np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        else:
+            cell_ids, indptr, indices = dual_graph_csr(self, area_range)
+        if sparse:
+            return cell_ids, to_sparse_matrix(indptr, indices)
+        return cell_ids, indptr, indices
+
+    def generate_mesh(self, area_range: AreaRange) \
+            -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        if not self._is_range_valid(area_range):
+            return np.zeros((0, 2)), np.zeros(1, dtype=np.int64), \
+                np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return indexed_mesh(self, area_range)
+
+    def dissolve(self, cells: Union[np.ndarray,
+                                    List[Tuple[int, int, int]]]) \
+            -> List[OutlinePolygon]:
+        cells = np.asarray(cells, dtype=np.int64)
+        if cells.ndim == 1:
+            cells = unpack_indices(cells)
+        return dissolve(self, cells)
+
+    def _cell_polygon(self, centre: Tuple[float, float], k: int) \
+            -> List[Tuple[float, float]]:
+        """Get the vertices of the polygon of the k-th type cell."""
+        rdgnt = self._rdgnt_dic[self._rdgnt_names[k]]
+        return self._polygon_coords(centre, rdgnt.polygon.n,
+                                    rdgnt.polygon_rotation)
 
     def _coords_to_approx_index(self, xy: Tuple[float, float]) \
             -> Tuple[float, float]:
@@ -398,8 +535,8 @@ class SemiregularGrid(SemiregularGridInterface):
         Convert coordinates 'xy' into approximate float index ij.
         """
         u, v = self._unit_vectors
-        j = (u[0] * xy[1] - xy[0] * u[1])/(u[0] * v[1] - v[0] * u[1])
-        i = (xy[0] - j * v[0])/u[0]
+        j = (u[0] * xy[1] - xy[0] * u[1])/self._determinant
+        i = (xy[0] * v[1] - xy[1] * v[0])/self._determinant
         return i, j
 
     def index_to_coords(self, index: Tuple[int, int, int]) \
@@ -423,8 +560,8 @@ class SemiregularGrid(SemiregularGridInterface):
         y = xy[1] - y_offset
 
         u, v = self._unit_vectors
-        j = round((u[0] * y - x * u[1])/(u[0] * v[1] - v[0] * u[1]))
-        i = round((x - j * v[0])/u[0])
+        j = round((u[0] * y - x * u[1])/self._determinant)
+        i = round((x * v[1] - y * v[0])/self._determinant)
         k = self._rdgnt_names.index(rdgnt_name)
 
         return i, j, k
@@ -436,28 +573,98 @@ class SemiregularGrid(SemiregularGridInterface):
         near_xy = xy[0] - r_i * u[0] - r_j * v[0], \
             xy[1] - r_i * u[1] - r_j * v[1]
 
-        pnt = ShapelyPoint(near_xy)
-        for ijk, pol in self._shapely_polygons_near_origin.items():
-            if pol.covers(pnt):
-                return ijk[0] + r_i, ijk[1] + r_j, ijk[2]
+        # locate the point within the shared polygons of the unit space
+        x, y = near_xy
+        ijk = self._topology.locate_near_origin((
+            (self._cos_rotation * x + self._sin_rotation * y) /
+            self._edge_size,
+            (self._cos_rotation * y - self._sin_rotation * x) /
+            self._edge_size))
+        if ijk is not None:
+            return ijk[0] + r_i, ijk[1] + r_j, ijk[2]
 
         print(f"\n{xy} -> {near_xy}\n")
         raise Exception("Conversion 'coordinates' to 'index' failed.")
 
+    def _coords_to_indices(self, points: np.ndarray) -> np.ndarray:
+        """
+        (N, 3) array of the indices of the cells containing the (N, 2)
+        'points' (see 'coords_to_index'); the rows of the points that could
+        not be located have 'k' -1.
+        """
+        u, v = self._unit_vectors
+        x, y = points[:, 0], points[:, 1]
+        r_i = np.floor((x * v[1] - y * v[0]) / self._determinant)
+        r_j = np.floor((u[0] * y - x * u[1]) / self._determinant)
+        x = x - r_i * u[0] - r_j * v[0]
+        y = y - r_i * u[1] - r_j * v[1]
+
+        indices = self._topology.locate_near_origin_array(np.stack((
+            (self._cos_rotation * x + self._sin_rotation * y) /
+            self._edge_size,
+            (self._cos_rotation * y - self._sin_rotation * x) /
+            self._edge_size), axis=1))
+        indices[:, 0] += r_i.astype(np.int64)
+        indices[:, 1] += r_j.astype(np.int64)
+        return indices
+
+    def enable_profiling(self, callback: Optional[ProfileCallback] = None,
+                         reset: bool = True) -> None:
+        if self._profiler is None:
+            self._profiler = Profiler(callback)
+        else:
+            Profiler.detach(self)
+            self._profiler.callback = callback
+            if reset:
+                self._profiler.reset()
+        self._profiler.attach(self)
+
+    def disable_profiling(self) -> None:
+        if self._profiler is not None:
+            Profiler.detach(self)
+
+    def track_changes(self, max_changes: int = DEFAULT_MAX_CHANGES) -> int:
+        with self._values_lock:
+            if self._change_log is None:
+                self._change_log = ChangeLog(max_changes,
+                                             self._next_change_token)
+            else:
+                self._change_log.max_changes = max_changes
+            return self._change_log.token
+
+    def stop_tracking_changes(self) -> None:
+        with self._values_lock:
+            if self._change_log is not None:
+                # the changes made until the tracking starts again are not
+                # logged, so all the tokens so far must become too old
+                self._next_change_token = self._change_log.token + 1
+            self._change_log = None
+
+    def changes_since(self, token: int) \
+            -> Tuple[int, Optional[Dict[Layer, np.ndarray]]]:
+        with self._values_lock:
+            if self._change_log is None:
+                raise Exception("Changes are not tracked, "
+                                "call 'track_changes' first.")
+            return self._change_log.token, \
+                self._change_log.changes_since(token)
+
     def filter_num_values(self, filter_function: Callable[[float], bool]) \
             -> List[Tuple[int, int, int]]:
-        return self._filter_values(filter_function, self._num_values)
+        with self._values_lock:
+            return self._filter_values(filter_function, self._num_values)
 
     def filter_rgba_values(self, filter_function: Callable[[
             Tuple[float, float, float, float]], bool]) \
             -> List[Tuple[int, int, int]]:
-        return self._filter_values(filter_function, self._rgba_values)
+        with self._values_lock:
+            return self._filter_values(filter_function, self._rgba_values)
 
     def _filter_values(self, filter_func: Callable[..., bool],
                        values_dic: Union[
-                           Dict[Tuple[int, int, int],
-                                Tuple[float, float, float, float]],
-                           Dict[Tuple[int, int, int], float]]) -> \
+                           Mapping[Tuple[int, int, int],
+                                   Tuple[float, float, float, float]],
+                           Mapping[Tuple[int, int, int], float]]) -> \
             List[Tuple[int, int, int]]:
         """
         Filter cells based on their values by the given 'filter function' and
@@ -477,42 +684,252 @@ class SemiregularGrid(SemiregularGridInterface):
 
         return [(i + i_, j + j_, k_) for i_, j_, k_ in adj_ijk_shift]
 
+    def cell_vertices(self, index: Tuple[int, int, int]) \
+            -> List[Tuple[int, int, int]]:
+        i, j, k = index
+        return [(i + i_, j + j_, v)
+                for i_, j_, v in self._topology.cell_vertices[k]]
+
+    def cell_edges(self, index: Tuple[int, int, int]) \
+            -> List[Tuple[int, int, int]]:
+        i, j, k = index
+        return [(i + i_, j + j_, e)
+                for i_, j_, e in self._topology.cell_edges[k]]
+
+    def vertex_cells(self, vertex: Tuple[int, int, int]) \
+            -> List[Tuple[int, int, int]]:
+        i, j, v = vertex
+        return [(i + i_, j + j_, k)
+                for i_, j_, k in self._topology.vertex_cells[v]]
+
+    def vertex_edges(self, vertex: Tuple[int, int, int]) \
+            -> List[Tuple[int, int, int]]:
+        i, j, v = vertex
+        return [(i + i_, j + j_, e)
+                for i_, j_, e in self._topology.vertex_edges[v]]
+
+    def edge_cells(self, edge: Tuple[int, int, int]) \
+            -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+        i, j, e = edge
+        (i_1, j_1, k_1), (i_2, j_2, k_2) = self._topology.edge_cells[e]
+        return (i + i_1, j + j_1, k_1), (i + i_2, j + j_2, k_2)
+
+    def edge_vertices(self, edge: Tuple[int, int, int]) \
+            -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+        i, j, e = edge
+        (i_1, j_1, v_1), (i_2, j_2, v_2) = self._topology.edge_vertices[e]
+        return (i + i_1, j + j_1, v_1), (i + i_2, j + j_2, v_2)
+
+    def vertex_to_coords(self, vertex: Tuple[int, int, int]) \
+            -> Tuple[float, float]:
+        i, j, v = vertex
+        u, w = self._unit_vectors
+        x_offset, y_offset = self._vertices_offsets[v]
+        return i * u[0] + j * w[0] + x_offset, i * u[1] + j * w[1] + y_offset
+
     def delete_values(self, del_rgba: bool = False,
                       del_num: bool = False,
                       keep_indices: Optional[List[Tuple[
+                          int, int, int]]] = None,
+                      indices: Optional[List[Tuple[
                           int, int, int]]] = None) -> None:
-        if del_rgba:
-            self._delete_rgba_values(keep_indices)
-        if del_num:
-            self._delete_num_values(keep_indices)
-
-    def _delete_rgba_values(self, keep_indices: Optional[
+        with self._values_lock:
+            if del_rgba:
+                self._delete_layer_values('rgba', keep_indices, indices)
+            if del_num:
+                self._delete_layer_values('num', keep_indices, indices)
+
+    def _layer_values(self, layer: Layer) -> Union[
+            MutableMapping[Tuple[int, int, int],
+                           Tuple[float, float, float, float]],
+            MutableMapping[Tuple[int, int, int], float]]:
+        """Values of the 'layer' ('rgba' or 'num')."""
+        return self._rgba_values if layer == 'rgba' else self._num_values
+
+    def _reindex(self, layer: Layer) -> None:
+        """
+        Aggregate the values of the layer's pyramid and index its cells
+        again (if they exist).
+        """
+        pyramid = self._pyramids.get(layer)
+        if pyramid is not None:
+            pyramid.rebuild(self._layer_values(layer))
+        value_index = self._value_indices.get(layer)
+        if value_index is not None:
+            self._index_values(value_index, layer)
+
+    def _index_values(self, value_index: ValueIndex, layer: Layer) -> None:
+        """Index all the values of the layer (shared ones without a copy)."""
+        shared = self._shared_layers.get(layer)
+        if shared is None:
+            value_index.rebuild(self._layer_values(layer))
+        else:
+            value_index.share(shared.ids, shared.values)
+
+    def value_pyramid(self, layer: Layer = 'num',
+                      levels: int = DEFAULT_LEVELS) -> ValuePyramid:
+        with self._values_lock:
+            pyramid = self._pyramids.get(layer)
+            if pyramid is None or pyramid.levels != levels:
+                pyramid = ValuePyramid(self, layer, levels)
+                pyramid.rebuild(self._layer_values(layer))
+                self._pyramids[layer] = pyramid
+            return pyramid
+
+    def sample(self, xy: np.ndarray, layer: Layer = 'num',
+               method: str = 'nearest') -> np.ndarray:
+        with self._values_lock:
+            return sample(self, xy, layer, method)
+
+    def zonal_stats(self, geometries: Sequence[Any], layer: Layer = 'num',
+                    stats: Sequence[str] = ('count', 'sum', 'mean'),
+                    weighting: str = 'centre',
+                    bins: Optional[Sequence[float]] = None,
+                    workers: Optional[int] = None) -> Dict[str, np.ndarray]:
+        return zonal_stats(self, geometries, layer, stats, weighting, bins,
+                           workers)
+
+    def values_in_range(self, area_range: AreaRange, layer: Layer = 'num') \
+            -> Tuple[np.ndarray, np.ndarray]:
+        if layer not in ('rgba', 'num'):
+            raise Exception("Layer must be 'rgba' or 'num'.")
+        shape = (-1, 4) if layer == 'rgba' else (-1,)
+        if not self._is_range_valid(area_range):
+            return np.zeros(0, dtype=np.int64), np.zeros(0).reshape(shape)
+
+        with self._values_lock:
+            return self._value_index(layer).in_range(area_range)
+
+    def _value_index(self, layer: Layer) -> ValueIndex:
+        """Spatial index of the values of the layer (created on first use)."""
+        with self._values_lock:
+            value_index = self._value_indices.get(layer)
+            if value_index is None:
+                value_index = ValueIndex(self, layer)
+                self._index_values(value_index, layer)
+                self._value_indices[layer] = value_index
+            return value_index
+
+    def _delete_layer_values(self, layer: Layer, keep_indices: Optional[
+            List[Tuple[int, int, int]]] = None, indices: Optional[
             List[Tuple[int, int, int]]] = None) -> None:
         """
-        Delete all RGBA values in the grid
-        (any index included in 'keep_indices' will be excluded from deletion).
-        """
-        if keep_indices is None:
-            self._rgba_values = {}
+        Delete the values of the layer in place - all of them or only those
+        of the 'indices' (any index included in 'keep_indices' will be
+        excluded from deletion).
+        """
+        if layer in self._shared_layers:
+            raise Exception("Values of a shared layer cannot be deleted "
+                            "(see 'unshare_values').")
+        values = self._layer_values(layer)
+        keep = set() if keep_indices is None else set(keep_indices)
+        if indices is None:
+            removed = [index for index in values if index not in keep]
+        else:
+            removed = [index for index in dict.fromkeys(indices)
+                       if index in values and index not in keep]
+        if not removed:
             return None
 
-        self._rgba_values = {keep_index: self._rgba_values[keep_index]
-                             for keep_index in keep_indices
-                             if keep_index in self._rgba_values}
-
-    def _delete_num_values(self, keep_indices: Optional[
-            List[Tuple[int, int, int]]] = None) -> None:
-        """
-        Delete all numerical values in the grid
-        (any index included in 'keep_indices' will be excluded from deletion).
-        """
-        if keep_indices is None:
-            self._num_values = {}
+        if len(removed) == len(values):
+            values.clear()
+        else:
+            for index in removed:
+                del values[index]
+        if self._change_log is not None:
+            self._change_log.record_many(layer, removed)
+
+        if len(removed) > len(values):
+            # most of the values were deleted - aggregating the rest again
+            # is cheaper
+            self._reindex(layer)
             return None
-
-        self._num_values = {keep_index: self._num_values[keep_index]
-                            for keep_index in keep_indices
-                            if keep_index in self._num_values}
+        pyramid = self._pyramids.get(layer)
+        value_index = self._value_indices.get(layer)
+        for index in removed:
+            if pyramid is not None:
+                pyramid.update(index, values)
+            if value_index is not None:
+                value_index.remove(index)
+
+    def share_values(self, layers: Sequence[Layer] = ('rgba', 'num')) \
+            -> GridHandle:
+        with self._values_lock:
+            for layer in layers:
+                if layer not in ('rgba', 'num'):
+                    raise Exception("Layer must be 'rgba' or 'num'.")
+                if layer in self._shared_layers:
+                    continue
+                ids, values = self._value_index(layer).arrays()
+                if len(ids) != len(self._layer_values(layer)):
+                    raise Exception("Cells too far from the origin cannot "
+                                    "be shared.")
+                self._attach_shared_layer(layer, SharedLayer.create(
+                    layer, ids, values))
+            return GridHandle(type(self), self.config, {
+                layer: shared.spec
+                for layer, shared in self._shared_layers.items()})
+
+    def _attach_shared_layer(self, layer: Layer,
+                             shared: SharedLayer) -> None:
+        """Replace the values of the layer by the shared layer."""
+        with self._values_lock:
+            self._shared_layers[layer] = shared
+            if layer == 'rgba':
+                self._rgba_values = SharedRgbaValues(shared)
+            else:
+                self._num_values = SharedNumValues(shared)
+            self._reindex(layer)
+
+    def unshare_values(self) -> None:
+        with self._values_lock:
+            for layer, shared in list(self._shared_layers.items()):
+                del self._shared_layers[layer]
+                if layer == 'rgba':
+                    self._rgba_values = dict(self._rgba_values.items())
+                else:
+                    self._num_values = dict(self._num_values.items())
+                self._reindex(layer)
+                shared.close()
+
+    def write_shared_values(self, cell_ids: np.ndarray, values: np.ndarray,
+                            layer: Layer = 'num') -> None:
+        with self._values_lock:
+            shared = self._shared_layers.get(layer)
+            if shared is None:
+                raise Exception(f"Layer '{layer}' is not shared.")
+            cell_ids = np.asarray(cell_ids, dtype=np.int64).reshape(-1)
+            shared.write(cell_ids, values)
+            self._shared_values_changed(layer, cell_ids)
+
+    def refresh_shared_values(self) -> None:
+        with self._values_lock:
+            for layer in self._shared_layers:
+                self._shared_values_changed(layer, None)
+
+    def _shared_values_changed(self, layer: Layer,
+                               cell_ids: Optional[np.ndarray]) -> None:
+        """
+        Update the caches of the shared layer after its values with the ids
+        (all of them if None) were written in place.
+        """
+        value_index = self._value_indices.get(layer)
+        if value_index is not None:
+            value_index.share(self._shared_layers[layer].ids,
+                              self._shared_layers[layer].values)
+        if cell_ids is None:
+            pyramid = self._pyramids.get(layer)
+            if pyramid is not None:
+                pyramid.rebuild(self._layer_values(layer))
+            return None
+        indices = [(i, j, k) for i, j, k in
+                   unpack_indices(np.unique(cell_ids)).tolist()]
+        if self._change_log is not None:
+            self._change_log.record_many(layer, indices)
+        pyramid = self._pyramids.get(layer)
+        if pyramid is not None:
+            for index in indices:
+                pyramid.update(index, self._layer_values(layer))
 
     def _describe_type(self, value: Any) \
             -> str:
@@ -527,9 +944,23 @@ class SemiregularGrid(SemiregularGridInterface):
                                  float]) -> None:
         if isinstance(value, tuple) and len(value) == 4 and \
                 all(isinstance(item, (float, int)) for item in value):
-            self._rgba_values[index] = value
+            with self._values_lock:
+                self._rgba_values[index] = value
+                if self._change_log is not None:
+                    self._change_log.record('rgba', index)
+                if 'rgba' in self._value_indices:
+                    self._value_indices['rgba'].set(index, value)
+                if 'rgba' in self._pyramids:
+                    self._pyramids['rgba'].update(index, self._rgba_values)
         elif isinstance(value, (float, int)):
-            self._num_values[index] = value
+            with self._values_lock:
+                self._num_values[index] = value
+                if self._change_log is not None:
+                    self._change_log.record('num', index)
+                if 'num' in self._value_indices:
+                    self._value_indices['num'].set(index, value)
+                if 'num' in self._pyramids:
+                    self._pyramids['num'].update(index, self._num_values)
         else:
             type_name = self._describe_type(value)
             print(f"\
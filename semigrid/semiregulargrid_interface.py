@@ -1,11 +1,32 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, List, Callable, Optional
+from typing import Tuple, Dict, List, Sequence, Callable, Optional, Any
+
+import numpy as np
+
+from semigrid.pyramid import Layer, ValuePyramid
+from semigrid.sharedlayer import GridHandle
 
 
 class SemiregularGridInterface(ABC):
+    @abstractmethod
+    def generate(self, area_range: Tuple[Tuple[float, float],
+                                         Tuple[float, float]]) -> Any:
+        """
+        Generate a grid covering a rectangular area and return the result of
+        the generation (its cells, centres, polygons, edges and dual graph).
+        The result is self-contained - it is not changed by any other
+        generation of the grid.
+
+        'Area range' is determined by two vertices - one at the bottom-left
+        corner [min_x, min_y] and the other at the top-right corner
+        [max_x, max_y].
+        """
+        pass
+
     @abstractmethod
     def generate_edges(self, area_range: Tuple[Tuple[float, float],
-                                               Tuple[float, float]]) \
+                                               Tuple[float, float]],
+                       workers: Optional[int] = None) \
             -> List[Tuple[Tuple[float, float], Tuple[float, float]]]:
         """
         Generate a grid covering a rectangular area as a list of edges
@@ -16,12 +37,16 @@ class SemiregularGridInterface(ABC):
         'Area range' is determined by two vertices - one at the bottom-left
         corner [min_x, min_y] and the other at the top-right corner
         [max_x, max_y].
+
+        If 'workers' is given, the area is split into lattice-aligned tiles
+        that are generated by a pool of 'workers' processes.
         """
         pass
 
     @abstractmethod
     def generate_centres(self, area_range: Tuple[Tuple[float, float],
-                                                 Tuple[float, float]]) \
+                                                 Tuple[float, float]],
+                         workers: Optional[int] = None) \
             -> List[Tuple[float, float]]:
         """
         Generate a grid covering a rectangular area as a list of cell centres.
@@ -31,12 +56,16 @@ class SemiregularGridInterface(ABC):
         'Area range' is determined by two vertices - one at the bottom-left
         corner [min_x, min_y] and the other at the top-right corner
         [max_x, max_y].
+
+        If 'workers' is given, the area is split into lattice-aligned tiles
+        that are generated by a pool of 'workers' processes.
         """
         pass
 
     @abstractmethod
     def generate_polygons(self, area_range: Tuple[Tuple[float, float],
-                                                  Tuple[float, float]]) \
+                                                  Tuple[float, float]],
+                          workers: Optional[int] = None) \
             -> List[List[Tuple[float, float]]]:
         """
         Generate a grid covering a rectangular area as a list of polygons.
@@ -46,6 +75,111 @@ class SemiregularGridInterface(ABC):
         'Area range' is determined by two vertices - one at the bottom-left
         corner [min_x, min_y] and the other at the top-right corner
         [max_x, max_y].
+
+        If 'workers' is given, the area is split into lattice-aligned tiles
+        that are generated by a pool of 'workers' processes.
+        """
+        pass
+
+    @abstractmethod
+    def generate_mesh(self, area_range: Tuple[Tuple[float, float],
+                                              Tuple[float, float]]) \
+            -> Tuple[Any, Any, Any, Any]:
+        """
+        Generate a grid covering a rectangular area as an indexed mesh
+        (vertices, face offsets, face indices, cell ids):
+        (V, 2) coordinates of the vertices (every vertex once), the n-th face
+        (polygon) consists of the vertices
+        face_indices[face_offsets[n]:face_offsets[n + 1]] and belongs to the
+        cell with the packed id 'cell ids[n]' (sorted, see
+        'cellid.unpack_indices').
+
+        'Area range' is determined by two vertices - one at the bottom-left
+        corner [min_x, min_y] and the other at the top-right corner
+        [max_x, max_y].
+        """
+        pass
+
+    @abstractmethod
+    def dissolve(self, cells: Any) -> List[Tuple[Any, List[Any]]]:
+        """
+        Merge the 'cells' - a list of (i, j, k) indices (e.g. of
+        'filter_num_values') or an array of packed cell ids - into the
+        outline polygons of their region: a list of (exterior, holes), where
+        the exterior and each of the holes are (N, 2) arrays of the
+        coordinates of the vertices of a ring (not closed, the exteriors
+        counterclockwise, the holes clockwise). Neighbouring rings share the
+        exact vertices of the grid.
+        """
+        pass
+
+    @abstractmethod
+    def dual_graph(self, area_range: Tuple[Tuple[float, float],
+                                           Tuple[float, float]],
+                   sparse: bool = False) -> Tuple[Any, ...]:
+        """
+        Get the dual graph of the cells covering a rectangular area in the
+        compressed sparse row form (cell ids, indptr, indices).
+        The n-th row belongs to the cell with the packed id 'cell ids[n]'
+        (sorted, see 'cellid.unpack_indices') and its adjacents are the rows
+        indices[indptr[n]:indptr[n + 1]].
+
+        If 'sparse' is True, (cell ids, SciPy sparse adjacency matrix) is
+        returned instead.
+        """
+        pass
+
+    @abstractmethod
+    def enable_profiling(self, callback: Optional[Callable[[str, float],
+                                                           None]] = None,
+                         reset: bool = True) -> None:
+        """
+        Count and time the calls of the search of the grid - searches, node
+        expansions, visibility tests, point locations, tile builds, plans and
+        queries, and the polygon and tile cache hits/misses - readable by
+        'profile_stats'. The 'callback' is called
+        after every counted call with its probe name and duration.
+        If 'reset' is True, the statistics of the previous profiling are
+        set to zero.
+        The profiling costs nothing until it is enabled.
+        """
+        pass
+
+    @abstractmethod
+    def disable_profiling(self) -> None:
+        """
+        Stop the profiling (the statistics are kept in 'profile_stats').
+        """
+        pass
+
+    @abstractmethod
+    def track_changes(self, max_changes: int = 1_000_000) -> int:
+        """
+        Start logging the cells whose values are written or deleted (if not
+        logged already) and return the token of the current state for
+        'changes_since'. The log keeps at most 'max_changes' of the latest
+        changes.
+        """
+        pass
+
+    @abstractmethod
+    def stop_tracking_changes(self) -> None:
+        """
+        Stop logging the changes of the values (the log is discarded). The
+        tokens taken so far stay too old ('changes_since' returns None for
+        them) even if the tracking is started again.
+        """
+        pass
+
+    @abstractmethod
+    def changes_since(self, token: int) \
+            -> Tuple[int, Optional[Dict[Layer, np.ndarray]]]:
+        """
+        Return the token of the current state and the cells whose values
+        were written or deleted since the 'token' - {layer: sorted unique
+        cell ids} of both layers ('rgba' and 'num'), see 'cellid'.
+        The cells are None if the 'token' is older than the kept log (all
+        the values have to be scanned again).
         """
         pass
 
@@ -104,9 +238,144 @@ class SemiregularGridInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def cell_vertices(self, index: Tuple[int, int, int]) \
+            -> List[Tuple[int, int, int]]:
+        """
+        For a given cell with 'index' (i, j, k), get the ids (i, j, v) of the
+        cell's vertices (in the order of the polygon's vertices).
+        A vertex is identified by the unit block (i, j) it belongs to and its
+        type 'v' within the block (see 'total_vertex_types'), so every vertex
+        shared by several cells has exactly one id.
+        """
+        pass
+
+    @abstractmethod
+    def cell_edges(self, index: Tuple[int, int, int]) \
+            -> List[Tuple[int, int, int]]:
+        """
+        For a given cell with 'index' (i, j, k), get the ids (i, j, e) of the
+        cell's edges - the n-th edge joins the n-th and the next vertex (see
+        'cell_vertices').
+        An edge is identified by the unit block (i, j) it belongs to and its
+        type 'e' within the block (see 'total_edge_types').
+        """
+        pass
+
+    @abstractmethod
+    def vertex_cells(self, vertex: Tuple[int, int, int]) \
+            -> List[Tuple[int, int, int]]:
+        """
+        Get the indices of the cells around the 'vertex' (i, j, v)
+        (counterclockwise).
+        """
+        pass
+
+    @abstractmethod
+    def vertex_edges(self, vertex: Tuple[int, int, int]) \
+            -> List[Tuple[int, int, int]]:
+        """
+        Get the ids of the edges ending at the 'vertex' (i, j, v)
+        (counterclockwise).
+        """
+        pass
+
+    @abstractmethod
+    def edge_cells(self, edge: Tuple[int, int, int]) \
+            -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+        """
+        Get the indices of the two cells sharing the 'edge' (i, j, e) (the
+        lower index first).
+        """
+        pass
+
+    @abstractmethod
+    def edge_vertices(self, edge: Tuple[int, int, int]) \
+            -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+        """
+        Get the ids of the two end-points of the 'edge' (i, j, e) (in the
+        order of the vertices of the first cell of 'edge_cells').
+        """
+        pass
+
+    @abstractmethod
+    def vertex_to_coords(self, vertex: Tuple[int, int, int]) \
+            -> Tuple[float, float]:
+        """
+        Convert the id of the 'vertex' (i, j, v) into its xy coordinates.
+        """
+        pass
+
+    @abstractmethod
+    def value_pyramid(self, layer: Layer = 'num',
+                      levels: int = 8) -> ValuePyramid:
+        """
+        Get the multi-resolution pyramid of the values of the 'layer'
+        ('rgba' or 'num') - statistics of the values aggregated by blocks of
+        2^L x 2^L unit blocks for each level L < 'levels'.
+        The pyramid is created on the first request and then kept up to date
+        on every write of the values.
+        """
+        pass
+
+    @abstractmethod
+    def sample(self, xy: np.ndarray, layer: Layer = 'num',
+               method: str = 'nearest') -> np.ndarray:
+        """
+        Return the values of the 'layer' ('rgba' or 'num') at the (N, 2)
+        array of points 'xy' - (N,) array of numerical values (NaN where
+        there is none) or (N, 4) array of colours (transparent where there
+        is none). The 'method' is one of:
+            * 'nearest' - the value of the cell containing the point
+            * 'idw' - inverse distance weighting of the values of the cell
+                and of its adjacents
+            * 'barycentric' - linear interpolation within the triangle of
+                the neighbouring centres (of the dual graph) containing the
+                point
+        The cells without a value are left out of the interpolation.
+        """
+        pass
+
+    @abstractmethod
+    def zonal_stats(self, geometries: Sequence[Any], layer: Layer = 'num',
+                    stats: Sequence[str] = ('count', 'sum', 'mean'),
+                    weighting: str = 'centre',
+                    bins: Optional[Sequence[float]] = None,
+                    workers: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Return the statistics of the values of the 'layer' ('rgba' or 'num')
+        in each of the 'geometries' (polygons given as (N, 2) arrays of their
+        vertices, (exterior, holes) tuples or objects with
+        '__geo_interface__', e.g. of Shapely) - {stat: array over the
+        geometries} of the 'stats': 'count', 'sum', 'mean', 'min', 'max',
+        'std' and 'histogram' (of the given edges of the 'bins').
+        If 'weighting' is 'centre', a cell belongs to the geometry if its
+        centre is inside; if it is 'area', the cell is weighted by the
+        fraction of its area inside the geometry.
+        Neighbouring geometries share the candidate cells. If 'workers' is
+        given, the cells of the geometries are found by a pool of 'workers'
+        processes.
+        """
+        pass
+
+    @abstractmethod
+    def values_in_range(self, area_range: Tuple[Tuple[float, float],
+                                                Tuple[float, float]],
+                        layer: Layer = 'num') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the values of the 'layer' ('rgba' or 'num') assigned to the cells
+        visible within the 'area_range' as (cell_ids, values) arrays:
+        sorted (N,) ids and (N,) numerical values or (N, 4) RGBA values.
+        The cells with a value are indexed by their ids (on the first request,
+        then on every write), so the cost depends on the size of the range.
+        """
+        pass
+
     @abstractmethod
     def delete_values(self, del_rgba: bool = False, del_num: bool = False,
                       keep_indices: Optional[List[Tuple[int, int, int]]] =
+                      None,
+                      indices: Optional[List[Tuple[int, int, int]]] =
                       None) -> None:
         """
         Delete all assigned values in the grid.
@@ -115,5 +384,48 @@ class SemiregularGridInterface(ABC):
 
         To preserve specific entries, provide their indices in 'keep_indices'
         (their values will be excluded from deletion).
+        To delete only specific entries, provide their indices in 'indices'
+        (the cost is then proportional to their number, not to the number
+        of all the values).
+        """
+        pass
+
+    @abstractmethod
+    def share_values(self, layers: Sequence[Layer] = ('rgba', 'num')) \
+            -> GridHandle:
+        """
+        Move the values of the 'layers' ('rgba' and/or 'num') into shared
+        memory and return the grid handle - a small picklable object (the
+        grid's configuration and the names of the shared blocks) whose
+        'open()' gives, in another process, the grid viewing the same values
+        without copying them.
+        The cells of a shared layer are fixed: their values can be written
+        (by any process, each to its own cells), but no cell can be added or
+        deleted until 'unshare_values' is called.
+        """
+        pass
+
+    @abstractmethod
+    def unshare_values(self) -> None:
+        """
+        Copy the values of the shared layers back into the grid and release
+        the shared memory (the handles are no longer valid).
+        """
+        pass
+
+    @abstractmethod
+    def write_shared_values(self, cell_ids: np.ndarray, values: np.ndarray,
+                            layer: Layer = 'num') -> None:
+        """
+        Write the 'values' ((N,) or (N, 4) array) of the cells with the
+        packed 'cell_ids' (see 'cellid') into the shared 'layer' at once.
+        """
+        pass
+
+    @abstractmethod
+    def refresh_shared_values(self) -> None:
+        """
+        Update the caches of the shared layers (spatial index revision and
+        pyramids) after other processes have written into them.
         """
         pass
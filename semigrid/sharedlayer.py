@@ -0,0 +1,281 @@
+"""
+Value layers backed by shared memory.
+
+A shared layer keeps the sorted ids (see 'cellid') of the cells of one layer
+and their values in two blocks of 'multiprocessing.shared_memory' - the same
+arrays the spatial index of the values works on (see 'ValueIndex'). A grid
+handle (the grid's configuration and the names of the blocks) is all that
+is sent to a worker process; the worker's grid views the blocks without
+copying them, so all the processes read the same values and every process
+can write the values of its own part of the cells in place.
+
+The cells of a shared layer are fixed - the values of its cells can be
+changed, but no cell can be added or deleted. The writes of the processes
+are not synchronised with each other (the writes of different processes
+should go to different cells) and the other processes' caches of the
+renderings, pyramids and change logs do not see them.
+
+'multiprocessing' is imported only when a layer is shared.
+"""
+import sys
+import weakref
+from threading import Lock
+from typing import Tuple, Dict, List, Iterator, Any, Type, TypeVar, \
+    MutableMapping, ValuesView, ItemsView, TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.cellid import IJ_BIAS, pack_indices, unpack_indices
+from semigrid.pyramid import Layer
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+    from semigrid.parallel import GridConfig
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+# (layer, name of the block of the ids, name of the block of the values,
+#  number of the cells)
+SharedLayerSpec = Tuple[Layer, str, str, int]
+
+Index = Tuple[int, int, int]
+Colour = Tuple[float, float, float, float]
+V = TypeVar('V')
+
+# {(grid class, config, layers): grid} opened by this (worker) process
+_opened_grids: Dict[Tuple[Any, ...], 'SemiregularGrid'] = {}
+
+# serialises the blocks' creation with their attaching before Python 3.13
+# (see '_attach_block')
+_tracker_lock = Lock()
+
+
+def _create_block(size: int) -> 'SharedMemory':
+    from multiprocessing.shared_memory import SharedMemory
+    with _tracker_lock:
+        return SharedMemory(create=True, size=max(size, 1))
+
+
+def _attach_block(name: str) -> 'SharedMemory':
+    """
+    Attach the existing block without tracking it - the block belongs to
+    the process that created it and must outlive the workers.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # before Python 3.13 every attached block is registered with the
+    # resource tracker (shared with the creator by the forked workers), so
+    # the registration is skipped - the blocks of this module are not
+    # created meanwhile, so none of them loses its registration
+    from multiprocessing import resource_tracker
+    with _tracker_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _release(blocks: List['SharedMemory'], owner: bool) -> None:
+    for block in blocks:
+        block.close()
+        if owner:
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedLayer:
+    """
+    Sorted ids of the cells of one layer ('rgba' or 'num') and their values
+    ((N,) or (N, 4) array) in shared memory. The blocks are released when
+    the layer is closed (or garbage collected) and unlinked if the layer
+    created them.
+    """
+    def __init__(self, layer: Layer, ids_block: 'SharedMemory',
+                 values_block: 'SharedMemory', count: int,
+                 owner: bool) -> None:
+        self.layer = layer
+        self._blocks = [ids_block, values_block]
+        shape = (count, 4) if layer == 'rgba' else (count,)
+        self.ids = np.ndarray((count,), dtype=np.int64, buffer=ids_block.buf)
+        self.values = np.ndarray(shape, dtype=np.float64,
+                                 buffer=values_block.buf)
+        self._finalizer = weakref.finalize(self, _release, self._blocks,
+                                           owner)
+
+    @classmethod
+    def create(cls, layer: Layer, ids: np.ndarray,
+               values: np.ndarray) -> 'SharedLayer':
+        """Share the sorted 'ids' and their 'values' (copied once)."""
+        ids_block = _create_block(ids.nbytes)
+        values_block = _create_block(values.nbytes)
+        shared = cls(layer, ids_block, values_block, len(ids), True)
+        shared.ids[:] = ids
+        shared.values[:] = values
+        return shared
+
+    @classmethod
+    def attach(cls, spec: SharedLayerSpec) -> 'SharedLayer':
+        """View the blocks of the layer shared by another process."""
+        layer, ids_name, values_name, count = spec
+        if layer not in ('rgba', 'num'):
+            raise Exception("Layer must be 'rgba' or 'num'.")
+        return cls(layer, _attach_block(ids_name),
+                   _attach_block(values_name), count, False)
+
+    @property
+    def spec(self) -> SharedLayerSpec:
+        """Everything another process needs to attach the layer."""
+        return self.layer, self._blocks[0].name, self._blocks[1].name, \
+            len(self.ids)
+
+    def close(self) -> None:
+        """Release the blocks (and unlink them if the layer created them)."""
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.values = np.zeros((0, 4) if self.layer == 'rgba' else 0)
+        self._finalizer()
+
+    def rows(self, ids: np.ndarray) -> np.ndarray:
+        """Rows of the cells with the 'ids', -1 of those not in the layer."""
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        if len(self.ids) == 0:
+            return np.full(len(ids), -1, dtype=np.int64)
+        rows = np.minimum(np.searchsorted(self.ids, ids), len(self.ids) - 1)
+        return np.where(self.ids[rows] == ids, rows, -1)
+
+    def write(self, ids: np.ndarray, values: np.ndarray) -> None:
+        """Write the 'values' of the cells with the 'ids' in place."""
+        rows = self.rows(ids)
+        if np.any(rows < 0):
+            raise Exception("Cells of a shared layer cannot be added.")
+        self.values[rows] = np.asarray(values, dtype=np.float64).reshape(
+            (len(rows), *self.values.shape[1:]))
+
+
+class SharedValues(MutableMapping[Index, V]):
+    """
+    {(i, j, k): value} view of a shared layer - it replaces the dictionary
+    of the values of the layer in the grid (see 'SharedNumValues' and
+    'SharedRgbaValues'). Its views of the values and the items read all the
+    values at once.
+    """
+    def __init__(self, shared: SharedLayer) -> None:
+        self.shared = shared
+
+    def _row(self, index: Index) -> int:
+        i, j, _ = index
+        if not (-IJ_BIAS <= i < IJ_BIAS and -IJ_BIAS <= j < IJ_BIAS):
+            return -1
+        return int(self.shared.rows(pack_indices(np.array([index])))[0])
+
+    def _value(self, row: int) -> V:
+        raise NotImplementedError
+
+    def all_values(self) -> List[V]:
+        """All the values (in the order of the ids)."""
+        raise NotImplementedError
+
+    def __getitem__(self, index: Index) -> V:
+        row = self._row(index)
+        if row < 0:
+            raise KeyError(index)
+        return self._value(row)
+
+    def __setitem__(self, index: Index, value: V) -> None:
+        row = self._row(index)
+        if row < 0:
+            raise Exception(f"Cell {index} is not in the shared layer "
+                            f"(cells of a shared layer cannot be added).")
+        self.shared.values[row] = value
+
+    def __delitem__(self, index: Index) -> None:
+        raise Exception("Cells of a shared layer cannot be deleted.")
+
+    def __iter__(self) -> Iterator[Index]:
+        for i, j, k in unpack_indices(self.shared.ids).tolist():
+            yield i, j, k
+
+    def __len__(self) -> int:
+        return len(self.shared.ids)
+
+    def values(self) -> ValuesView[V]:
+        return _SharedValuesView(self)
+
+    def items(self) -> ItemsView[Index, V]:
+        return _SharedItemsView(self)
+
+
+class SharedNumValues(SharedValues[float]):
+    """{(i, j, k): value} view of a shared 'num' layer."""
+    def _value(self, row: int) -> float:
+        return float(self.shared.values[row])
+
+    def all_values(self) -> List[float]:
+        values: List[float] = self.shared.values.tolist()
+        return values
+
+
+class SharedRgbaValues(SharedValues[Colour]):
+    """{(i, j, k): (r, g, b, a)} view of a shared 'rgba' layer."""
+    def _value(self, row: int) -> Colour:
+        red, green, blue, alpha = self.shared.values[row].tolist()
+        return red, green, blue, alpha
+
+    def all_values(self) -> List[Colour]:
+        return [(red, green, blue, alpha) for red, green, blue, alpha in
+                self.shared.values.tolist()]
+
+
+class _SharedValuesView(ValuesView[V]):
+    def __init__(self, values: SharedValues[V]) -> None:
+        super().__init__(values)
+        self._values = values
+
+    def __iter__(self) -> Iterator[V]:
+        return iter(self._values.all_values())
+
+
+class _SharedItemsView(ItemsView[Index, V]):
+    def __init__(self, values: SharedValues[V]) -> None:
+        super().__init__(values)
+        self._values = values
+
+    def __iter__(self) -> Iterator[Tuple[Index, V]]:
+        return zip(self._values, self._values.all_values())
+
+
+class GridHandle:
+    """
+    Lightweight picklable handle of a grid with shared layers - the grid's
+    class and configuration and the specifications of its shared layers.
+    'open' creates the grid viewing the shared layers (in a worker process).
+    """
+    def __init__(self, grid_class: Type['SemiregularGrid'],
+                 config: 'GridConfig',
+                 layers: Dict[Layer, SharedLayerSpec]) -> None:
+        self.grid_class = grid_class
+        self.config = config
+        self.layers = layers
+
+    def open(self) -> 'SemiregularGrid':
+        """
+        The grid viewing the shared layers without copying them (opened once
+        per process and kept for the following calls).
+        """
+        key = (self.grid_class, self.config, tuple(sorted(
+            self.layers.items())))
+        grid = _opened_grids.get(key)
+        if grid is None:
+            grid = self.grid_class(*self.config)
+            for layer, spec in self.layers.items():
+                grid._attach_shared_layer(layer, SharedLayer.attach(spec))
+            _opened_grids[key] = grid
+        return grid
+
+    def __repr__(self) -> str:
+        return f"GridHandle({self.grid_class.__name__}, {self.config!r}, " \
+               f"{sorted(self.layers)!r})"
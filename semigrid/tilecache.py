@@ -0,0 +1,113 @@
+"""
+LRU cache of the generated tiles.
+
+The cache is bounded by the total size (in bytes) of the tiles' arrays and can
+be shared by several grids - its keys are (notation, edge size, grid rotation,
+tile id).
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Tuple, Callable
+
+from semigrid.tiles import Tile, TileId
+
+
+TileKey = Tuple[str, int, float, TileId]
+
+
+def tile_nbytes(tile: Tile) -> int:
+    """Size of the tile's arrays in bytes."""
+    return sum(array.nbytes for array in (
+        tile.ids, tile.centres, tile.bboxes, tile.polygon_offsets,
+        tile.polygon_vertices, tile.edge_owners, tile.edge_bboxes,
+        tile.edges))
+
+
+class TileCacheStats:
+    """Statistics of the tile cache."""
+    def __init__(self, hits: int, misses: int, evictions: int, tiles: int,
+                 nbytes: int) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.tiles = tiles
+        self.nbytes = nbytes
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def __repr__(self) -> str:
+        return f"TileCacheStats(hits={self.hits}, misses={self.misses}, \
+evictions={self.evictions}, tiles={self.tiles}, nbytes={self.nbytes})"
+
+
+class TileCache:
+    """
+    Least recently used tiles are evicted once the size of the cached tiles
+    exceeds 'max_bytes'.
+    """
+    def __init__(self, max_bytes: int = 64 * 2**20) -> None:
+        if max_bytes <= 0:
+            raise Exception("Cache size must be positive.")
+        self._max_bytes = max_bytes
+        self._tiles: OrderedDict[TileKey, Tile] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def stats(self) -> TileCacheStats:
+        with self._lock:
+            return TileCacheStats(self._hits, self._misses, self._evictions,
+                                  len(self._tiles), self._nbytes)
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def __contains__(self, key: TileKey) -> bool:
+        return key in self._tiles
+
+    def get(self, key: TileKey, build: Callable[[], Tile]) -> Tile:
+        """
+        Return the tile stored under the 'key'. If it is not cached, build it
+        by 'build' and store it.
+        """
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._hits += 1
+                self._tiles.move_to_end(key)
+                return tile
+            self._misses += 1
+
+        tile = build()
+        self._put(key, tile)
+        return tile
+
+    def _put(self, key: TileKey, tile: Tile) -> None:
+        """Store the 'tile' and evict the least recently used tiles."""
+        nbytes = tile_nbytes(tile)
+        with self._lock:
+            if key in self._tiles:
+                self._nbytes -= tile_nbytes(self._tiles.pop(key))
+            self._tiles[key] = tile
+            self._nbytes += nbytes
+
+            while self._nbytes > self._max_bytes and len(self._tiles) > 1:
+                _, evicted = self._tiles.popitem(last=False)
+                self._nbytes -= tile_nbytes(evicted)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all tiles (the statistics are kept)."""
+        with self._lock:
+            self._tiles.clear()
+            self._nbytes = 0
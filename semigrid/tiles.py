@@ -0,0 +1,429 @@
+"""
+Lattice-aligned tiles of the grid.
+
+The tile (ti, tj) consists of all cells (i, j, k) whose unit block satisfies
+    ti * tile_size <= i < (ti + 1) * tile_size,
+    tj * tile_size <= j < (tj + 1) * tile_size.
+Every cell therefore belongs to exactly one tile and the results generated
+for different tiles can be concatenated without duplicates.
+"""
+import math
+from typing import Tuple, List, Literal, Optional, Callable, \
+    TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.cellid import pack_indices
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+AreaRange = Tuple[Tuple[float, float], Tuple[float, float]]
+TileId = Tuple[int, int]
+Output = Literal['centres', 'polygons', 'edges']
+
+# number of unit blocks along each side of a tile
+TILE_SIZE = 16
+
+
+def bboxes_visible(bboxes: np.ndarray, area_range: AreaRange) -> np.ndarray:
+    """
+    Answer (for each row [min_x, min_y, max_x, max_y] of 'bboxes') whether
+    the bounding box is intersecting the 'area_range'.
+    """
+    range_min, range_max = area_range
+    return (range_min[0] < bboxes[:, 2]) & (bboxes[:, 0] < range_max[0]) \
+        & (range_min[1] < bboxes[:, 3]) & (bboxes[:, 1] < range_max[1])
+
+
+class Tile:
+    """
+    Cells of one tile (all of them, regardless of any area range).
+
+    * ids - (N) array of the cell ids (see 'cellid')
+    * centres - (N, 2) array of the cells' centres
+    * bboxes - (N, 4) array of the polygons' bounding boxes
+    * polygon_offsets - (N + 1) array, the vertices of the n-th polygon are
+        polygon_vertices[polygon_offsets[n]:polygon_offsets[n + 1]]
+    * polygon_vertices - (V, 2) array of the polygons' vertices
+    * edge_owners - (E) array, the row of the cell the edge belongs to
+    * edge_bboxes - (E, 4) array, bounding box of the other cell of the edge
+    * edges - (E, 2, 2) array of the edges' end-points
+    """
+    def __init__(self, tile_id: TileId,
+                 ids: np.ndarray, centres: np.ndarray,
+                 bboxes: np.ndarray, polygon_offsets: np.ndarray,
+                 polygon_vertices: np.ndarray, edge_owners: np.ndarray,
+                 edge_bboxes: np.ndarray, edges: np.ndarray) -> None:
+        self.tile_id = tile_id
+        self.ids = ids
+        self.centres = centres
+        self.bboxes = bboxes
+        self.polygon_offsets = polygon_offsets
+        self.polygon_vertices = polygon_vertices
+        self.edge_owners = edge_owners
+        self.edge_bboxes = edge_bboxes
+        self.edges = edges
+
+    def visible(self, area_range: AreaRange) -> np.ndarray:
+        """Mask of the cells visible within the 'area_range'."""
+        return bboxes_visible(self.bboxes, area_range)
+
+    def select_centres(self, area_range: AreaRange) \
+            -> Tuple[np.ndarray, np.ndarray]:
+        """Ids and centres of the cells visible within the range."""
+        mask = self.visible(area_range)
+        return self.ids[mask], self.centres[mask]
+
+    def select_polygons(self, area_range: AreaRange) \
+            -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Ids, polygon offsets and polygon vertices of the cells visible within
+        the range.
+        """
+        mask = self.visible(area_range)
+        counts = np.diff(self.polygon_offsets)
+        offsets = np.zeros(int(mask.sum()) + 1, dtype=np.int64)
+        np.cumsum(counts[mask], out=offsets[1:])
+        vertices = self.polygon_vertices[np.repeat(mask, counts)]
+        return self.ids[mask], offsets, vertices
+
+    def select_edges(self, area_range: AreaRange) -> np.ndarray:
+        """Edges between the cells visible within the range."""
+        mask = self.visible(area_range)[self.edge_owners] & \
+            bboxes_visible(self.edge_bboxes, area_range)
+        edges: np.ndarray = self.edges[mask]
+        return edges
+
+    def select(self, area_range: AreaRange, output: Output) \
+            -> Tuple[np.ndarray, ...]:
+        """
+        Select the 'output' of the cells visible within the range:
+            * centres - (ids, centres)
+            * polygons - (ids, polygon offsets, polygon vertices)
+            * edges - (edges, )
+        """
+        if output == 'centres':
+            return self.select_centres(area_range)
+        if output == 'polygons':
+            return self.select_polygons(area_range)
+        return (self.select_edges(area_range),)
+
+
+_EMPTY_TILE = Tile((0, 0), np.zeros(0, dtype=np.int64), np.zeros((0, 2)),
+                   np.zeros((0, 4)), np.zeros(1, dtype=np.int64),
+                   np.zeros((0, 2)), np.zeros(0, dtype=np.int64),
+                   np.zeros((0, 4)), np.zeros((0, 2, 2)))
+
+
+class TileBuilder:
+    """
+    Builder of the tiles of the given grid. The templates (polygon vertices,
+    adjacency and edges of each cell type) are computed once per builder.
+    """
+    def __init__(self, grid: 'SemiregularGrid',
+                 tile_size: int = TILE_SIZE) -> None:
+        self.grid = grid
+        self.tile_size = tile_size
+
+        self._offsets = np.array([grid._cells_offsets[rdgnt_name]
+                                  for rdgnt_name in grid._rdgnt_names])
+        self._templates: List[np.ndarray] = []
+        for rdgnt_name in grid._rdgnt_names:
+            rdgnt = grid._rdgnt_dic[rdgnt_name]
+            self._templates.append(np.array(grid._polygon_coords(
+                (0, 0), rdgnt_name[0], rdgnt.polygon_rotation)))
+        self._template_bboxes = np.array([
+            [t[:, 0].min(), t[:, 1].min(), t[:, 0].max(), t[:, 1].max()]
+            for t in self._templates])
+
+        # for each cell type: [(slot, shift, (vertex_b, vertex_a))] of the
+        # edges owned by the cell (those whose adjacent has a greater index)
+        self._owned_edges: List[List[Tuple[int, Tuple[int, int, int],
+                                           Tuple[int, int]]]] = []
+        for rdgnt_name in grid._rdgnt_names:
+            self._owned_edges.append([
+                (slot, shift, (vertex_b, vertex_a))
+                for slot, (shift, (vertex_b, vertex_a, owned)) in enumerate(
+                    zip(grid.adj_indices_shift[rdgnt_name],
+                        grid._topology.edge_templates[rdgnt_name]))
+                if owned])
+
+        self._all_adjacents = [grid.adj_indices_shift[rdgnt_name]
+                               for rdgnt_name in grid._rdgnt_names]
+
+        self._reach = max(
+            math.hypot(*offset) + max(np.hypot(t[:, 0], t[:, 1]))
+            for offset, t in zip(self._offsets, self._templates))
+
+    def _ij_bounds(self, area_range: AreaRange) -> Tuple[int, int, int, int]:
+        """
+        Bounds (min_i, max_i, min_j, max_j) of the unit blocks that may
+        contain cells visible within the range.
+        """
+        (min_x, min_y), (max_x, max_y) = area_range
+        r = self._reach
+        corners = [(x, y) for x in (min_x - r, max_x + r)
+                   for y in (min_y - r, max_y + r)]
+        approx = [self.grid._coords_to_approx_index(xy) for xy in corners]
+        return math.floor(min(i for i, _ in approx)) - 1, \
+            math.ceil(max(i for i, _ in approx)) + 1, \
+            math.floor(min(j for _, j in approx)) - 1, \
+            math.ceil(max(j for _, j in approx)) + 1
+
+    def tiles_for_range(self, area_range: AreaRange) -> List[TileId]:
+        """Ids of the tiles that may contain cells visible in the range."""
+        min_i, max_i, min_j, max_j = self._ij_bounds(area_range)
+        size = self.tile_size
+        return [(ti, tj)
+                for tj in range(min_j // size, max_j // size + 1)
+                for ti in range(min_i // size, max_i // size + 1)]
+
+    def _blocks_in_range(self, area_range: AreaRange) \
+            -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Unit blocks (i, j) that may contain cells visible within the range.
+        The blocks are scanned row by row (for each 'j' only the interval of
+        'i' whose origins are near the range), so their number is
+        proportional to the area of the range.
+        """
+        (min_x, min_y), (max_x, max_y) = area_range
+        r = self._reach
+        _, _, min_j, max_j = self._ij_bounds(area_range)
+        j = np.arange(min_j, max_j + 1)
+        low = np.full(len(j), -np.inf)
+        high = np.full(len(j), np.inf)
+
+        u, v = self.grid._unit_vectors
+        # origin of the block: (i * u[d] + j * v[d]) within [lo, hi]
+        for a, b, lo, hi in ((u[0], v[0], min_x - r, max_x + r),
+                             (u[1], v[1], min_y - r, max_y + r)):
+            if a == 0:
+                high[(b * j < lo) | (hi < b * j)] = -np.inf
+                continue
+            bound_1, bound_2 = (lo - b * j) / a, (hi - b * j) / a
+            low = np.maximum(low, np.minimum(bound_1, bound_2))
+            high = np.minimum(high, np.maximum(bound_1, bound_2))
+
+        valid = np.isfinite(low) & np.isfinite(high) & (low <= high)
+        low = np.where(valid, np.floor(np.where(valid, low, 0)) - 1, 0)
+        high = np.where(valid, np.ceil(np.where(valid, high, 0)) + 1, -1)
+        counts = (high - low + 1).astype(np.int64)
+        starts = np.cumsum(counts) - counts
+        i = np.repeat(low.astype(np.int64), counts) + \
+            np.arange(counts.sum()) - np.repeat(starts, counts)
+        return i, np.repeat(j, counts)
+
+    def cells_in_range(self, area_range: AreaRange) \
+            -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Indices, centres and bounding boxes of the cells visible within
+        the range (generated without any search or tiles).
+        """
+        i, j = self._blocks_in_range(area_range)
+        origins = self._block_origins(i, j)
+
+        indices, centres, bboxes = [], [], []
+        for k, bbox in enumerate(self._template_bboxes):
+            k_centres = origins + self._offsets[k]
+            k_bboxes = np.round(np.concatenate((k_centres, k_centres),
+                                               axis=1) + bbox, 5)
+            mask = bboxes_visible(k_bboxes, area_range)
+            indices.append(np.stack((i[mask], j[mask],
+                                     np.full(mask.sum(), k)), axis=1))
+            centres.append(k_centres[mask])
+            bboxes.append(k_bboxes[mask])
+
+        return np.concatenate(indices), np.concatenate(centres), \
+            np.concatenate(bboxes)
+
+    def centres(self, indices: np.ndarray) -> np.ndarray:
+        """Centres of the cells with (i, j, k) 'indices' (see 'Tile')."""
+        centres: np.ndarray = self._block_origins(indices[:, 0],
+                                                  indices[:, 1]) + \
+            self._offsets[indices[:, 2]]
+        return centres
+
+    def bboxes(self, indices: np.ndarray) -> np.ndarray:
+        """Bounding boxes of the polygons of the cells with 'indices'."""
+        centres = self.centres(indices)
+        bboxes: np.ndarray = np.round(
+            np.concatenate((centres, centres), axis=1) +
+            self._template_bboxes[indices[:, 2]], 5)
+        return bboxes
+
+    def polygons(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Polygon offsets and polygon vertices (see 'Tile') of the cells with
+        'indices', in their order.
+        """
+        centres = self.centres(indices)
+        counts = np.array([len(t) for t in self._templates])[indices[:, 2]]
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        vertices = np.zeros((offsets[-1], 2))
+        for k, template in enumerate(self._templates):
+            mask = indices[:, 2] == k
+            rows = offsets[:-1][mask][:, None] + np.arange(len(template))
+            vertices[rows.reshape(-1)] = np.round(
+                centres[mask][:, None, :] + template, 5).reshape(-1, 2)
+        return offsets, vertices
+
+    def owned_edges(self, indices: np.ndarray,
+                    within: Optional[Callable[[np.ndarray], np.ndarray]] =
+                    None) -> np.ndarray:
+        """
+        (E, 2, 2) array of the edges owned by the cells with 'indices' (the
+        edges to the adjacents having a greater index). If 'within' is given,
+        only the edges to the adjacents it answers True for (given an (M, 3)
+        array of their indices) are included.
+        """
+        edges, _ = self.owned_edges_by_cell(indices, within)
+        return edges
+
+    def owned_edges_by_cell(self, indices: np.ndarray,
+                            within: Optional[Callable[[np.ndarray],
+                                                      np.ndarray]] = None) \
+            -> Tuple[np.ndarray, np.ndarray]:
+        """
+        'owned_edges' of the cells with 'indices' and the (E) array of the
+        rows of their owners within 'indices'.
+        """
+        centres = self.centres(indices)
+        edges = []
+        owners = []
+        for k, template in enumerate(self._templates):
+            mask = indices[:, 2] == k
+            rows = np.flatnonzero(mask)
+            vertices = np.round(centres[mask][:, None, :] + template, 5)
+            for _, (di, dj, dk), (vertex_b, vertex_a) in \
+                    self._owned_edges[k]:
+                found = np.ones(len(rows), dtype=bool)
+                if within is not None:
+                    adjacents = indices[mask] + (di, dj, 0)
+                    adjacents[:, 2] = dk
+                    found = within(adjacents)
+                edges.append(np.stack((vertices[found, vertex_b],
+                                       vertices[found, vertex_a]), axis=1))
+                owners.append(rows[found])
+
+        if not edges:
+            return np.zeros((0, 2, 2)), np.zeros(0, dtype=np.int64)
+        return np.concatenate(edges), np.concatenate(owners)
+
+    def _block_origins(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Coordinates of the origins of the unit blocks (i, j)."""
+        u, v = self.grid._unit_vectors
+        return np.stack((i * u[0] + j * v[0], i * u[1] + j * v[1]), axis=1)
+
+    def dual_edges(self, indices: np.ndarray, centres: np.ndarray) \
+            -> np.ndarray:
+        """
+        (E, 2, 2) array of the edges of the dual graph between the given
+        cells (with 'centres') and all their adjacents.
+        """
+        dual = []
+        for k, shifts in enumerate(self._all_adjacents):
+            mask = indices[:, 2] == k
+            i, j = indices[mask, 0], indices[mask, 1]
+            for di, dj, dk in shifts:
+                adj_centres = self._block_origins(i + di, j + dj) + \
+                    self._offsets[dk]
+                dual.append(np.stack((centres[mask], adj_centres), axis=1))
+
+        return np.concatenate(dual) if dual else np.zeros((0, 2, 2))
+
+    def build(self, tile_id: TileId) -> Tile:
+        """Build the tile with the given id."""
+        size = self.tile_size
+        ti, tj = tile_id
+        j, i = np.divmod(np.arange(size * size), size)
+        i = i + ti * size
+        j = j + tj * size
+        origins = self._block_origins(i, j)
+
+        indices, centres, bboxes, vertices, counts = [], [], [], [], []
+        edge_owners, edge_bboxes, edges = [], [], []
+        row = 0
+        for k, template in enumerate(self._templates):
+            k_centres = origins + self._offsets[k]
+            k_vertices = np.round(k_centres[:, None, :] + template, 5)
+
+            indices.append(np.stack((i, j, np.full_like(i, k)), axis=1))
+            centres.append(k_centres)
+            bboxes.append(np.concatenate((k_vertices.min(axis=1),
+                                          k_vertices.max(axis=1)), axis=1))
+            vertices.append(k_vertices.reshape(-1, 2))
+            counts.append(np.full(len(i), len(template)))
+
+            owners = np.arange(row, row + len(i))
+            for _, (di, dj, dk), (vertex_b, vertex_a) in \
+                    self._owned_edges[k]:
+                adj_centres = self._block_origins(i + di, j + dj) + \
+                    self._offsets[dk]
+                edge_owners.append(owners)
+                edge_bboxes.append(np.round(np.concatenate(
+                    (adj_centres, adj_centres), axis=1) +
+                    self._template_bboxes[dk], 5))
+                edges.append(np.stack((k_vertices[:, vertex_b],
+                                       k_vertices[:, vertex_a]), axis=1))
+            row += len(i)
+
+        polygon_offsets = np.zeros(row + 1, dtype=np.int64)
+        np.cumsum(np.concatenate(counts), out=polygon_offsets[1:])
+        return Tile(tile_id, pack_indices(np.concatenate(indices)),
+                    np.concatenate(centres),
+                    np.concatenate(bboxes), polygon_offsets,
+                    np.concatenate(vertices), np.concatenate(edge_owners),
+                    np.concatenate(edge_bboxes), np.concatenate(edges))
+
+
+def concatenate(parts: List[Tuple[np.ndarray, ...]], output: Output) \
+        -> Tuple[np.ndarray, ...]:
+    """Concatenate the selections ('Tile.select') of several tiles."""
+    if not parts:
+        return _EMPTY_TILE.select(((0, 0), (0, 0)), output)
+
+    if output == 'polygons':
+        ids = [part[0] for part in parts]
+        vertices = [part[2] for part in parts]
+        counts = [np.diff(part[1]) for part in parts]
+        offsets = np.zeros(sum(len(c) for c in counts) + 1, dtype=np.int64)
+        np.cumsum(np.concatenate(counts), out=offsets[1:])
+        return np.concatenate(ids), offsets, np.concatenate(vertices)
+
+    return tuple(np.concatenate(arrays) for arrays in zip(*parts))
+
+
+def split_polygons(offsets: np.ndarray, vertices: np.ndarray) \
+        -> List[List[Tuple[float, float]]]:
+    """Split the flat 'vertices' into a list of polygons by 'offsets'."""
+    flat = [tuple(vertex) for vertex in vertices.tolist()]
+    bounds = offsets.tolist()
+    return [flat[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def to_edge_list(edges: np.ndarray) \
+        -> List[Tuple[Tuple[float, float], Tuple[float, float]]]:
+    """Convert an (E, 2, 2) array of edges into a list of edges."""
+    return [(tuple(a), tuple(b)) for a, b in edges.tolist()]
+
+
+def to_point_list(points: np.ndarray) -> List[Tuple[float, float]]:
+    """Convert an (N, 2) array of points into a list of points."""
+    return [tuple(point) for point in points.tolist()]
+
+
+def group_tiles(tile_ids: List[TileId], groups: int) \
+        -> List[List[TileId]]:
+    """Split 'tile_ids' into at most 'groups' contiguous groups."""
+    groups = max(1, min(groups, len(tile_ids)))
+    size, rest = divmod(len(tile_ids), groups)
+    result: List[List[TileId]] = []
+    start = 0
+    for g in range(groups):
+        end = start + size + (1 if g < rest else 0)
+        result.append(tile_ids[start:end])
+        start = end
+    return result
@@ -0,0 +1,429 @@
+"""
+Headless rendering of the values of a grid into PNG map tiles.
+
+The tiles are addressed by the slippy map (z, x, y) scheme: the world range
+(by default the Web Mercator square, so the xy coordinates of the grid are
+taken as EPSG:3857 metres) is divided into 2^z x 2^z tiles, the tile (0, 0)
+is at the top-left corner. A tile is rasterised directly into a NumPy buffer
+(see 'raster.rasterise'; the colours are converted once per run of the
+pixels of the same cell), encoded into a PNG by zlib and kept in an LRU
+cache (and optionally in another one on disk). The tiles without any values
+near them are not rasterised at all.
+
+A small local HTTP server ('serve') exposes the tiles as /{z}/{x}/{y}.png.
+"""
+import os
+import struct
+import tempfile
+import weakref
+import zlib
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+from typing import Tuple, List, Optional, Callable, Type
+
+import numpy as np
+
+from semigrid.pyramid import Layer
+from semigrid.raster import _value_runs
+from semigrid.semiregulargrid import SemiregularGrid
+from semigrid.tiles import AreaRange
+
+
+TileAddress = Tuple[int, int, int]
+Colour = Tuple[float, float, float, float]
+
+# half of the side of the Web Mercator square (EPSG:3857) in metres
+ORIGIN_SHIFT = 20037508.342789244
+WEB_MERCATOR: AreaRange = ((-ORIGIN_SHIFT, -ORIGIN_SHIFT),
+                           (ORIGIN_SHIFT, ORIGIN_SHIFT))
+MAX_ZOOM = 30
+
+
+def is_valid_address(address: TileAddress) -> bool:
+    """Whether the (z, x, y) 'address' is of an existing tile."""
+    z, x, y = address
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2**z and 0 <= y < 2**z
+
+
+def tile_bounds(address: TileAddress, world: AreaRange = WEB_MERCATOR) \
+        -> AreaRange:
+    """Area range of the tile with the (z, x, y) 'address'."""
+    if not is_valid_address(address):
+        raise Exception(f"Invalid tile address {address}.")
+    z, x, y = address
+    (min_x, min_y), (max_x, max_y) = world
+    width, height = (max_x - min_x) / 2**z, (max_y - min_y) / 2**z
+    return (min_x + x * width, max_y - (y + 1) * height), \
+        (min_x + (x + 1) * width, max_y - y * height)
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    """Encode the (H, W, 4) uint8 RGBA 'image' (rows from the top)."""
+    height, width = image.shape[:2]
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + \
+            struct.pack('>I', zlib.crc32(kind + data))
+
+    # every row starts with the filter type 0 (none)
+    rows = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    rows[:, 1:] = image.reshape(height, width * 4)
+    return b'\x89PNG\r\n\x1a\n' + \
+        chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0,
+                                   0)) + \
+        chunk(b'IDAT', zlib.compress(rows.tobytes(), 1)) + \
+        chunk(b'IEND', b'')
+
+
+# files of the dropped tiles and the directory of their key (if all the
+# tiles of the key are dropped)
+Removal = Tuple[List[str], Optional[str]]
+
+
+def _remove_files(removal: Removal) -> None:
+    """Remove the files and then the empty directories of the key."""
+    paths, directory = removal
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    if directory is not None:
+        for root, _, _ in os.walk(directory, topdown=False):
+            try:
+                os.rmdir(root)
+            except OSError:
+                pass
+
+
+class _DiskTiles:
+    """
+    LRU cache of at most 'max_bytes' of the tiles written by one renderer
+    into its own new directory in the 'cache_dir' as key/z/x/y-n.png (every
+    write n has its own file, so a file is never written again after it is
+    recorded). The tiles are dropped by switching to a new key; only the
+    files written by the renderer (and the directories of the old keys left
+    empty) are ever removed. The methods only keep the records (under the
+    lock of the renderer) and return what is to be removed.
+    """
+    def __init__(self, cache_dir: str, max_bytes: int) -> None:
+        os.makedirs(cache_dir, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix='semigrid-tiles-',
+                                          dir=cache_dir)
+        self.max_bytes = max_bytes
+        self.key = 0
+        self.writes = 0
+        # {address: (path, size)} of the tiles of the key
+        self.files: OrderedDict[TileAddress, Tuple[str, int]] = \
+            OrderedDict()
+        self.nbytes = 0
+
+    def key_directory(self) -> str:
+        return os.path.join(self.directory, str(self.key))
+
+    def new_path(self, address: TileAddress) -> str:
+        """Path of a new file of the tile."""
+        z, x, y = address
+        self.writes += 1
+        return os.path.join(self.key_directory(), str(z), str(x),
+                            f"{y}-{self.writes}.png")
+
+    def get(self, address: TileAddress) -> Optional[str]:
+        """Path of the stored tile (None if it is not stored)."""
+        entry = self.files.get(address)
+        if entry is None:
+            return None
+        self.files.move_to_end(address)
+        return entry[0]
+
+    def add(self, address: TileAddress, path: str, size: int) -> Removal:
+        """Record the written tile; the replaced and the evicted files."""
+        evicted = []
+        entry = self.files.pop(address, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+            evicted.append(entry[0])
+        self.files[address] = path, size
+        self.nbytes += size
+        while self.nbytes > self.max_bytes and len(self.files) > 1:
+            _, (evicted_path, evicted_size) = self.files.popitem(last=False)
+            self.nbytes -= evicted_size
+            evicted.append(evicted_path)
+        return evicted, None
+
+    def switch_key(self) -> Removal:
+        """Drop all the tiles (a new key); the files of the old key."""
+        paths = [path for path, _ in self.files.values()]
+        directory = self.key_directory()
+        self.files.clear()
+        self.nbytes = 0
+        self.key += 1
+        return paths, directory
+
+    def close(self) -> None:
+        """Remove all the files of the tiles and the directory."""
+        paths, _ = self.switch_key()
+        _remove_files((paths, self.directory))
+
+
+class TileRenderer:
+    """
+    PNG tiles of the values of the 'layer' of the 'grid':
+    * rgba - the colours of the cells
+    * num - the values mapped linearly from 'value_range' (by default the
+        range of all the values) to the 'colours' (low, high)
+    The cells without a value are transparent. The rendered tiles are kept
+    in an LRU cache of at most 'max_bytes' and, if 'cache_dir' is given, in
+    another one of at most 'max_disk_bytes' on disk (in a new directory of
+    the renderer in the 'cache_dir', removed by 'close' or when the renderer
+    is garbage collected). Both caches are dropped whenever the values
+    change and by 'invalidate'.
+    """
+    def __init__(self, grid: SemiregularGrid, layer: Layer = 'rgba',
+                 tile_size: int = 256, world: AreaRange = WEB_MERCATOR,
+                 value_range: Optional[Tuple[float, float]] = None,
+                 colours: Tuple[Colour, Colour] = ((0, 0, 0, 1),
+                                                   (1, 1, 1, 1)),
+                 max_bytes: int = 64 * 2**20,
+                 cache_dir: Optional[str] = None,
+                 max_disk_bytes: int = 2**30) -> None:
+        if layer not in ('rgba', 'num'):
+            raise Exception("Layer must be 'rgba' or 'num'.")
+        if tile_size <= 0:
+            raise Exception("Tile size must be positive.")
+        if max_bytes <= 0 or max_disk_bytes <= 0:
+            raise Exception("Cache size must be positive.")
+        self._grid = grid
+        self._layer = layer
+        self._tile_size = tile_size
+        self._world = world
+        self._value_range = value_range
+        self._colours = np.array(colours, dtype=np.float64)
+        self._max_bytes = max_bytes
+
+        self._tiles: OrderedDict[TileAddress, bytes] = OrderedDict()
+        self._nbytes = 0
+        self._disk: Optional[_DiskTiles] = None
+        if cache_dir is not None:
+            self._disk = _DiskTiles(cache_dir, max_disk_bytes)
+            self._finalizer = weakref.finalize(self, self._disk.close)
+        # revision of the values the caches are of and the number of the
+        # drops of the caches (the tiles rendered before a drop are not
+        # stored)
+        self._revision = -1
+        self._generation = 0
+        self._auto_range: Optional[Tuple[float, float]] = None
+        self._lock = Lock()
+        self._empty_tile = encode_png(
+            np.zeros((tile_size, tile_size, 4), dtype=np.uint8))
+
+    @property
+    def tile_size(self) -> int:
+        return self._tile_size
+
+    def tile(self, address: TileAddress) -> bytes:
+        """PNG of the tile with the (z, x, y) 'address'."""
+        area_range = tile_bounds(address, self._world)
+        value_index = self._grid._value_index(self._layer)
+        removed: Removal = ([], None)
+        with self._lock:
+            if value_index.revision != self._revision:
+                removed = self._drop()
+                self._revision = value_index.revision
+            generation = self._generation
+            png = self._tiles.get(address)
+            if png is not None:
+                self._tiles.move_to_end(address)
+            path = None if self._disk is None else self._disk.get(address)
+        self._remove(removed)
+        if png is not None:
+            return png
+
+        if path is not None:
+            try:
+                with open(path, 'rb') as file:
+                    png = file.read()
+            except FileNotFoundError:
+                # evicted or dropped meanwhile (by another thread)
+                pass
+        if png is None:
+            png = self._render(area_range)
+            self._write(address, png, generation)
+        self._put(address, png, generation)
+        return png
+
+    def _write(self, address: TileAddress, png: bytes,
+               generation: int) -> None:
+        """Write the tile rendered before the 'generation' drop to disk."""
+        with self._lock:
+            if self._disk is None or generation != self._generation:
+                return None
+            path = self._disk.new_path(address)
+            key_directory = self._disk.key_directory()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as file:
+                file.write(png)
+        except (FileNotFoundError, FileExistsError):
+            # the directory of the key was removed with the dropped tiles
+            self._remove(([path], key_directory))
+            return None
+        with self._lock:
+            if generation == self._generation:
+                removed = self._disk.add(address, path, len(png))
+            else:
+                # the caches were dropped meanwhile
+                removed = [path], key_directory
+        self._remove(removed)
+
+    def _put(self, address: TileAddress, png: bytes,
+             generation: int) -> None:
+        """
+        Store the tile rendered before the 'generation' drop of the caches
+        (unless they have been dropped since) and evict the least recently
+        used tiles.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return None
+            if address in self._tiles:
+                self._nbytes -= len(self._tiles.pop(address))
+            self._tiles[address] = png
+            self._nbytes += len(png)
+            while self._nbytes > self._max_bytes and len(self._tiles) > 1:
+                _, evicted = self._tiles.popitem(last=False)
+                self._nbytes -= len(evicted)
+
+    def invalidate(self) -> None:
+        """Remove all the rendered tiles (from the memory and the disk)."""
+        with self._lock:
+            removed = self._drop()
+        self._remove(removed)
+
+    def close(self) -> None:
+        """Remove the tiles written to the disk and their directory."""
+        if self._disk is not None:
+            self._finalizer()
+
+    def _drop(self) -> Removal:
+        """
+        Drop both caches (called under the lock); the files to be removed.
+        """
+        self._tiles.clear()
+        self._nbytes = 0
+        self._generation += 1
+        self._auto_range = None
+        return ([], None) if self._disk is None else self._disk.switch_key()
+
+    def _remove(self, removal: Removal) -> None:
+        """Remove the files of the dropped tiles (outside the lock)."""
+        _remove_files(removal)
+
+    def _has_values_near(self, area_range: AreaRange) -> bool:
+        """Whether any cell with a value may be visible within the range."""
+        with self._grid._values_lock:
+            bounds = self._grid._value_index(self._layer).bounds()
+        if bounds is None:
+            return False
+        min_i, max_i, min_j, max_j = \
+            self._grid._get_tile_builder()._ij_bounds(area_range)
+        return min_i <= bounds[1] and bounds[0] <= max_i and \
+            min_j <= bounds[3] and bounds[2] <= max_j
+
+    def _render(self, area_range: AreaRange) -> bytes:
+        """PNG of the values within the range."""
+        if not self._has_values_near(area_range):
+            return self._empty_tile
+
+        shape = (self._tile_size, self._tile_size)
+        runs, lengths = _value_runs(self._grid, area_range, shape,
+                                    self._layer)
+        if self._layer == 'num':
+            runs = self._colour(runs)
+        runs = (np.clip(runs, 0, 1) * 255 + 0.5).astype(np.uint8)
+        # PNG rows go from the top
+        return encode_png(np.repeat(runs, lengths, axis=0).reshape(
+            *shape, 4)[::-1])
+
+    def _colour(self, values: np.ndarray) -> np.ndarray:
+        """(N, 4) colours of the (N,) numerical 'values'."""
+        if self._value_range is not None:
+            low, high = self._value_range
+        else:
+            with self._lock:
+                auto_range, generation = self._auto_range, self._generation
+            if auto_range is None:
+                with self._grid._values_lock:
+                    all_values = np.fromiter(
+                        self._grid._num_values.values(), dtype=np.float64)
+                auto_range = float(all_values.min()), float(all_values.max())
+                with self._lock:
+                    if generation == self._generation:
+                        self._auto_range = auto_range
+            low, high = auto_range
+        fraction = (values - low) / (high - low) if high > low else \
+            np.zeros_like(values)
+        fraction = np.clip(fraction, 0, 1)[..., np.newaxis]
+        image: np.ndarray = (1 - fraction) * self._colours[0] + \
+            fraction * self._colours[1]
+        image[np.isnan(values)] = 0
+        return image
+
+
+def _handler(renderer: TileRenderer) -> Type[BaseHTTPRequestHandler]:
+    """Handler of the HTTP requests of the tiles of the 'renderer'."""
+    class TileHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            parts = self.path.split('?')[0].strip('/').split('/')
+            try:
+                if len(parts) != 3 or not parts[2].endswith('.png'):
+                    raise ValueError
+                address = int(parts[0]), int(parts[1]), int(parts[2][:-4])
+            except ValueError:
+                self.send_error(404)
+                return
+            if not is_valid_address(address):
+                self.send_error(404)
+                return
+            try:
+                png = renderer.tile(address)
+            except Exception:
+                self.send_error(500)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/png')
+            self.send_header('Content-Length', str(len(png)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(png)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    return TileHandler
+
+
+def make_server(renderer: TileRenderer, host: str = '127.0.0.1',
+                port: int = 8000) -> ThreadingHTTPServer:
+    """
+    HTTP server of the tiles /{z}/{x}/{y}.png of the 'renderer' (port 0
+    picks a free port); run it by 'serve_forever'.
+    """
+    return ThreadingHTTPServer((host, port), _handler(renderer))
+
+
+def serve(renderer: TileRenderer, host: str = '127.0.0.1',
+          port: int = 8000,
+          on_start: Optional[Callable[[str], None]] = print) -> None:
+    """Serve the tiles of the 'renderer' until interrupted."""
+    server = make_server(renderer, host, port)
+    if on_start is not None:
+        on_start(f"Serving tiles at http://{host}:"
+                 f"{server.server_address[1]}/{{z}}/{{x}}/{{y}}.png")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,317 @@
+"""
+Generator of 'semigrid/topology_tables.py'.
+
+The tables are derived from 'constants.py' in the unit space (edges of size
+1, no rotation):
+* adjacency shifts - (i, j) differences and 'k' of the adjacents of each
+    cell type (the centres of the adjacents are located by the half-planes)
+* edge templates - for each adjacent, the vertices (b, a) of the edge shared
+    with it and whether the edge is owned by the cell (the adjacent has
+    a greater index)
+* half-planes - convex descriptions (a, b, c) of the polygons of the cells
+    near the origin; a point (x, y) lies in the polygon if
+    a * x + b * y <= c for all its half-planes
+* cell vertices and edges - (i, j) differences and type 'v' or 'e' of the
+    vertices and the edges of each cell type (the edge 'm' joins the
+    vertices 'm' and 'm + 1'); the vertices and the edges of a unit block
+    are the points and the edge midpoints whose lattice coordinates lie
+    in [0, 1) x [0, 1), their types are numbered in the order they are
+    found (by cell type, then by vertex)
+
+Run 'python -m semigrid.topology_generator' to regenerate the tables and
+'python -m semigrid.topology_generator --check' to verify them.
+"""
+import argparse
+import math
+import os
+import sys
+from typing import Tuple, Dict, List, Optional
+
+from semigrid.constants import POSSIBLE_RDGNT, UNIT_VECTORS, \
+    UNIT_BLOCK_CELLS_OFFSET
+from semigrid.dualgraphnode import RotatedDualGraphNodeType
+
+
+TABLES_PATH = os.path.join(os.path.dirname(__file__), 'topology_tables.py')
+
+# tolerance of the half-planes (points on the boundary are covered)
+EPSILON = 1e-9
+# decimal places of the half-planes
+ROUNDING = 12
+# decimal places of the lattice coordinates of the vertices and the edges
+LATTICE_ROUNDING = 9
+
+HalfPlane = Tuple[float, float, float]
+
+
+def _polygon_vertices(rdgnt: RotatedDualGraphNodeType,
+                      centre: Tuple[float, float]) \
+        -> List[Tuple[float, float]]:
+    """Vertices (counterclockwise) of the polygon of the 'rdgnt' type."""
+    polygon = rdgnt.polygon
+    rotation = math.radians(rdgnt.polygon_rotation)
+    return [(centre[0] + polygon.r * math.cos(alpha),
+             centre[1] + polygon.r * math.sin(alpha))
+            for alpha in (polygon.central_angle * i + rotation
+                          for i in range(polygon.n))]
+
+
+def _half_planes(vertices: List[Tuple[float, float]]) -> List[HalfPlane]:
+    """Half-planes (with unit normals) of the convex polygon."""
+    half_planes = []
+    for (px, py), (qx, qy) in zip(vertices, vertices[1:] + vertices[:1]):
+        nx, ny = qy - py, px - qx
+        length = math.hypot(nx, ny)
+        nx, ny = nx / length, ny / length
+        # rounding (far below the 'EPSILON') removes the float noise
+        a, b, c = (round(value, ROUNDING) + 0.0
+                   for value in (nx, ny, nx * px + ny * py))
+        half_planes.append((a, b, c))
+    return half_planes
+
+
+def locate(half_planes: List[Tuple[Tuple[int, int, int], List[HalfPlane]]],
+           xy: Tuple[float, float]) -> Optional[Tuple[int, int, int]]:
+    """Index of the first polygon (of 'half_planes') covering the 'xy'."""
+    x, y = xy
+    for ijk, planes in half_planes:
+        if all(a * x + b * y <= c + EPSILON for a, b, c in planes):
+            return ijk
+    return None
+
+
+class _ConfigurationTables:
+    """Topology tables of one vertex configuration."""
+    def __init__(self, vertex_configuration: Tuple[int, ...]) -> None:
+        self.rdgnt_names = POSSIBLE_RDGNT[vertex_configuration]
+        self.rdgnts = [RotatedDualGraphNodeType(
+            rdgnt_name[0], rdgnt_name[1:-1], 1, 0, rdgnt_name[-1])
+            for rdgnt_name in self.rdgnt_names]
+        self.unit_vectors = UNIT_VECTORS[vertex_configuration]
+        offsets = UNIT_BLOCK_CELLS_OFFSET[vertex_configuration]
+        self.offsets = [offsets[rdgnt_name]
+                        for rdgnt_name in self.rdgnt_names]
+
+        self.half_planes = self._near_origin_half_planes()
+        self.adj_indices_shift = self._adj_indices_shift()
+        self.edge_templates = self._edge_templates()
+        self.cell_vertices = self._cell_elements(False)
+        self.cell_edges = self._cell_elements(True)
+
+    def _centre(self, index: Tuple[int, int, int]) -> Tuple[float, float]:
+        i, j, k = index
+        u, v = self.unit_vectors
+        return i * u[0] + j * v[0] + self.offsets[k][0], \
+            i * u[1] + j * v[1] + self.offsets[k][1]
+
+    def _near_origin_half_planes(self) \
+            -> List[Tuple[Tuple[int, int, int], List[HalfPlane]]]:
+        """
+        Half-planes of the polygons (of the unit blocks around the origin)
+        intersecting the bounding box of the unit block at the origin.
+        """
+        u, v = self.unit_vectors
+        corners = [(0, 0), u, v, (u[0] + v[0], u[1] + v[1])]
+        min_x = min(x for x, _ in corners)
+        max_x = max(x for x, _ in corners)
+        min_y = min(y for _, y in corners)
+        max_y = max(y for _, y in corners)
+
+        half_planes = []
+        for i, j in [(i, j) for j in (-1, 0, 1) for i in (-1, 0, 1)]:
+            for k, rdgnt in enumerate(self.rdgnts):
+                vertices = _polygon_vertices(rdgnt, self._centre((i, j, k)))
+                if min_x < max(x for x, _ in vertices) and \
+                        min(x for x, _ in vertices) < max_x and \
+                        min_y < max(y for _, y in vertices) and \
+                        min(y for _, y in vertices) < max_y:
+                    half_planes.append(((i, j, k), _half_planes(vertices)))
+
+        return half_planes
+
+    def coords_to_index(self, xy: Tuple[float, float]) \
+            -> Tuple[int, int, int]:
+        """Index of the cell containing the point 'xy' of the unit space."""
+        u, v = self.unit_vectors
+        determinant = u[0] * v[1] - v[0] * u[1]
+        r_i = math.floor((xy[0] * v[1] - xy[1] * v[0]) / determinant)
+        r_j = math.floor((u[0] * xy[1] - xy[0] * u[1]) / determinant)
+        ijk = locate(self.half_planes, (xy[0] - r_i * u[0] - r_j * v[0],
+                                        xy[1] - r_i * u[1] - r_j * v[1]))
+        if ijk is None:
+            raise Exception("Conversion 'coordinates' to 'index' failed.")
+        return ijk[0] + r_i, ijk[1] + r_j, ijk[2]
+
+    def _adj_indices_shift(self) -> List[List[Tuple[int, int, int]]]:
+        """Locate the centres of the adjacents of each cell type."""
+        shifts = []
+        for k, rdgnt in enumerate(self.rdgnts):
+            x, y = self._centre((0, 0, k))
+            shifts.append([self.coords_to_index((x + dx, y + dy))
+                           for dx, dy in rdgnt.adjacent_centres_coords])
+        return shifts
+
+    def _edge_templates(self) -> List[List[Tuple[int, int, bool]]]:
+        """
+        For each adjacent, the vertices (b, a) of the shared edge and whether
+        the edge is owned by the cell.
+        """
+        templates = []
+        for k, rdgnt in enumerate(self.rdgnts):
+            n = rdgnt.polygon.n
+            central_angle = math.degrees(rdgnt.polygon.central_angle)
+            template = []
+            for i, shift in enumerate(self.adj_indices_shift[k]):
+                index_a = int(i + rdgnt.dgnt_rotation//central_angle)
+                index_b = index_a - 1 if rdgnt.dgnt_rotation % \
+                    central_angle < rdgnt.polygon_rotation else index_a + 1
+                template.append((index_b % n, index_a % n, (0, 0, k) < shift))
+            templates.append(template)
+        return templates
+
+    def _cell_elements(self, edges: bool) \
+            -> List[List[Tuple[int, int, int]]]:
+        """
+        (i, j) differences and types of the vertices (or the edges if
+        'edges' is True) of each cell type.
+        """
+        u, v = self.unit_vectors
+        determinant = u[0] * v[1] - v[0] * u[1]
+        types: Dict[Tuple[float, float], int] = {}
+        elements = []
+        for k, rdgnt in enumerate(self.rdgnts):
+            vertices = _polygon_vertices(rdgnt, self.offsets[k])
+            if edges:
+                vertices = [((x1 + x2) / 2, (y1 + y2) / 2) for (x1, y1), (
+                    x2, y2) in zip(vertices, vertices[1:] + vertices[:1])]
+            cell_elements = []
+            for x, y in vertices:
+                a = round((x * v[1] - y * v[0]) / determinant,
+                          LATTICE_ROUNDING)
+                b = round((u[0] * y - x * u[1]) / determinant,
+                          LATTICE_ROUNDING)
+                di, dj = math.floor(a), math.floor(b)
+                key = round(a - di, LATTICE_ROUNDING - 3), \
+                    round(b - dj, LATTICE_ROUNDING - 3)
+                cell_elements.append((di, dj, types.setdefault(key,
+                                                               len(types))))
+            elements.append(cell_elements)
+        return elements
+
+
+def _format_tables(tables: Dict[Tuple[int, ...], _ConfigurationTables]) \
+        -> str:
+    """Format the tables as the source of the 'topology_tables' module."""
+    lines = [
+        '"""',
+        "Topology tables of the grids in the unit space (edges of size 1, no",
+        "rotation), keyed by vertex configuration and cell type.",
+        "",
+        "Generated by 'python -m semigrid.topology_generator' - do not edit.",
+        '"""',
+        "from typing import Dict, Tuple, List",
+        "",
+        "",
+        "ADJ_INDICES_SHIFT: Dict[Tuple[int, ...], Dict[",
+        "    Tuple[int, ...], List[Tuple[int, int, int]]]] = {"]
+    for vertex_configuration, t in tables.items():
+        lines.append(f"    {vertex_configuration}: {{")
+        for rdgnt_name, shifts in zip(t.rdgnt_names, t.adj_indices_shift):
+            lines.append(f"        {rdgnt_name}: [")
+            lines.extend(f"            {shift}," for shift in shifts)
+            lines.append("        ],")
+        lines.append("    },")
+    lines.append("}")
+
+    lines.extend([
+        "",
+        "# (vertex b, vertex a, owned) of the edge shared with each adjacent",
+        "EDGE_TEMPLATES: Dict[Tuple[int, ...], Dict[",
+        "    Tuple[int, ...], List[Tuple[int, int, bool]]]] = {"])
+    for vertex_configuration, t in tables.items():
+        lines.append(f"    {vertex_configuration}: {{")
+        for rdgnt_name, template in zip(t.rdgnt_names, t.edge_templates):
+            lines.append(f"        {rdgnt_name}: [")
+            lines.extend(f"            {edge}," for edge in template)
+            lines.append("        ],")
+        lines.append("    },")
+    lines.append("}")
+
+    lines.extend([
+        "",
+        "# (a, b, c) of the polygons near the origin, a * x + b * y <= c",
+        "HALF_PLANES: Dict[Tuple[int, ...], List[",
+        "    Tuple[Tuple[int, int, int], List[Tuple[float, float, float]]]]] "
+        "= {"])
+    for vertex_configuration, t in tables.items():
+        lines.append(f"    {vertex_configuration}: [")
+        for ijk, planes in t.half_planes:
+            lines.append(f"        ({ijk}, [")
+            for a, b, c in planes:
+                line = f"            ({a!r}, {b!r}, {c!r}),"
+                if len(line) > 79:
+                    line = f"            ({a!r},\n             {b!r},\n" \
+                        f"             {c!r}),"
+                lines.append(line)
+            lines.append("        ]),")
+        lines.append("    ],")
+    lines.append("}")
+
+    for name, comment, attribute in (
+            ('CELL_VERTICES', "# (i, j, v) of the vertices of each cell type",
+             'cell_vertices'),
+            ('CELL_EDGES', "# (i, j, e) of the edges of each cell type "
+             "(the edge m joins the\n# vertices m and m + 1)",
+             'cell_edges')):
+        lines.extend([
+            "",
+            comment,
+            f"{name}: Dict[Tuple[int, ...], Dict[",
+            "    Tuple[int, ...], List[Tuple[int, int, int]]]] = {"])
+        for vertex_configuration, t in tables.items():
+            lines.append(f"    {vertex_configuration}: {{")
+            for rdgnt_name, elements in zip(t.rdgnt_names,
+                                            getattr(t, attribute)):
+                lines.append(f"        {rdgnt_name}: [")
+                lines.extend(f"            {element}," for element in elements)
+                lines.append("        ],")
+            lines.append("    },")
+        lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_tables() -> str:
+    """Generate the source of the 'topology_tables' module."""
+    return _format_tables({vertex_configuration:
+                           _ConfigurationTables(vertex_configuration)
+                           for vertex_configuration in POSSIBLE_RDGNT})
+
+
+def verify_tables() -> bool:
+    """Answer whether the shipped tables are equal to regenerated ones."""
+    with open(TABLES_PATH) as tables_file:
+        return tables_file.read() == generate_tables()
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m semigrid.topology_generator',
+        description="Regenerate the topology tables of semigrid.")
+    parser.add_argument('--check', action='store_true',
+                        help="only verify the shipped tables")
+    args = parser.parse_args(arguments)
+
+    if args.check:
+        if not verify_tables():
+            print("Topology tables are out of date.")
+            return 1
+        print("Topology tables are up to date.")
+        return 0
+    with open(TABLES_PATH, 'w') as tables_file:
+        tables_file.write(generate_tables())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,2081 @@
+"""
+Topology tables of the grids in the unit space (edges of size 1, no
+rotation), keyed by vertex configuration and cell type.
+
+Generated by 'python -m semigrid.topology_generator' - do not edit.
+"""
+from typing import Dict, Tuple, List
+
+
+ADJ_INDICES_SHIFT: Dict[Tuple[int, ...], Dict[
+    Tuple[int, ...], List[Tuple[int, int, int]]]] = {
+    (4, 4, 4, 4): {
+        (4, 4, 4, 4, 4, 0): [
+            (1, 0, 0),
+            (0, 1, 0),
+            (-1, 0, 0),
+            (0, -1, 0),
+        ],
+    },
+    (6, 6, 6): {
+        (6, 6, 6, 6, 6, 6, 6, 0): [
+            (1, 0, 0),
+            (0, 1, 0),
+            (-1, 1, 0),
+            (-1, 0, 0),
+            (0, -1, 0),
+            (1, -1, 0),
+        ],
+    },
+    (3, 3, 3, 3, 3, 3): {
+        (3, 3, 3, 3, 30): [
+            (0, 0, 1),
+            (-1, 0, 1),
+            (0, -1, 1),
+        ],
+        (3, 3, 3, 3, 90): [
+            (0, 1, 0),
+            (0, 0, 0),
+            (1, 0, 0),
+        ],
+    },
+    (3, 3, 3, 3, 6): {
+        (6, 3, 3, 3, 3, 3, 3, 30): [
+            (0, 0, 5),
+            (0, 0, 2),
+            (-1, 0, 7),
+            (0, -1, 4),
+            (1, -1, 1),
+            (0, 0, 8),
+        ],
+        (3, 3, 3, 6, 210): [
+            (-1, 0, 6),
+            (0, 0, 2),
+            (-1, 1, 0),
+        ],
+        (3, 3, 3, 6, 30): [
+            (0, 0, 3),
+            (0, 0, 1),
+            (0, 0, 0),
+        ],
+        (3, 3, 3, 3, 90): [
+            (-1, 1, 8),
+            (0, 0, 2),
+            (0, 0, 4),
+        ],
+        (3, 3, 3, 6, 150): [
+            (0, 0, 3),
+            (0, 0, 5),
+            (0, 1, 0),
+        ],
+        (3, 3, 3, 6, 330): [
+            (0, 0, 6),
+            (0, 0, 4),
+            (0, 0, 0),
+        ],
+        (3, 3, 3, 3, 30): [
+            (1, 0, 1),
+            (0, 0, 5),
+            (0, 0, 7),
+        ],
+        (3, 3, 3, 6, 90): [
+            (0, 0, 6),
+            (0, 0, 8),
+            (1, 0, 0),
+        ],
+        (3, 3, 3, 6, 270): [
+            (1, -1, 3),
+            (0, 0, 7),
+            (0, 0, 0),
+        ],
+    },
+    (3, 3, 3, 4, 4): {
+        (4, 3, 4, 3, 4, 90): [
+            (0, 0, 1),
+            (-1, 0, 0),
+            (0, -1, 2),
+            (1, 0, 0),
+        ],
+        (3, 3, 3, 4, 30): [
+            (0, 0, 2),
+            (-1, 0, 2),
+            (0, 0, 0),
+        ],
+        (3, 3, 3, 4, 210): [
+            (0, 0, 1),
+            (1, 0, 1),
+            (0, 1, 0),
+        ],
+    },
+    (3, 3, 4, 3, 4): {
+        (3, 3, 4, 4, 270): [
+            (0, 0, 5),
+            (0, 0, 4),
+            (0, 0, 1),
+        ],
+        (4, 3, 3, 3, 3, 60): [
+            (0, 0, 2),
+            (-1, 0, 5),
+            (0, -1, 3),
+            (0, 0, 0),
+        ],
+        (3, 3, 4, 4, 0): [
+            (0, 0, 3),
+            (-1, 0, 4),
+            (0, 0, 1),
+        ],
+        (3, 3, 4, 4, 180): [
+            (0, 0, 2),
+            (0, 0, 4),
+            (0, 1, 1),
+        ],
+        (4, 3, 3, 3, 3, 30): [
+            (0, 1, 5),
+            (0, 0, 3),
+            (0, 0, 0),
+            (1, 0, 2),
+        ],
+        (3, 3, 4, 4, 90): [
+            (0, 0, 0),
+            (0, -1, 4),
+            (1, 0, 1),
+        ],
+    },
+    (3, 12, 12): {
+        (12, 3, 12, 3, 12, 3, 12, 3, 12, 3, 12, 3, 12, 30): [
+            (0, 0, 2),
+            (0, 1, 0),
+            (0, 0, 1),
+            (-1, 1, 0),
+            (-1, 0, 2),
+            (-1, 0, 0),
+            (0, -1, 1),
+            (0, -1, 0),
+            (0, -1, 2),
+            (1, -1, 0),
+            (1, -1, 1),
+            (1, 0, 0),
+        ],
+        (3, 12, 12, 12, 30): [
+            (0, 1, 0),
+            (-1, 1, 0),
+            (0, 0, 0),
+        ],
+        (3, 12, 12, 12, 90): [
+            (0, 1, 0),
+            (0, 0, 0),
+            (1, 0, 0),
+        ],
+    },
+    (3, 4, 6, 4): {
+        (6, 4, 4, 4, 4, 4, 4, 0): [
+            (0, 0, 5),
+            (0, 0, 3),
+            (0, 0, 1),
+            (-1, 0, 5),
+            (0, -1, 3),
+            (1, -1, 1),
+        ],
+        (4, 3, 6, 3, 6, 30): [
+            (0, 0, 2),
+            (-1, 1, 0),
+            (-1, 0, 4),
+            (0, 0, 0),
+        ],
+        (3, 4, 4, 4, 90): [
+            (-1, 1, 5),
+            (0, 0, 1),
+            (0, 0, 3),
+        ],
+        (4, 3, 6, 3, 6, 150): [
+            (0, 0, 2),
+            (0, 0, 0),
+            (0, 0, 4),
+            (0, 1, 0),
+        ],
+        (3, 4, 4, 4, 30): [
+            (1, 0, 1),
+            (0, 0, 3),
+            (0, 0, 5),
+        ],
+        (4, 3, 6, 3, 6, 90): [
+            (0, 0, 4),
+            (0, 0, 0),
+            (1, -1, 2),
+            (1, 0, 0),
+        ],
+    },
+    (3, 6, 3, 6): {
+        (6, 3, 3, 3, 3, 3, 3, 30): [
+            (0, 0, 2),
+            (0, 0, 1),
+            (-1, 0, 2),
+            (0, -1, 1),
+            (0, -1, 2),
+            (1, -1, 1),
+        ],
+        (3, 6, 6, 6, 30): [
+            (0, 1, 0),
+            (-1, 1, 0),
+            (0, 0, 0),
+        ],
+        (3, 6, 6, 6, 90): [
+            (0, 1, 0),
+            (0, 0, 0),
+            (1, 0, 0),
+        ],
+    },
+    (4, 6, 12): {
+        (12, 4, 6, 4, 6, 4, 6, 4, 6, 4, 6, 4, 6, 30): [
+            (0, 0, 5),
+            (0, 0, 4),
+            (0, 0, 3),
+            (0, 0, 2),
+            (0, 0, 1),
+            (0, -1, 4),
+            (0, -1, 5),
+            (1, -1, 2),
+            (1, -1, 3),
+            (1, -1, 4),
+            (1, 0, 1),
+            (1, 0, 2),
+        ],
+        (4, 6, 12, 6, 12, 60): [
+            (0, 0, 2),
+            (-1, 0, 0),
+            (0, -1, 4),
+            (0, 0, 0),
+        ],
+        (6, 4, 12, 4, 12, 4, 12, 0): [
+            (0, 0, 3),
+            (-1, 1, 0),
+            (-1, 0, 5),
+            (-1, 0, 0),
+            (0, 0, 1),
+            (0, 0, 0),
+        ],
+        (4, 6, 12, 6, 12, 0): [
+            (0, 0, 4),
+            (-1, 1, 0),
+            (0, 0, 2),
+            (0, 0, 0),
+        ],
+        (6, 4, 12, 4, 12, 4, 12, 60): [
+            (0, 1, 1),
+            (-1, 1, 0),
+            (0, 0, 3),
+            (0, 0, 0),
+            (0, 0, 5),
+            (0, 1, 0),
+        ],
+        (4, 6, 12, 6, 12, 120): [
+            (0, 0, 4),
+            (0, 0, 0),
+            (1, 0, 2),
+            (0, 1, 0),
+        ],
+    },
+    (4, 8, 8): {
+        (8, 4, 8, 4, 8, 4, 8, 4, 8, 0): [
+            (1, 0, 1),
+            (0, 1, 0),
+            (0, 0, 1),
+            (-1, 0, 0),
+            (0, -1, 1),
+            (0, -1, 0),
+            (1, -1, 1),
+            (1, 0, 0),
+        ],
+        (4, 8, 8, 8, 8, 0): [
+            (0, 1, 0),
+            (-1, 1, 0),
+            (-1, 0, 0),
+            (0, 0, 0),
+        ],
+    },
+}
+
+# (vertex b, vertex a, owned) of the edge shared with each adjacent
+EDGE_TEMPLATES: Dict[Tuple[int, ...], Dict[
+    Tuple[int, ...], List[Tuple[int, int, bool]]]] = {
+    (4, 4, 4, 4): {
+        (4, 4, 4, 4, 4, 0): [
+            (3, 0, True),
+            (0, 1, True),
+            (1, 2, False),
+            (2, 3, False),
+        ],
+    },
+    (6, 6, 6): {
+        (6, 6, 6, 6, 6, 6, 6, 0): [
+            (5, 0, True),
+            (0, 1, True),
+            (1, 2, False),
+            (2, 3, False),
+            (3, 4, False),
+            (4, 5, True),
+        ],
+    },
+    (3, 3, 3, 3, 3, 3): {
+        (3, 3, 3, 3, 30): [
+            (2, 0, True),
+            (0, 1, False),
+            (1, 2, False),
+        ],
+        (3, 3, 3, 3, 90): [
+            (1, 0, True),
+            (2, 1, False),
+            (0, 2, True),
+        ],
+    },
+    (3, 3, 3, 3, 6): {
+        (6, 3, 3, 3, 3, 3, 3, 30): [
+            (5, 0, True),
+            (0, 1, True),
+            (1, 2, False),
+            (2, 3, False),
+            (3, 4, True),
+            (4, 5, True),
+        ],
+        (3, 3, 3, 6, 210): [
+            (2, 1, False),
+            (0, 2, True),
+            (1, 0, False),
+        ],
+        (3, 3, 3, 6, 30): [
+            (2, 0, True),
+            (0, 1, False),
+            (1, 2, False),
+        ],
+        (3, 3, 3, 3, 90): [
+            (1, 0, False),
+            (2, 1, False),
+            (0, 2, True),
+        ],
+        (3, 3, 3, 6, 150): [
+            (0, 1, False),
+            (1, 2, True),
+            (2, 0, True),
+        ],
+        (3, 3, 3, 6, 330): [
+            (0, 2, True),
+            (1, 0, False),
+            (2, 1, False),
+        ],
+        (3, 3, 3, 3, 30): [
+            (2, 0, True),
+            (0, 1, False),
+            (1, 2, True),
+        ],
+        (3, 3, 3, 6, 90): [
+            (1, 0, False),
+            (2, 1, True),
+            (0, 2, True),
+        ],
+        (3, 3, 3, 6, 270): [
+            (1, 2, True),
+            (2, 0, False),
+            (0, 1, False),
+        ],
+    },
+    (3, 3, 3, 4, 4): {
+        (4, 3, 4, 3, 4, 90): [
+            (0, 1, True),
+            (1, 2, False),
+            (2, 3, False),
+            (3, 0, True),
+        ],
+        (3, 3, 3, 4, 30): [
+            (2, 0, True),
+            (0, 1, False),
+            (1, 2, False),
+        ],
+        (3, 3, 3, 4, 210): [
+            (2, 1, False),
+            (0, 2, True),
+            (1, 0, True),
+        ],
+    },
+    (3, 3, 4, 3, 4): {
+        (3, 3, 4, 4, 270): [
+            (1, 2, True),
+            (2, 0, True),
+            (0, 1, True),
+        ],
+        (4, 3, 3, 3, 3, 60): [
+            (1, 0, True),
+            (2, 1, False),
+            (3, 2, False),
+            (0, 3, False),
+        ],
+        (3, 3, 4, 4, 0): [
+            (2, 0, True),
+            (0, 1, False),
+            (1, 2, False),
+        ],
+        (3, 3, 4, 4, 180): [
+            (2, 1, False),
+            (0, 2, True),
+            (1, 0, True),
+        ],
+        (4, 3, 3, 3, 3, 30): [
+            (3, 0, True),
+            (0, 1, False),
+            (1, 2, False),
+            (2, 3, True),
+        ],
+        (3, 3, 4, 4, 90): [
+            (1, 0, False),
+            (2, 1, False),
+            (0, 2, True),
+        ],
+    },
+    (3, 12, 12): {
+        (12, 3, 12, 3, 12, 3, 12, 3, 12, 3, 12, 3, 12, 30): [
+            (0, 1, True),
+            (1, 2, True),
+            (2, 3, True),
+            (3, 4, False),
+            (4, 5, False),
+            (5, 6, False),
+            (6, 7, False),
+            (7, 8, False),
+            (8, 9, False),
+            (9, 10, True),
+            (10, 11, True),
+            (11, 0, True),
+        ],
+        (3, 12, 12, 12, 30): [
+            (2, 0, True),
+            (0, 1, False),
+            (1, 2, False),
+        ],
+        (3, 12, 12, 12, 90): [
+            (1, 0, True),
+            (2, 1, False),
+            (0, 2, True),
+        ],
+    },
+    (3, 4, 6, 4): {
+        (6, 4, 4, 4, 4, 4, 4, 0): [
+            (5, 0, True),
+            (0, 1, True),
+            (1, 2, True),
+            (2, 3, False),
+            (3, 4, False),
+            (4, 5, True),
+        ],
+        (4, 3, 6, 3, 6, 30): [
+            (3, 0, True),
+            (0, 1, False),
+            (1, 2, False),
+            (2, 3, False),
+        ],
+        (3, 4, 4, 4, 90): [
+            (1, 0, False),
+            (2, 1, False),
+            (0, 2, True),
+        ],
+        (4, 3, 6, 3, 6, 150): [
+            (2, 1, False),
+            (3, 2, False),
+            (0, 3, True),
+            (1, 0, True),
+        ],
+        (3, 4, 4, 4, 30): [
+            (2, 0, True),
+            (0, 1, False),
+            (1, 2, True),
+        ],
+        (4, 3, 6, 3, 6, 90): [
+            (0, 1, False),
+            (1, 2, False),
+            (2, 3, True),
+            (3, 0, True),
+        ],
+    },
+    (3, 6, 3, 6): {
+        (6, 3, 3, 3, 3, 3, 3, 30): [
+            (5, 0, True),
+            (0, 1, True),
+            (1, 2, False),
+            (2, 3, False),
+            (3, 4, False),
+            (4, 5, True),
+        ],
+        (3, 6, 6, 6, 30): [
+            (2, 0, True),
+            (0, 1, False),
+            (1, 2, False),
+        ],
+        (3, 6, 6, 6, 90): [
+            (1, 0, True),
+            (2, 1, False),
+            (0, 2, True),
+        ],
+    },
+    (4, 6, 12): {
+        (12, 4, 6, 4, 6, 4, 6, 4, 6, 4, 6, 4, 6, 30): [
+            (0, 1, True),
+            (1, 2, True),
+            (2, 3, True),
+            (3, 4, True),
+            (4, 5, True),
+            (5, 6, False),
+            (6, 7, False),
+            (7, 8, True),
+            (8, 9, True),
+            (9, 10, True),
+            (10, 11, True),
+            (11, 0, True),
+        ],
+        (4, 6, 12, 6, 12, 60): [
+            (1, 0, True),
+            (2, 1, False),
+            (3, 2, False),
+            (0, 3, False),
+        ],
+        (6, 4, 12, 4, 12, 4, 12, 0): [
+            (5, 0, True),
+            (0, 1, False),
+            (1, 2, False),
+            (2, 3, False),
+            (3, 4, False),
+            (4, 5, False),
+        ],
+        (4, 6, 12, 6, 12, 0): [
+            (3, 0, True),
+            (0, 1, False),
+            (1, 2, False),
+            (2, 3, False),
+        ],
+        (6, 4, 12, 4, 12, 4, 12, 60): [
+            (0, 1, True),
+            (1, 2, False),
+            (2, 3, False),
+            (3, 4, False),
+            (4, 5, True),
+            (5, 0, True),
+        ],
+        (4, 6, 12, 6, 12, 120): [
+            (0, 1, False),
+            (1, 2, False),
+            (2, 3, True),
+            (3, 0, True),
+        ],
+    },
+    (4, 8, 8): {
+        (8, 4, 8, 4, 8, 4, 8, 4, 8, 0): [
+            (7, 0, True),
+            (0, 1, True),
+            (1, 2, True),
+            (2, 3, False),
+            (3, 4, False),
+            (4, 5, False),
+            (5, 6, True),
+            (6, 7, True),
+        ],
+        (4, 8, 8, 8, 8, 0): [
+            (3, 0, True),
+            (0, 1, False),
+            (1, 2, False),
+            (2, 3, False),
+        ],
+    },
+}
+
+# (a, b, c) of the polygons near the origin, a * x + b * y <= c
+HALF_PLANES: Dict[Tuple[int, ...], List[
+    Tuple[Tuple[int, int, int], List[Tuple[float, float, float]]]]] = {
+    (4, 4, 4, 4): [
+        ((0, 0, 0), [
+            (0.0, 1.0, 0.5),
+            (-1.0, 0.0, 0.5),
+            (0.0, -1.0, 0.5),
+            (1.0, 0.0, 0.5),
+        ]),
+        ((1, 0, 0), [
+            (0.0, 1.0, 0.5),
+            (-1.0, 0.0, -0.5),
+            (0.0, -1.0, 0.5),
+            (1.0, 0.0, 1.5),
+        ]),
+        ((0, 1, 0), [
+            (0.0, 1.0, 1.5),
+            (-1.0, 0.0, 0.5),
+            (0.0, -1.0, -0.5),
+            (1.0, 0.0, 0.5),
+        ]),
+        ((1, 1, 0), [
+            (0.0, 1.0, 1.5),
+            (-1.0, 0.0, -0.5),
+            (0.0, -1.0, -0.5),
+            (1.0, 0.0, 1.5),
+        ]),
+    ],
+    (6, 6, 6): [
+        ((0, 0, 0), [
+            (0.5, 0.866025403784, 0.866025403784),
+            (-0.5, 0.866025403784, 0.866025403784),
+            (-1.0, 0.0, 0.866025403784),
+            (-0.5, -0.866025403784, 0.866025403784),
+            (0.5, -0.866025403784, 0.866025403784),
+            (1.0, 0.0, 0.866025403784),
+        ]),
+        ((1, 0, 0), [
+            (0.5, 0.866025403784, 1.732050807569),
+            (-0.5, 0.866025403784, 0.0),
+            (-1.0, 0.0, -0.866025403784),
+            (-0.5, -0.866025403784, 0.0),
+            (0.5, -0.866025403784, 1.732050807569),
+            (1.0, 0.0, 2.598076211353),
+        ]),
+        ((-1, 1, 0), [
+            (0.5, 0.866025403784, 1.732050807569),
+            (-0.5, 0.866025403784, 2.598076211353),
+            (-1.0, 0.0, 1.732050807569),
+            (-0.5, -0.866025403784, 0.0),
+            (0.5, -0.866025403784, -0.866025403784),
+            (1.0, 0.0, 0.0),
+        ]),
+        ((0, 1, 0), [
+            (0.5, 0.866025403784, 2.598076211353),
+            (-0.5, 0.866025403784, 1.732050807569),
+            (-1.0, 0.0, 0.0),
+            (-0.5, -0.866025403784, -0.866025403784),
+            (0.5, -0.866025403784, 0.0),
+            (1.0, 0.0, 1.732050807569),
+        ]),
+        ((1, 1, 0), [
+            (0.5, 0.866025403784, 3.464101615138),
+            (-0.5, 0.866025403784, 0.866025403784),
+            (-1.0, 0.0, -1.732050807569),
+            (-0.5, -0.866025403784, -1.732050807569),
+            (0.5, -0.866025403784, 0.866025403784),
+            (1.0, 0.0, 3.464101615138),
+        ]),
+    ],
+    (3, 3, 3, 3, 3, 3): [
+        ((-1, 0, 1), [
+            (0.0, 1.0, 0.57735026919),
+            (-0.866025403784, -0.5, 0.57735026919),
+            (0.866025403784, -0.5, -0.288675134595),
+        ]),
+        ((0, 0, 0), [
+            (-0.866025403784, 0.5, 0.288675134595),
+            (0.0, -1.0, 0.288675134595),
+            (0.866025403784, 0.5, 0.288675134595),
+        ]),
+        ((0, 0, 1), [
+            (0.0, 1.0, 0.57735026919),
+            (-0.866025403784, -0.5, -0.288675134595),
+            (0.866025403784, -0.5, 0.57735026919),
+        ]),
+        ((1, 0, 0), [
+            (-0.866025403784, 0.5, -0.57735026919),
+            (0.0, -1.0, 0.288675134595),
+            (0.866025403784, 0.5, 1.154700538379),
+        ]),
+        ((1, 0, 1), [
+            (0.0, 1.0, 0.57735026919),
+            (-0.866025403784, -0.5, -1.154700538379),
+            (0.866025403784, -0.5, 1.443375672974),
+        ]),
+        ((-1, 1, 1), [
+            (0.0, 1.0, 1.443375672974),
+            (-0.866025403784, -0.5, -0.288675134595),
+            (0.866025403784, -0.5, -0.288675134595),
+        ]),
+        ((0, 1, 0), [
+            (-0.866025403784, 0.5, 0.288675134595),
+            (0.0, -1.0, -0.57735026919),
+            (0.866025403784, 0.5, 1.154700538379),
+        ]),
+        ((0, 1, 1), [
+            (0.0, 1.0, 1.443375672974),
+            (-0.866025403784, -0.5, -1.154700538379),
+            (0.866025403784, -0.5, 0.57735026919),
+        ]),
+        ((1, 1, 0), [
+            (-0.866025403784, 0.5, -0.57735026919),
+            (0.0, -1.0, -0.57735026919),
+            (0.866025403784, 0.5, 2.020725942164),
+        ]),
+    ],
+    (3, 3, 3, 3, 6): [
+        ((0, 0, 0), [
+            (0.0, 1.0, 0.866025403784),
+            (-0.866025403784, 0.5, 0.866025403784),
+            (-0.866025403784, -0.5, 0.866025403784),
+            (0.0, -1.0, 0.866025403784),
+            (0.866025403784, -0.5, 0.866025403784),
+            (0.866025403784, 0.5, 0.866025403784),
+        ]),
+        ((0, 0, 1), [
+            (0.0, 1.0, 1.732050807569),
+            (-0.866025403784, -0.5, 0.0),
+            (0.866025403784, -0.5, -0.866025403784),
+        ]),
+        ((0, 0, 2), [
+            (-0.866025403784, 0.5, 0.866025403784),
+            (0.0, -1.0, -0.866025403784),
+            (0.866025403784, 0.5, 0.866025403784),
+        ]),
+        ((0, 0, 3), [
+            (0.0, 1.0, 1.732050807569),
+            (-0.866025403784, -0.5, -0.866025403784),
+            (0.866025403784, -0.5, 0.0),
+        ]),
+        ((0, 0, 4), [
+            (-0.866025403784, 0.5, 0.0),
+            (0.0, -1.0, -0.866025403784),
+            (0.866025403784, 0.5, 1.732050807569),
+        ]),
+        ((0, 0, 5), [
+            (0.0, 1.0, 0.866025403784),
+            (-0.866025403784, -0.5, -0.866025403784),
+            (0.866025403784, -0.5, 0.866025403784),
+        ]),
+        ((0, 0, 6), [
+            (-0.866025403784, 0.5, -0.866025403784),
+            (0.0, -1.0, 0.0),
+            (0.866025403784, 0.5, 1.732050807569),
+        ]),
+        ((0, 0, 7), [
+            (0.0, 1.0, 0.0),
+            (-0.866025403784, -0.5, -0.866025403784),
+            (0.866025403784, -0.5, 1.732050807569),
+        ]),
+        ((0, 0, 8), [
+            (-0.866025403784, 0.5, -0.866025403784),
+            (0.0, -1.0, 0.866025403784),
+            (0.866025403784, 0.5, 0.866025403784),
+        ]),
+        ((1, 0, 0), [
+            (0.0, 1.0, 0.0),
+            (-0.866025403784, 0.5, -1.732050807569),
+            (-0.866025403784, -0.5, -0.866025403784),
+            (0.0, -1.0, 1.732050807569),
+            (0.866025403784, -0.5, 3.464101615138),
+            (0.866025403784, 0.5, 2.598076211353),
+        ]),
+        ((1, 0, 1), [
+            (0.0, 1.0, 0.866025403784),
+            (-0.866025403784, -0.5, -1.732050807569),
+            (0.866025403784, -0.5, 1.732050807569),
+        ]),
+        ((1, 0, 2), [
+            (-0.866025403784, 0.5, -1.732050807569),
+            (0.0, -1.0, 0.0),
+            (0.866025403784, 0.5, 2.598076211353),
+        ]),
+        ((1, 0, 3), [
+            (0.0, 1.0, 0.866025403784),
+            (-0.866025403784, -0.5, -2.598076211353),
+            (0.866025403784, -0.5, 2.598076211353),
+        ]),
+        ((1, 0, 4), [
+            (-0.866025403784, 0.5, -2.598076211353),
+            (0.0, -1.0, 0.0),
+            (0.866025403784, 0.5, 3.464101615138),
+        ]),
+        ((1, 0, 5), [
+            (0.0, 1.0, 0.0),
+            (-0.866025403784, -0.5, -2.598076211353),
+            (0.866025403784, -0.5, 3.464101615138),
+        ]),
+        ((1, 0, 6), [
+            (-0.866025403784, 0.5, -3.464101615138),
+            (0.0, -1.0, 0.866025403784),
+            (0.866025403784, 0.5, 3.464101615138),
+        ]),
+        ((1, 0, 7), [
+            (0.0, 1.0, -0.866025403784),
+            (-0.866025403784, -0.5, -2.598076211353),
+            (0.866025403784, -0.5, 4.330127018922),
+        ]),
+        ((1, 0, 8), [
+            (-0.866025403784, 0.5, -3.464101615138),
+            (0.0, -1.0, 1.732050807569),
+            (0.866025403784, 0.5, 2.598076211353),
+        ]),
+        ((-1, 1, 0), [
+            (0.0, 1.0, 3.464101615138),
+            (-0.866025403784, 0.5, 2.598076211353),
+            (-0.866025403784, -0.5, 0.0),
+            (0.0, -1.0, -1.732050807569),
+            (0.866025403784, -0.5, -0.866025403784),
+            (0.866025403784, 0.5, 1.732050807569),
+        ]),
+        ((0, 1, 0), [
+            (0.0, 1.0, 2.598076211353),
+            (-0.866025403784, 0.5, 0.0),
+            (-0.866025403784, -0.5, -1.732050807569),
+            (0.0, -1.0, -0.866025403784),
+            (0.866025403784, -0.5, 1.732050807569),
+            (0.866025403784, 0.5, 3.464101615138),
+        ]),
+        ((0, 1, 6), [
+            (-0.866025403784, 0.5, -1.732050807569),
+            (0.0, -1.0, -1.732050807569),
+            (0.866025403784, 0.5, 4.330127018922),
+        ]),
+        ((0, 1, 7), [
+            (0.0, 1.0, 1.732050807569),
+            (-0.866025403784, -0.5, -3.464101615138),
+            (0.866025403784, -0.5, 2.598076211353),
+        ]),
+        ((0, 1, 8), [
+            (-0.866025403784, 0.5, -1.732050807569),
+            (0.0, -1.0, -0.866025403784),
+            (0.866025403784, 0.5, 3.464101615138),
+        ]),
+        ((1, 1, 0), [
+            (0.0, 1.0, 1.732050807569),
+            (-0.866025403784, 0.5, -2.598076211353),
+            (-0.866025403784, -0.5, -3.464101615138),
+            (0.0, -1.0, 0.0),
+            (0.866025403784, -0.5, 4.330127018922),
+            (0.866025403784, 0.5, 5.196152422707),
+        ]),
+        ((1, 1, 2), [
+            (-0.866025403784, 0.5, -2.598076211353),
+            (0.0, -1.0, -1.732050807569),
+            (0.866025403784, 0.5, 5.196152422707),
+        ]),
+    ],
+    (3, 3, 3, 4, 4): [
+        ((-1, 0, 2), [
+            (0.0, 1.0, 1.366025403784),
+            (-0.866025403784, -0.5, 0.183012701892),
+            (0.866025403784, -0.5, -0.683012701892),
+        ]),
+        ((0, 0, 0), [
+            (0.0, 1.0, 0.5),
+            (-1.0, 0.0, 0.5),
+            (0.0, -1.0, 0.5),
+            (1.0, 0.0, 0.5),
+        ]),
+        ((0, 0, 1), [
+            (-0.866025403784, 0.5, 0.683012701892),
+            (0.0, -1.0, -0.5),
+            (0.866025403784, 0.5, 0.683012701892),
+        ]),
+        ((0, 0, 2), [
+            (0.0, 1.0, 1.366025403784),
+            (-0.866025403784, -0.5, -0.683012701892),
+            (0.866025403784, -0.5, 0.183012701892),
+        ]),
+        ((1, 0, 0), [
+            (0.0, 1.0, 0.5),
+            (-1.0, 0.0, -0.5),
+            (0.0, -1.0, 0.5),
+            (1.0, 0.0, 1.5),
+        ]),
+        ((1, 0, 1), [
+            (-0.866025403784, 0.5, -0.183012701892),
+            (0.0, -1.0, -0.5),
+            (0.866025403784, 0.5, 1.549038105677),
+        ]),
+        ((1, 0, 2), [
+            (0.0, 1.0, 1.366025403784),
+            (-0.866025403784, -0.5, -1.549038105677),
+            (0.866025403784, -0.5, 1.049038105677),
+        ]),
+        ((-1, 1, 0), [
+            (0.0, 1.0, 2.366025403784),
+            (-1.0, 0.0, 1.0),
+            (0.0, -1.0, -1.366025403784),
+            (1.0, 0.0, 0.0),
+        ]),
+        ((0, 1, 0), [
+            (0.0, 1.0, 2.366025403784),
+            (-1.0, 0.0, 0.0),
+            (0.0, -1.0, -1.366025403784),
+            (1.0, 0.0, 1.0),
+        ]),
+        ((1, 1, 0), [
+            (0.0, 1.0, 2.366025403784),
+            (-1.0, 0.0, -1.0),
+            (0.0, -1.0, -1.366025403784),
+            (1.0, 0.0, 2.0),
+        ]),
+    ],
+    (3, 3, 4, 3, 4): [
+        ((0, -1, 4), [
+            (-0.5, 0.866025403784, 0.0),
+            (-0.866025403784, -0.5, 1.57735026919),
+            (0.5, -0.866025403784, 1.0),
+            (0.866025403784, 0.5, -0.57735026919),
+        ]),
+        ((1, -1, 2), [
+            (-0.5, 0.866025403784, -1.0),
+            (-0.5, -0.866025403784, 1.866025403784),
+            (1.0, 0.0, 0.0),
+        ]),
+        ((1, -1, 3), [
+            (0.5, 0.866025403784, -1.0),
+            (-1.0, 0.0, 0.0),
+            (0.5, -0.866025403784, 1.866025403784),
+        ]),
+        ((-1, 0, 4), [
+            (-0.5, 0.866025403784, 2.366025403784),
+            (-0.866025403784, -0.5, 0.211324865405),
+            (0.5, -0.866025403784, -1.366025403784),
+            (0.866025403784, 0.5, 0.788675134595),
+        ]),
+        ((0, 0, 0), [
+            (-0.866025403784, 0.5, 0.288675134595),
+            (0.0, -1.0, 0.288675134595),
+            (0.866025403784, 0.5, 0.288675134595),
+        ]),
+        ((0, 0, 2), [
+            (-0.5, 0.866025403784, 1.366025403784),
+            (-0.5, -0.866025403784, -0.5),
+            (1.0, 0.0, 0.0),
+        ]),
+        ((0, 0, 3), [
+            (0.5, 0.866025403784, 1.366025403784),
+            (-1.0, 0.0, 0.0),
+            (0.5, -0.866025403784, -0.5),
+        ]),
+        ((0, 0, 4), [
+            (-0.5, 0.866025403784, 0.5),
+            (-0.866025403784, -0.5, -0.288675134595),
+            (0.5, -0.866025403784, 0.5),
+            (0.866025403784, 0.5, 1.288675134595),
+        ]),
+        ((0, 0, 5), [
+            (0.0, 1.0, -0.288675134595),
+            (-0.866025403784, -0.5, 0.57735026919),
+            (0.866025403784, -0.5, 0.57735026919),
+        ]),
+        ((1, 0, 0), [
+            (-0.866025403784, 0.5, -1.57735026919),
+            (0.0, -1.0, 1.654700538379),
+            (0.866025403784, 0.5, 0.788675134595),
+        ]),
+        ((1, 0, 1), [
+            (0.5, 0.866025403784, 0.0),
+            (-0.866025403784, 0.5, -0.57735026919),
+            (-0.5, -0.866025403784, 1.0),
+            (0.866025403784, -0.5, 1.57735026919),
+        ]),
+        ((1, 0, 2), [
+            (-0.5, 0.866025403784, -0.5),
+            (-0.5, -0.866025403784, 0.0),
+            (1.0, 0.0, 1.366025403784),
+        ]),
+        ((1, 0, 3), [
+            (0.5, 0.866025403784, 0.866025403784),
+            (-1.0, 0.0, -1.366025403784),
+            (0.5, -0.866025403784, 1.366025403784),
+        ]),
+        ((1, 0, 4), [
+            (-0.5, 0.866025403784, -1.366025403784),
+            (-0.866025403784, -0.5, -0.788675134595),
+            (0.5, -0.866025403784, 2.366025403784),
+            (0.866025403784, 0.5, 1.788675134595),
+        ]),
+        ((0, 1, 0), [
+            (-0.866025403784, 0.5, -0.211324865405),
+            (0.0, -1.0, -1.07735026919),
+            (0.866025403784, 0.5, 2.154700538379),
+        ]),
+        ((0, 1, 1), [
+            (0.5, 0.866025403784, 2.366025403784),
+            (-0.866025403784, 0.5, 0.788675134595),
+            (-0.5, -0.866025403784, -1.366025403784),
+            (0.866025403784, -0.5, 0.211324865405),
+        ]),
+        ((0, 1, 4), [
+            (-0.5, 0.866025403784, 1.0),
+            (-0.866025403784, -0.5, -2.154700538379),
+            (0.5, -0.866025403784, 0.0),
+            (0.866025403784, 0.5, 3.154700538379),
+        ]),
+        ((0, 1, 5), [
+            (0.0, 1.0, 1.07735026919),
+            (-0.866025403784, -0.5, -1.288675134595),
+            (0.866025403784, -0.5, 1.07735026919),
+        ]),
+        ((1, 1, 0), [
+            (-0.866025403784, 0.5, -2.07735026919),
+            (0.0, -1.0, 0.288675134595),
+            (0.866025403784, 0.5, 2.654700538379),
+        ]),
+        ((1, 1, 1), [
+            (0.5, 0.866025403784, 1.866025403784),
+            (-0.866025403784, 0.5, -1.07735026919),
+            (-0.5, -0.866025403784, -0.866025403784),
+            (0.866025403784, -0.5, 2.07735026919),
+        ]),
+        ((1, 1, 2), [
+            (-0.5, 0.866025403784, 0.0),
+            (-0.5, -0.866025403784, -1.866025403784),
+            (1.0, 0.0, 2.732050807569),
+        ]),
+        ((1, 1, 3), [
+            (0.5, 0.866025403784, 2.732050807569),
+            (-1.0, 0.0, -2.732050807569),
+            (0.5, -0.866025403784, 0.866025403784),
+        ]),
+        ((1, 1, 4), [
+            (-0.5, 0.866025403784, -0.866025403784),
+            (-0.866025403784, -0.5, -2.654700538379),
+            (0.5, -0.866025403784, 1.866025403784),
+            (0.866025403784, 0.5, 3.654700538379),
+        ]),
+        ((1, 1, 5), [
+            (0.0, 1.0, -0.288675134595),
+            (-0.866025403784, -0.5, -1.788675134595),
+            (0.866025403784, -0.5, 2.943375672974),
+        ]),
+    ],
+    (3, 12, 12): [
+        ((0, 0, 0), [
+            (0.866025403784, 0.5, 1.866025403784),
+            (0.5, 0.866025403784, 1.866025403784),
+            (0.0, 1.0, 1.866025403784),
+            (-0.5, 0.866025403784, 1.866025403784),
+            (-0.866025403784, 0.5, 1.866025403784),
+            (-1.0, 0.0, 1.866025403784),
+            (-0.866025403784, -0.5, 1.866025403784),
+            (-0.5, -0.866025403784, 1.866025403784),
+            (0.0, -1.0, 1.866025403784),
+            (0.5, -0.866025403784, 1.866025403784),
+            (0.866025403784, -0.5, 1.866025403784),
+            (1.0, 0.0, 1.866025403784),
+        ]),
+        ((0, 0, 1), [
+            (-0.866025403784, 0.5, 1.366025403784),
+            (0.0, -1.0, -1.866025403784),
+            (0.866025403784, 0.5, 1.366025403784),
+        ]),
+        ((0, 0, 2), [
+            (0.0, 1.0, 1.366025403784),
+            (-0.866025403784, -0.5, -1.866025403784),
+            (0.866025403784, -0.5, 1.366025403784),
+        ]),
+        ((1, 0, 0), [
+            (0.866025403784, 0.5, 5.098076211353),
+            (0.5, 0.866025403784, 3.732050807569),
+            (0.0, 1.0, 1.866025403784),
+            (-0.5, 0.866025403784, 0.0),
+            (-0.866025403784, 0.5, -1.366025403784),
+            (-1.0, 0.0, -1.866025403784),
+            (-0.866025403784, -0.5, -1.366025403784),
+            (-0.5, -0.866025403784, 0.0),
+            (0.0, -1.0, 1.866025403784),
+            (0.5, -0.866025403784, 3.732050807569),
+            (0.866025403784, -0.5, 5.098076211353),
+            (1.0, 0.0, 5.598076211353),
+        ]),
+        ((1, 0, 1), [
+            (-0.866025403784, 0.5, -1.866025403784),
+            (0.0, -1.0, -1.866025403784),
+            (0.866025403784, 0.5, 4.598076211353),
+        ]),
+        ((1, 0, 2), [
+            (0.0, 1.0, 1.366025403784),
+            (-0.866025403784, -0.5, -5.098076211353),
+            (0.866025403784, -0.5, 4.598076211353),
+        ]),
+        ((-1, 1, 0), [
+            (0.866025403784, 0.5, 1.866025403784),
+            (0.5, 0.866025403784, 3.732050807569),
+            (0.0, 1.0, 5.098076211353),
+            (-0.5, 0.866025403784, 5.598076211353),
+            (-0.866025403784, 0.5, 5.098076211353),
+            (-1.0, 0.0, 3.732050807569),
+            (-0.866025403784, -0.5, 1.866025403784),
+            (-0.5, -0.866025403784, 0.0),
+            (0.0, -1.0, -1.366025403784),
+            (0.5, -0.866025403784, -1.866025403784),
+            (0.866025403784, -0.5, -1.366025403784),
+            (1.0, 0.0, 0.0),
+        ]),
+        ((0, 1, 0), [
+            (0.866025403784, 0.5, 5.098076211353),
+            (0.5, 0.866025403784, 5.598076211353),
+            (0.0, 1.0, 5.098076211353),
+            (-0.5, 0.866025403784, 3.732050807569),
+            (-0.866025403784, 0.5, 1.866025403784),
+            (-1.0, 0.0, 0.0),
+            (-0.866025403784, -0.5, -1.366025403784),
+            (-0.5, -0.866025403784, -1.866025403784),
+            (0.0, -1.0, -1.366025403784),
+            (0.5, -0.866025403784, 0.0),
+            (0.866025403784, -0.5, 1.866025403784),
+            (1.0, 0.0, 3.732050807569),
+        ]),
+        ((1, 1, 0), [
+            (0.866025403784, 0.5, 8.330127018922),
+            (0.5, 0.866025403784, 7.464101615138),
+            (0.0, 1.0, 5.098076211353),
+            (-0.5, 0.866025403784, 1.866025403784),
+            (-0.866025403784, 0.5, -1.366025403784),
+            (-1.0, 0.0, -3.732050807569),
+            (-0.866025403784, -0.5, -4.598076211353),
+            (-0.5, -0.866025403784, -3.732050807569),
+            (0.0, -1.0, -1.366025403784),
+            (0.5, -0.866025403784, 1.866025403784),
+            (0.866025403784, -0.5, 5.098076211353),
+            (1.0, 0.0, 7.464101615138),
+        ]),
+    ],
+    (3, 4, 6, 4): [
+        ((0, 0, 0), [
+            (0.5, 0.866025403784, 0.866025403784),
+            (-0.5, 0.866025403784, 0.866025403784),
+            (-1.0, 0.0, 0.866025403784),
+            (-0.5, -0.866025403784, 0.866025403784),
+            (0.5, -0.866025403784, 0.866025403784),
+            (1.0, 0.0, 0.866025403784),
+        ]),
+        ((0, 0, 2), [
+            (0.0, 1.0, 1.866025403784),
+            (-0.866025403784, -0.5, -0.5),
+            (0.866025403784, -0.5, -0.5),
+        ]),
+        ((0, 0, 3), [
+            (0.5, 0.866025403784, 1.866025403784),
+            (-0.866025403784, 0.5, 0.5),
+            (-0.5, -0.866025403784, -0.866025403784),
+            (0.866025403784, -0.5, 0.5),
+        ]),
+        ((0, 0, 4), [
+            (-0.866025403784, 0.5, -0.5),
+            (0.0, -1.0, -0.5),
+            (0.866025403784, 0.5, 1.866025403784),
+        ]),
+        ((0, 0, 5), [
+            (0.0, 1.0, 0.5),
+            (-1.0, 0.0, -0.866025403784),
+            (0.0, -1.0, 0.5),
+            (1.0, 0.0, 1.866025403784),
+        ]),
+        ((1, 0, 0), [
+            (0.5, 0.866025403784, 2.232050807569),
+            (-0.5, 0.866025403784, -0.5),
+            (-1.0, 0.0, -1.866025403784),
+            (-0.5, -0.866025403784, -0.5),
+            (0.5, -0.866025403784, 2.232050807569),
+            (1.0, 0.0, 3.598076211353),
+        ]),
+        ((1, 0, 1), [
+            (-0.5, 0.866025403784, 0.5),
+            (-0.866025403784, -0.5, -1.866025403784),
+            (0.5, -0.866025403784, 0.5),
+            (0.866025403784, 0.5, 2.866025403784),
+        ]),
+        ((1, 0, 2), [
+            (0.0, 1.0, 1.866025403784),
+            (-0.866025403784, -0.5, -2.866025403784),
+            (0.866025403784, -0.5, 1.866025403784),
+        ]),
+        ((1, 0, 3), [
+            (0.5, 0.866025403784, 3.232050807569),
+            (-0.866025403784, 0.5, -1.866025403784),
+            (-0.5, -0.866025403784, -2.232050807569),
+            (0.866025403784, -0.5, 2.866025403784),
+        ]),
+        ((1, 0, 4), [
+            (-0.866025403784, 0.5, -2.866025403784),
+            (0.0, -1.0, -0.5),
+            (0.866025403784, 0.5, 4.232050807569),
+        ]),
+        ((1, 0, 5), [
+            (0.0, 1.0, 0.5),
+            (-1.0, 0.0, -3.598076211353),
+            (0.0, -1.0, 0.5),
+            (1.0, 0.0, 4.598076211353),
+        ]),
+        ((-1, 1, 5), [
+            (0.0, 1.0, 2.866025403784),
+            (-1.0, 0.0, 0.5),
+            (0.0, -1.0, -1.866025403784),
+            (1.0, 0.0, 0.5),
+        ]),
+        ((0, 1, 0), [
+            (0.5, 0.866025403784, 3.598076211353),
+            (-0.5, 0.866025403784, 2.232050807569),
+            (-1.0, 0.0, -0.5),
+            (-0.5, -0.866025403784, -1.866025403784),
+            (0.5, -0.866025403784, -0.5),
+            (1.0, 0.0, 2.232050807569),
+        ]),
+        ((0, 1, 5), [
+            (0.0, 1.0, 2.866025403784),
+            (-1.0, 0.0, -2.232050807569),
+            (0.0, -1.0, -1.866025403784),
+            (1.0, 0.0, 3.232050807569),
+        ]),
+        ((1, 1, 0), [
+            (0.5, 0.866025403784, 4.964101615138),
+            (-0.5, 0.866025403784, 0.866025403784),
+            (-1.0, 0.0, -3.232050807569),
+            (-0.5, -0.866025403784, -3.232050807569),
+            (0.5, -0.866025403784, 0.866025403784),
+            (1.0, 0.0, 4.964101615138),
+        ]),
+    ],
+    (3, 6, 3, 6): [
+        ((1, -1, 1), [
+            (-0.866025403784, 0.5, -0.866025403784),
+            (0.0, -1.0, 0.866025403784),
+            (0.866025403784, 0.5, 0.866025403784),
+        ]),
+        ((0, 0, 0), [
+            (0.0, 1.0, 0.866025403784),
+            (-0.866025403784, 0.5, 0.866025403784),
+            (-0.866025403784, -0.5, 0.866025403784),
+            (0.0, -1.0, 0.866025403784),
+            (0.866025403784, -0.5, 0.866025403784),
+            (0.866025403784, 0.5, 0.866025403784),
+        ]),
+        ((0, 0, 1), [
+            (-0.866025403784, 0.5, 0.866025403784),
+            (0.0, -1.0, -0.866025403784),
+            (0.866025403784, 0.5, 0.866025403784),
+        ]),
+        ((0, 0, 2), [
+            (0.0, 1.0, 0.866025403784),
+            (-0.866025403784, -0.5, -0.866025403784),
+            (0.866025403784, -0.5, 0.866025403784),
+        ]),
+        ((1, 0, 0), [
+            (0.0, 1.0, 0.866025403784),
+            (-0.866025403784, 0.5, -0.866025403784),
+            (-0.866025403784, -0.5, -0.866025403784),
+            (0.0, -1.0, 0.866025403784),
+            (0.866025403784, -0.5, 2.598076211353),
+            (0.866025403784, 0.5, 2.598076211353),
+        ]),
+        ((1, 0, 1), [
+            (-0.866025403784, 0.5, -0.866025403784),
+            (0.0, -1.0, -0.866025403784),
+            (0.866025403784, 0.5, 2.598076211353),
+        ]),
+        ((1, 0, 2), [
+            (0.0, 1.0, 0.866025403784),
+            (-0.866025403784, -0.5, -2.598076211353),
+            (0.866025403784, -0.5, 2.598076211353),
+        ]),
+        ((-1, 1, 0), [
+            (0.0, 1.0, 2.598076211353),
+            (-0.866025403784, 0.5, 2.598076211353),
+            (-0.866025403784, -0.5, 0.866025403784),
+            (0.0, -1.0, -0.866025403784),
+            (0.866025403784, -0.5, -0.866025403784),
+            (0.866025403784, 0.5, 0.866025403784),
+        ]),
+        ((0, 1, 0), [
+            (0.0, 1.0, 2.598076211353),
+            (-0.866025403784, 0.5, 0.866025403784),
+            (-0.866025403784, -0.5, -0.866025403784),
+            (0.0, -1.0, -0.866025403784),
+            (0.866025403784, -0.5, 0.866025403784),
+            (0.866025403784, 0.5, 2.598076211353),
+        ]),
+        ((1, 1, 0), [
+            (0.0, 1.0, 2.598076211353),
+            (-0.866025403784, 0.5, -0.866025403784),
+            (-0.866025403784, -0.5, -2.598076211353),
+            (0.0, -1.0, -0.866025403784),
+            (0.866025403784, -0.5, 2.598076211353),
+            (0.866025403784, 0.5, 4.330127018922),
+        ]),
+    ],
+    (4, 6, 12): [
+        ((1, -1, 3), [
+            (0.0, 1.0, -1.866025403784),
+            (-1.0, 0.0, 0.5),
+            (0.0, -1.0, 2.866025403784),
+            (1.0, 0.0, 0.5),
+        ]),
+        ((1, -1, 4), [
+            (0.5, 0.866025403784, -0.5),
+            (-0.5, 0.866025403784, -1.866025403784),
+            (-1.0, 0.0, -0.5),
+            (-0.5, -0.866025403784, 2.232050807569),
+            (0.5, -0.866025403784, 3.598076211353),
+            (1.0, 0.0, 2.232050807569),
+        ]),
+        ((0, 0, 0), [
+            (0.866025403784, 0.5, 1.866025403784),
+            (0.5, 0.866025403784, 1.866025403784),
+            (0.0, 1.0, 1.866025403784),
+            (-0.5, 0.866025403784, 1.866025403784),
+            (-0.866025403784, 0.5, 1.866025403784),
+            (-1.0, 0.0, 1.866025403784),
+            (-0.866025403784, -0.5, 1.866025403784),
+            (-0.5, -0.866025403784, 1.866025403784),
+            (0.0, -1.0, 1.866025403784),
+            (0.5, -0.866025403784, 1.866025403784),
+            (0.866025403784, -0.5, 1.866025403784),
+            (1.0, 0.0, 1.866025403784),
+        ]),
+        ((0, 0, 3), [
+            (0.0, 1.0, 2.866025403784),
+            (-1.0, 0.0, 0.5),
+            (0.0, -1.0, -1.866025403784),
+            (1.0, 0.0, 0.5),
+        ]),
+        ((0, 0, 4), [
+            (0.5, 0.866025403784, 3.598076211353),
+            (-0.5, 0.866025403784, 2.232050807569),
+            (-1.0, 0.0, -0.5),
+            (-0.5, -0.866025403784, -1.866025403784),
+            (0.5, -0.866025403784, -0.5),
+            (1.0, 0.0, 2.232050807569),
+        ]),
+        ((0, 0, 5), [
+            (-0.5, 0.866025403784, 0.5),
+            (-0.866025403784, -0.5, -1.866025403784),
+            (0.5, -0.866025403784, 0.5),
+            (0.866025403784, 0.5, 2.866025403784),
+        ]),
+        ((1, 0, 0), [
+            (0.866025403784, 0.5, 4.232050807569),
+            (0.5, 0.866025403784, 1.866025403784),
+            (0.0, 1.0, -0.5),
+            (-0.5, 0.866025403784, -2.232050807569),
+            (-0.866025403784, 0.5, -2.866025403784),
+            (-1.0, 0.0, -2.232050807569),
+            (-0.866025403784, -0.5, -0.5),
+            (-0.5, -0.866025403784, 1.866025403784),
+            (0.0, -1.0, 4.232050807569),
+            (0.5, -0.866025403784, 5.964101615138),
+            (0.866025403784, -0.5, 6.598076211353),
+            (1.0, 0.0, 5.964101615138),
+        ]),
+        ((1, 0, 1), [
+            (0.5, 0.866025403784, 0.5),
+            (-0.866025403784, 0.5, -1.866025403784),
+            (-0.5, -0.866025403784, 0.5),
+            (0.866025403784, -0.5, 2.866025403784),
+        ]),
+        ((1, 0, 2), [
+            (0.5, 0.866025403784, 2.232050807569),
+            (-0.5, 0.866025403784, -0.5),
+            (-1.0, 0.0, -1.866025403784),
+            (-0.5, -0.866025403784, -0.5),
+            (0.5, -0.866025403784, 2.232050807569),
+            (1.0, 0.0, 3.598076211353),
+        ]),
+        ((1, 0, 3), [
+            (0.0, 1.0, 0.5),
+            (-1.0, 0.0, -3.598076211353),
+            (0.0, -1.0, 0.5),
+            (1.0, 0.0, 4.598076211353),
+        ]),
+        ((1, 0, 4), [
+            (0.5, 0.866025403784, 3.598076211353),
+            (-0.5, 0.866025403784, -1.866025403784),
+            (-1.0, 0.0, -4.598076211353),
+            (-0.5, -0.866025403784, -1.866025403784),
+            (0.5, -0.866025403784, 3.598076211353),
+            (1.0, 0.0, 6.330127018922),
+        ]),
+        ((1, 0, 5), [
+            (-0.5, 0.866025403784, -3.598076211353),
+            (-0.866025403784, -0.5, -4.232050807569),
+            (0.5, -0.866025403784, 4.598076211353),
+            (0.866025403784, 0.5, 5.232050807569),
+        ]),
+        ((0, 1, 0), [
+            (0.866025403784, 0.5, 6.598076211353),
+            (0.5, 0.866025403784, 5.964101615138),
+            (0.0, 1.0, 4.232050807569),
+            (-0.5, 0.866025403784, 1.866025403784),
+            (-0.866025403784, 0.5, -0.5),
+            (-1.0, 0.0, -2.232050807569),
+            (-0.866025403784, -0.5, -2.866025403784),
+            (-0.5, -0.866025403784, -2.232050807569),
+            (0.0, -1.0, -0.5),
+            (0.5, -0.866025403784, 1.866025403784),
+            (0.866025403784, -0.5, 4.232050807569),
+            (1.0, 0.0, 5.964101615138),
+        ]),
+        ((1, 1, 0), [
+            (0.866025403784, 0.5, 8.964101615138),
+            (0.5, 0.866025403784, 5.964101615138),
+            (0.0, 1.0, 1.866025403784),
+            (-0.5, 0.866025403784, -2.232050807569),
+            (-0.866025403784, 0.5, -5.232050807569),
+            (-1.0, 0.0, -6.330127018922),
+            (-0.866025403784, -0.5, -5.232050807569),
+            (-0.5, -0.866025403784, -2.232050807569),
+            (0.0, -1.0, 1.866025403784),
+            (0.5, -0.866025403784, 5.964101615138),
+            (0.866025403784, -0.5, 8.964101615138),
+            (1.0, 0.0, 10.062177826491),
+        ]),
+        ((1, 1, 1), [
+            (0.5, 0.866025403784, 4.598076211353),
+            (-0.866025403784, 0.5, -4.232050807569),
+            (-0.5, -0.866025403784, -3.598076211353),
+            (0.866025403784, -0.5, 5.232050807569),
+        ]),
+        ((1, 1, 2), [
+            (0.5, 0.866025403784, 6.330127018922),
+            (-0.5, 0.866025403784, -0.5),
+            (-1.0, 0.0, -5.964101615138),
+            (-0.5, -0.866025403784, -4.598076211353),
+            (0.5, -0.866025403784, 2.232050807569),
+            (1.0, 0.0, 7.696152422707),
+        ]),
+        ((1, 1, 3), [
+            (0.0, 1.0, 2.866025403784),
+            (-1.0, 0.0, -7.696152422707),
+            (0.0, -1.0, -1.866025403784),
+            (1.0, 0.0, 8.696152422707),
+        ]),
+    ],
+    (4, 8, 8): [
+        ((1, -1, 1), [
+            (0.0, 1.0, -1.207106781187),
+            (-1.0, 0.0, 0.5),
+            (0.0, -1.0, 2.207106781187),
+            (1.0, 0.0, 0.5),
+        ]),
+        ((0, 0, 0), [
+            (0.707106781187, 0.707106781187, 1.207106781187),
+            (0.0, 1.0, 1.207106781187),
+            (-0.707106781187, 0.707106781187, 1.207106781187),
+            (-1.0, 0.0, 1.207106781187),
+            (-0.707106781187, -0.707106781187, 1.207106781187),
+            (0.0, -1.0, 1.207106781187),
+            (0.707106781187, -0.707106781187, 1.207106781187),
+            (1.0, 0.0, 1.207106781187),
+        ]),
+        ((0, 0, 1), [
+            (0.0, 1.0, 2.207106781187),
+            (-1.0, 0.0, 0.5),
+            (0.0, -1.0, -1.207106781187),
+            (1.0, 0.0, 0.5),
+        ]),
+        ((1, 0, 0), [
+            (0.707106781187, 0.707106781187, 1.207106781187),
+            (0.0, 1.0, -0.5),
+            (-0.707106781187, 0.707106781187, -1.207106781187),
+            (-1.0, 0.0, -0.5),
+            (-0.707106781187, -0.707106781187, 1.207106781187),
+            (0.0, -1.0, 2.914213562373),
+            (0.707106781187, -0.707106781187, 3.62132034356),
+            (1.0, 0.0, 2.914213562373),
+        ]),
+        ((1, 0, 1), [
+            (0.0, 1.0, 0.5),
+            (-1.0, 0.0, -1.207106781187),
+            (0.0, -1.0, 0.5),
+            (1.0, 0.0, 2.207106781187),
+        ]),
+        ((0, 1, 0), [
+            (0.707106781187, 0.707106781187, 3.62132034356),
+            (0.0, 1.0, 2.914213562373),
+            (-0.707106781187, 0.707106781187, 1.207106781187),
+            (-1.0, 0.0, -0.5),
+            (-0.707106781187, -0.707106781187, -1.207106781187),
+            (0.0, -1.0, -0.5),
+            (0.707106781187, -0.707106781187, 1.207106781187),
+            (1.0, 0.0, 2.914213562373),
+        ]),
+        ((1, 1, 0), [
+            (0.707106781187, 0.707106781187, 3.62132034356),
+            (0.0, 1.0, 1.207106781187),
+            (-0.707106781187, 0.707106781187, -1.207106781187),
+            (-1.0, 0.0, -2.207106781187),
+            (-0.707106781187, -0.707106781187, -1.207106781187),
+            (0.0, -1.0, 1.207106781187),
+            (0.707106781187, -0.707106781187, 3.62132034356),
+            (1.0, 0.0, 4.62132034356),
+        ]),
+        ((1, 1, 1), [
+            (0.0, 1.0, 2.207106781187),
+            (-1.0, 0.0, -2.914213562373),
+            (0.0, -1.0, -1.207106781187),
+            (1.0, 0.0, 3.914213562373),
+        ]),
+    ],
+}
+
+# (i, j, v) of the vertices of each cell type
+CELL_VERTICES: Dict[Tuple[int, ...], Dict[
+    Tuple[int, ...], List[Tuple[int, int, int]]]] = {
+    (4, 4, 4, 4): {
+        (4, 4, 4, 4, 4, 0): [
+            (0, 0, 0),
+            (-1, 0, 0),
+            (-1, -1, 0),
+            (0, -1, 0),
+        ],
+    },
+    (6, 6, 6): {
+        (6, 6, 6, 6, 6, 6, 6, 0): [
+            (0, 0, 0),
+            (-1, 0, 1),
+            (-1, 0, 0),
+            (-1, -1, 1),
+            (0, -1, 0),
+            (0, -1, 1),
+        ],
+    },
+    (3, 3, 3, 3, 3, 3): {
+        (3, 3, 3, 3, 30): [
+            (-1, 0, 0),
+            (-1, -1, 0),
+            (0, -1, 0),
+        ],
+        (3, 3, 3, 3, 90): [
+            (0, 0, 0),
+            (-1, 0, 0),
+            (0, -1, 0),
+        ],
+    },
+    (3, 3, 3, 3, 6): {
+        (6, 3, 3, 3, 3, 3, 3, 30): [
+            (-1, 0, 0),
+            (-1, 0, 1),
+            (-1, -1, 2),
+            (0, -1, 3),
+            (0, -1, 4),
+            (0, 0, 5),
+        ],
+        (3, 3, 3, 6, 210): [
+            (-1, 0, 4),
+            (-1, 0, 3),
+            (-1, 0, 1),
+        ],
+        (3, 3, 3, 6, 30): [
+            (-1, 0, 4),
+            (-1, 0, 1),
+            (-1, 0, 0),
+        ],
+        (3, 3, 3, 3, 90): [
+            (-1, 0, 2),
+            (-1, 0, 4),
+            (-1, 0, 0),
+        ],
+        (3, 3, 3, 6, 150): [
+            (-1, 0, 2),
+            (-1, 0, 0),
+            (0, 0, 3),
+        ],
+        (3, 3, 3, 6, 330): [
+            (0, 0, 3),
+            (-1, 0, 0),
+            (0, 0, 5),
+        ],
+        (3, 3, 3, 3, 30): [
+            (0, 0, 3),
+            (0, 0, 5),
+            (0, 0, 1),
+        ],
+        (3, 3, 3, 6, 90): [
+            (0, 0, 1),
+            (0, 0, 5),
+            (0, -1, 2),
+        ],
+        (3, 3, 3, 6, 270): [
+            (0, 0, 5),
+            (0, -1, 4),
+            (0, -1, 2),
+        ],
+    },
+    (3, 3, 3, 4, 4): {
+        (4, 3, 4, 3, 4, 90): [
+            (0, 0, 0),
+            (-1, 0, 0),
+            (-1, -1, 1),
+            (0, -1, 1),
+        ],
+        (3, 3, 3, 4, 30): [
+            (-1, 0, 1),
+            (-1, 0, 0),
+            (0, 0, 0),
+        ],
+        (3, 3, 3, 4, 210): [
+            (0, 0, 1),
+            (-1, 0, 1),
+            (0, 0, 0),
+        ],
+    },
+    (3, 3, 4, 3, 4): {
+        (3, 3, 4, 4, 270): [
+            (-1, 0, 0),
+            (-1, -1, 1),
+            (0, 0, 2),
+        ],
+        (4, 3, 3, 3, 3, 60): [
+            (-1, 0, 0),
+            (-1, 0, 2),
+            (-1, -1, 3),
+            (-1, -1, 1),
+        ],
+        (3, 3, 4, 4, 0): [
+            (-1, 0, 3),
+            (-1, 0, 2),
+            (-1, 0, 0),
+        ],
+        (3, 3, 4, 4, 180): [
+            (-1, 0, 1),
+            (-1, 0, 3),
+            (-1, 0, 0),
+        ],
+        (4, 3, 3, 3, 3, 30): [
+            (-1, 0, 1),
+            (-1, 0, 0),
+            (0, 0, 2),
+            (0, 0, 3),
+        ],
+        (3, 3, 4, 4, 90): [
+            (0, 0, 2),
+            (-1, -1, 1),
+            (0, -1, 3),
+        ],
+    },
+    (3, 12, 12): {
+        (12, 3, 12, 3, 12, 3, 12, 3, 12, 3, 12, 3, 12, 30): [
+            (0, 0, 0),
+            (0, 0, 1),
+            (-1, 0, 2),
+            (-1, 0, 3),
+            (-1, 0, 4),
+            (-1, 0, 0),
+            (-1, -1, 5),
+            (-1, -1, 2),
+            (0, -1, 1),
+            (0, -1, 4),
+            (0, -1, 3),
+            (0, -1, 5),
+        ],
+        (3, 12, 12, 12, 30): [
+            (-1, 0, 5),
+            (-1, 0, 3),
+            (-1, 0, 2),
+        ],
+        (3, 12, 12, 12, 90): [
+            (0, 0, 4),
+            (0, 0, 1),
+            (0, 0, 0),
+        ],
+    },
+    (3, 4, 6, 4): {
+        (6, 4, 4, 4, 4, 4, 4, 0): [
+            (0, 0, 0),
+            (-1, 0, 1),
+            (-1, 0, 2),
+            (-1, -1, 3),
+            (0, -1, 4),
+            (0, -1, 5),
+        ],
+        (4, 3, 6, 3, 6, 30): [
+            (-1, 0, 5),
+            (-1, 0, 4),
+            (-1, 0, 2),
+            (-1, 0, 1),
+        ],
+        (3, 4, 4, 4, 90): [
+            (-1, 0, 3),
+            (-1, 0, 5),
+            (-1, 0, 1),
+        ],
+        (4, 3, 6, 3, 6, 150): [
+            (0, 0, 4),
+            (-1, 0, 3),
+            (-1, 0, 1),
+            (0, 0, 0),
+        ],
+        (3, 4, 4, 4, 30): [
+            (0, 0, 4),
+            (0, 0, 0),
+            (0, 0, 2),
+        ],
+        (4, 3, 6, 3, 6, 90): [
+            (0, 0, 2),
+            (0, 0, 0),
+            (0, -1, 5),
+            (0, -1, 3),
+        ],
+    },
+    (3, 6, 3, 6): {
+        (6, 3, 3, 3, 3, 3, 3, 30): [
+            (0, 0, 0),
+            (-1, 0, 1),
+            (-1, 0, 2),
+            (0, -1, 0),
+            (0, -1, 1),
+            (0, 0, 2),
+        ],
+        (3, 6, 6, 6, 30): [
+            (-1, 1, 2),
+            (-1, 0, 1),
+            (0, 0, 0),
+        ],
+        (3, 6, 6, 6, 90): [
+            (0, 0, 1),
+            (0, 0, 0),
+            (0, 0, 2),
+        ],
+    },
+    (4, 6, 12): {
+        (12, 4, 6, 4, 6, 4, 6, 4, 6, 4, 6, 4, 6, 30): [
+            (0, 0, 0),
+            (-1, 0, 1),
+            (-1, 0, 2),
+            (-1, 0, 3),
+            (-1, 0, 4),
+            (-1, -1, 5),
+            (-1, -1, 6),
+            (0, -1, 7),
+            (0, -1, 8),
+            (0, -1, 9),
+            (0, -1, 10),
+            (0, 0, 11),
+        ],
+        (4, 6, 12, 6, 12, 60): [
+            (-1, 0, 4),
+            (-1, 0, 11),
+            (-1, -1, 10),
+            (-1, -1, 5),
+        ],
+        (6, 4, 12, 4, 12, 4, 12, 0): [
+            (-1, 0, 8),
+            (-1, 0, 7),
+            (-1, 0, 0),
+            (-1, 0, 11),
+            (-1, 0, 4),
+            (-1, 0, 3),
+        ],
+        (4, 6, 12, 6, 12, 0): [
+            (-1, 0, 9),
+            (-1, 0, 8),
+            (-1, 0, 3),
+            (-1, 0, 2),
+        ],
+        (6, 4, 12, 4, 12, 4, 12, 60): [
+            (-1, 0, 5),
+            (-1, 0, 10),
+            (-1, 0, 9),
+            (-1, 0, 2),
+            (-1, 0, 1),
+            (-1, 0, 6),
+        ],
+        (4, 6, 12, 6, 12, 120): [
+            (-1, 0, 6),
+            (-1, 0, 1),
+            (0, 0, 0),
+            (0, 0, 7),
+        ],
+    },
+    (4, 8, 8): {
+        (8, 4, 8, 4, 8, 4, 8, 4, 8, 0): [
+            (0, 0, 0),
+            (-1, 0, 1),
+            (-1, 0, 2),
+            (-1, -1, 3),
+            (-1, -1, 1),
+            (0, -1, 0),
+            (0, -1, 3),
+            (0, 0, 2),
+        ],
+        (4, 8, 8, 8, 8, 0): [
+            (-1, 0, 3),
+            (-1, 0, 0),
+            (-1, 0, 2),
+            (-1, 0, 1),
+        ],
+    },
+}
+
+# (i, j, e) of the edges of each cell type (the edge m joins the
+# vertices m and m + 1)
+CELL_EDGES: Dict[Tuple[int, ...], Dict[
+    Tuple[int, ...], List[Tuple[int, int, int]]]] = {
+    (4, 4, 4, 4): {
+        (4, 4, 4, 4, 4, 0): [
+            (0, 0, 0),
+            (-1, 0, 1),
+            (0, -1, 0),
+            (0, 0, 1),
+        ],
+    },
+    (6, 6, 6): {
+        (6, 6, 6, 6, 6, 6, 6, 0): [
+            (0, 0, 0),
+            (-1, 0, 1),
+            (-1, 0, 2),
+            (0, -1, 0),
+            (0, -1, 1),
+            (0, 0, 2),
+        ],
+    },
+    (3, 3, 3, 3, 3, 3): {
+        (3, 3, 3, 3, 30): [
+            (-1, 0, 0),
+            (0, -1, 1),
+            (0, 0, 2),
+        ],
+        (3, 3, 3, 3, 90): [
+            (0, 0, 1),
+            (0, 0, 2),
+            (0, 0, 0),
+        ],
+    },
+    (3, 3, 3, 3, 6): {
+        (6, 3, 3, 3, 3, 3, 3, 30): [
+            (-1, 0, 0),
+            (-1, 0, 1),
+            (-1, -1, 2),
+            (0, -1, 3),
+            (0, -1, 4),
+            (0, 0, 5),
+        ],
+        (3, 3, 3, 6, 210): [
+            (-1, 0, 3),
+            (-1, 0, 6),
+            (-1, 0, 7),
+        ],
+        (3, 3, 3, 6, 30): [
+            (-1, 0, 7),
+            (-1, 0, 0),
+            (-1, 0, 8),
+        ],
+        (3, 3, 3, 3, 90): [
+            (-1, 0, 9),
+            (-1, 0, 8),
+            (-1, 0, 10),
+        ],
+        (3, 3, 3, 6, 150): [
+            (-1, 0, 10),
+            (0, 0, 11),
+            (-1, 0, 2),
+        ],
+        (3, 3, 3, 6, 330): [
+            (0, 0, 11),
+            (0, 0, 5),
+            (0, 0, 12),
+        ],
+        (3, 3, 3, 3, 30): [
+            (0, 0, 12),
+            (0, 0, 13),
+            (0, 0, 6),
+        ],
+        (3, 3, 3, 6, 90): [
+            (0, 0, 13),
+            (0, 0, 14),
+            (0, 0, 1),
+        ],
+        (3, 3, 3, 6, 270): [
+            (0, -1, 4),
+            (0, -1, 9),
+            (0, 0, 14),
+        ],
+    },
+    (3, 3, 3, 4, 4): {
+        (4, 3, 4, 3, 4, 90): [
+            (-1, 0, 0),
+            (-1, 0, 1),
+            (0, -1, 2),
+            (0, 0, 1),
+        ],
+        (3, 3, 3, 4, 30): [
+            (-1, 0, 3),
+            (-1, 0, 0),
+            (0, 0, 4),
+        ],
+        (3, 3, 3, 4, 210): [
+            (0, 0, 2),
+            (0, 0, 4),
+            (0, 0, 3),
+        ],
+    },
+    (3, 3, 4, 3, 4): {
+        (3, 3, 4, 4, 270): [
+            (-1, -1, 0),
+            (0, -1, 1),
+            (0, 0, 2),
+        ],
+        (4, 3, 3, 3, 3, 60): [
+            (-1, 0, 3),
+            (-1, -1, 4),
+            (-1, -1, 5),
+            (-1, -1, 0),
+        ],
+        (3, 3, 4, 4, 0): [
+            (-1, 0, 6),
+            (-1, 0, 3),
+            (-1, 0, 7),
+        ],
+        (3, 3, 4, 4, 180): [
+            (-1, 0, 5),
+            (-1, 0, 7),
+            (-1, 0, 8),
+        ],
+        (4, 3, 3, 3, 3, 30): [
+            (-1, 0, 8),
+            (0, 0, 2),
+            (0, 0, 6),
+            (0, 0, 9),
+        ],
+        (3, 3, 4, 4, 90): [
+            (0, -1, 1),
+            (0, -1, 9),
+            (0, -1, 4),
+        ],
+    },
+    (3, 12, 12): {
+        (12, 3, 12, 3, 12, 3, 12, 3, 12, 3, 12, 3, 12, 30): [
+            (0, 0, 0),
+            (0, 0, 1),
+            (-1, 0, 2),
+            (-1, 0, 3),
+            (-1, 0, 4),
+            (-1, 0, 5),
+            (-1, -1, 6),
+            (0, -1, 1),
+            (0, -1, 7),
+            (0, -1, 3),
+            (0, -1, 8),
+            (0, 0, 5),
+        ],
+        (3, 12, 12, 12, 30): [
+            (-1, 0, 8),
+            (-1, 0, 2),
+            (-1, 0, 6),
+        ],
+        (3, 12, 12, 12, 90): [
+            (0, 0, 7),
+            (0, 0, 0),
+            (0, 0, 4),
+        ],
+    },
+    (3, 4, 6, 4): {
+        (6, 4, 4, 4, 4, 4, 4, 0): [
+            (0, 0, 0),
+            (-1, 0, 1),
+            (-1, 0, 2),
+            (0, -1, 3),
+            (0, -1, 4),
+            (0, 0, 5),
+        ],
+        (4, 3, 6, 3, 6, 30): [
+            (-1, 0, 4),
+            (-1, 0, 6),
+            (-1, 0, 1),
+            (-1, 0, 7),
+        ],
+        (3, 4, 4, 4, 90): [
+            (-1, 0, 8),
+            (-1, 0, 7),
+            (-1, 0, 9),
+        ],
+        (4, 3, 6, 3, 6, 150): [
+            (0, 0, 3),
+            (-1, 0, 9),
+            (0, 0, 0),
+            (0, 0, 10),
+        ],
+        (3, 4, 4, 4, 30): [
+            (0, 0, 10),
+            (0, 0, 11),
+            (0, 0, 6),
+        ],
+        (4, 3, 6, 3, 6, 90): [
+            (0, 0, 11),
+            (0, 0, 5),
+            (0, -1, 8),
+            (0, 0, 2),
+        ],
+    },
+    (3, 6, 3, 6): {
+        (6, 3, 3, 3, 3, 3, 3, 30): [
+            (-1, 0, 0),
+            (-1, 0, 1),
+            (-1, -1, 2),
+            (0, -1, 3),
+            (0, -1, 4),
+            (0, 0, 5),
+        ],
+        (3, 6, 6, 6, 30): [
+            (-1, 0, 4),
+            (-1, 0, 0),
+            (-1, 0, 2),
+        ],
+        (3, 6, 6, 6, 90): [
+            (0, 0, 3),
+            (0, 0, 5),
+            (0, 0, 1),
+        ],
+    },
+    (4, 6, 12): {
+        (12, 4, 6, 4, 6, 4, 6, 4, 6, 4, 6, 4, 6, 30): [
+            (0, 0, 0),
+            (-1, 0, 1),
+            (-1, 0, 2),
+            (-1, 0, 3),
+            (-1, 0, 4),
+            (-1, -1, 5),
+            (0, -1, 6),
+            (0, -1, 7),
+            (0, -1, 8),
+            (0, -1, 9),
+            (0, 0, 10),
+            (0, 0, 11),
+        ],
+        (4, 6, 12, 6, 12, 60): [
+            (-1, 0, 12),
+            (-1, 0, 10),
+            (-1, -1, 13),
+            (-1, 0, 4),
+        ],
+        (6, 4, 12, 4, 12, 4, 12, 0): [
+            (-1, 0, 7),
+            (-1, 0, 14),
+            (-1, 0, 11),
+            (-1, 0, 12),
+            (-1, 0, 3),
+            (-1, 0, 15),
+        ],
+        (4, 6, 12, 6, 12, 0): [
+            (-1, 0, 8),
+            (-1, 0, 15),
+            (-1, 0, 2),
+            (-1, 0, 16),
+        ],
+        (6, 4, 12, 4, 12, 4, 12, 60): [
+            (-1, 0, 13),
+            (-1, 0, 9),
+            (-1, 0, 16),
+            (-1, 0, 1),
+            (-1, 0, 17),
+            (-1, 0, 5),
+        ],
+        (4, 6, 12, 6, 12, 120): [
+            (-1, 0, 17),
+            (0, 0, 0),
+            (0, 0, 14),
+            (0, 0, 6),
+        ],
+    },
+    (4, 8, 8): {
+        (8, 4, 8, 4, 8, 4, 8, 4, 8, 0): [
+            (0, 0, 0),
+            (-1, 0, 1),
+            (-1, 0, 2),
+            (-1, -1, 3),
+            (0, -1, 0),
+            (0, -1, 4),
+            (0, 0, 2),
+            (0, 0, 5),
+        ],
+        (4, 8, 8, 8, 8, 0): [
+            (-1, 0, 4),
+            (-1, 0, 5),
+            (-1, 0, 1),
+            (-1, 0, 3),
+        ],
+    },
+}
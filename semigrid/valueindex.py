@@ -0,0 +1,179 @@
+"""
+Spatial index of the cells that have a value assigned.
+
+The index keeps the sorted ids (see 'cellid') of the cells of one layer and
+their values in a parallel array. The cells of a unit block (i, j) have
+consecutive ids, so the cells with a value within an area range are found
+by a binary search per unit block near the range - the cost depends on the
+range, not on the number of values.
+"""
+from typing import Tuple, Dict, Mapping, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.cellid import K_BITS, IJ_BIAS, pack_indices, unpack_indices
+from semigrid.pyramid import Layer, Value
+from semigrid.tiles import AreaRange, bboxes_visible
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+class ValueIndex:
+    """
+    Sorted ids of the cells with a value of one layer ('rgba' or 'num') and
+    their values - (N,) array of numerical values or (N, 4) array of RGBA
+    values. The grid passes every write and deletion to the index; they are
+    merged into the arrays on the next query.
+    """
+    def __init__(self, grid: 'SemiregularGrid', layer: Layer) -> None:
+        if layer not in ('rgba', 'num'):
+            raise Exception("Layer must be 'rgba' or 'num'.")
+        self._grid = grid
+        self._shape = (-1, 4) if layer == 'rgba' else (-1,)
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._values = np.zeros((0, *self._shape[1:]))
+        # {index: value} of the written values (None of the deleted ones)
+        self._pending: Dict[Tuple[int, int, int], Optional[Value]] = {}
+        self._revision = 0
+        self._bounds: Optional[Tuple[int, int, int, int]] = None
+
+    @property
+    def revision(self) -> int:
+        """Number of the changes of the values (for caches of renderings)."""
+        return self._revision
+
+    def _pack(self, values: Mapping[Tuple[int, int, int], Value]) \
+            -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sorted ids of the cells of 'values' and their values (the cells
+        outside the range of the ids are too far to be visible and are left
+        out).
+        """
+        indices = np.array(list(values), dtype=np.int64).reshape(-1, 3)
+        array = np.array(list(values.values()),
+                         dtype=np.float64).reshape(self._shape)
+        ij = indices[:, :2]
+        packable = np.all((-IJ_BIAS <= ij) & (ij < IJ_BIAS), axis=1)
+        ids = pack_indices(indices[packable])
+        order = np.argsort(ids)
+        return ids[order], array[packable][order]
+
+    def rebuild(self, values: Mapping[Tuple[int, int, int], Value]) -> None:
+        """Index all the 'values' of the layer again."""
+        self._ids, self._values = self._pack(values)
+        self._pending = {}
+        self._revision += 1
+        self._bounds = None
+
+    def share(self, ids: np.ndarray, values: np.ndarray) -> None:
+        """
+        Index the sorted 'ids' and 'values' of a shared layer (see
+        'sharedlayer') without copying them - the cells must not change, so
+        the arrays are only written in place.
+        """
+        self._ids, self._values = ids, values
+        self._pending = {}
+        self._revision += 1
+        self._bounds = None
+
+    def set(self, index: Tuple[int, int, int], value: Value) -> None:
+        """Set the 'value' of the cell with the 'index'."""
+        self._pending[index] = value
+        self._revision += 1
+
+    def remove(self, index: Tuple[int, int, int]) -> None:
+        """Remove the value of the cell with the 'index'."""
+        self._pending[index] = None
+        self._revision += 1
+
+    def _merge(self) -> None:
+        """Merge the written and deleted values into the arrays."""
+        if not self._pending:
+            return
+        removed = [index for index, value in self._pending.items()
+                   if value is None]
+        if removed:
+            indices = np.array(removed, dtype=np.int64)
+            ij = indices[:, :2]
+            ids = pack_indices(indices[np.all(
+                (-IJ_BIAS <= ij) & (ij < IJ_BIAS), axis=1)])
+            positions = np.searchsorted(self._ids, ids)
+            found = positions < len(self._ids)
+            found[found] = self._ids[positions[found]] == ids[found]
+            if np.any(found):
+                self._ids = np.delete(self._ids, positions[found])
+                self._values = np.delete(self._values, positions[found],
+                                         axis=0)
+        written = {index: value for index, value in self._pending.items()
+                   if value is not None}
+        self._pending = {}
+        self._bounds = None
+        ids, values = self._pack(written)
+        positions = np.searchsorted(self._ids, ids)
+        found = positions < len(self._ids)
+        found[found] = self._ids[positions[found]] == ids[found]
+        self._values[positions[found]] = values[found]
+        # the arrays are replaced only if cells were added (the arrays of a
+        # shared layer are updated in place)
+        if not np.all(found):
+            self._ids = np.insert(self._ids, positions[~found], ids[~found])
+            self._values = np.insert(self._values, positions[~found],
+                                     values[~found], axis=0)
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted ids of the cells with a value and their values."""
+        self._merge()
+        return self._ids, self._values
+
+    def bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Bounds (min_i, max_i, min_j, max_j) of the unit blocks of the cells
+        with a value, None if there are none.
+        """
+        self._merge()
+        if self._bounds is None and len(self._ids):
+            indices = unpack_indices(self._ids)
+            self._bounds = int(indices[:, 0].min()), \
+                int(indices[:, 0].max()), int(indices[:, 1].min()), \
+                int(indices[:, 1].max())
+        return self._bounds
+
+    def lookup(self, ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Answer (for each of the 'ids') whether the cell has a value, and the
+        values (arbitrary rows of the values where there is none).
+        """
+        self._merge()
+        if len(self._ids) == 0:
+            return np.zeros(len(ids), dtype=bool), \
+                np.zeros((len(ids), *self._shape[1:]))
+        positions = np.minimum(np.searchsorted(self._ids, ids),
+                               len(self._ids) - 1)
+        return self._ids[positions] == ids, self._values[positions]
+
+    def in_range(self, area_range: AreaRange) \
+            -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sorted ids and values of the cells with a value visible within the
+        range.
+        """
+        self._merge()
+        builder = self._grid._get_tile_builder()
+        min_i, max_i, min_j, max_j = builder._ij_bounds(area_range)
+        if (max_i - min_i + 1) * (max_j - min_j + 1) >= 2 * len(self._ids):
+            # wide range - scanning all the values is cheaper
+            rows = np.arange(len(self._ids))
+        else:
+            i, j = builder._blocks_in_range(area_range)
+            block_ids = pack_indices(np.stack((i, j, np.zeros_like(i)),
+                                              axis=1))
+            starts = np.searchsorted(self._ids, block_ids)
+            counts = np.searchsorted(self._ids, block_ids + (1 << K_BITS)) \
+                - starts
+            rows = np.sort(np.repeat(starts - np.cumsum(counts) + counts,
+                                     counts) + np.arange(counts.sum()))
+
+        visible = bboxes_visible(
+            builder.bboxes(unpack_indices(self._ids[rows])), area_range)
+        return self._ids[rows[visible]], self._values[rows[visible]]
@@ -0,0 +1,95 @@
+"""
+Incremental updates of the visible part of the grid.
+"""
+from typing import Tuple, List, TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.cellid import pack_indices
+from semigrid.tiles import AreaRange, bboxes_visible
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+def _ranges_overlap(a: AreaRange, b: AreaRange) -> bool:
+    """Answer whether the ranges 'a' and 'b' are overlapping."""
+    return a[0][0] < b[1][0] and b[0][0] < a[1][0] and \
+        a[0][1] < b[1][1] and b[0][1] < a[1][1]
+
+
+def range_difference(a: AreaRange, b: AreaRange, margin: float) \
+        -> List[AreaRange]:
+    """
+    Split the part of the range 'a' that is not covered by the range 'b'
+    into (at most four) strips. The strips reach 'margin' into 'b', so no
+    point on the border of 'b' is left out.
+    """
+    if not _ranges_overlap(a, b):
+        return [a]
+
+    (a_min_x, a_min_y), (a_max_x, a_max_y) = a
+    (b_min_x, b_min_y), (b_max_x, b_max_y) = b
+    strips = []
+    if a_min_x < b_min_x:
+        strips.append(((a_min_x, a_min_y), (b_min_x + margin, a_max_y)))
+    if b_max_x < a_max_x:
+        strips.append(((b_max_x - margin, a_min_y), (a_max_x, a_max_y)))
+
+    min_x, max_x = max(a_min_x, b_min_x), min(a_max_x, b_max_x)
+    if a_min_y < b_min_y:
+        strips.append(((min_x, a_min_y), (max_x, b_min_y + margin)))
+    if b_max_y < a_max_y:
+        strips.append(((min_x, b_max_y - margin), (max_x, a_max_y)))
+
+    return strips
+
+
+class Viewport:
+    """
+    Rectangular view of the grid that can be moved. Every update reports
+    only the cells that entered or left the view; they are found within the
+    strips between the previous and the new range, so the cost of the update
+    is proportional to the area that has changed.
+    """
+    def __init__(self, grid: 'SemiregularGrid',
+                 area_range: AreaRange) -> None:
+        self._grid = grid
+        self._builder = grid._get_tile_builder()
+        self._area_range = area_range
+        # strips overlap the previous range by a fraction of the edge
+        self._margin = grid.edge_size / 1000
+
+    @property
+    def area_range(self) -> AreaRange:
+        return self._area_range
+
+    def cells(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Ids and centres of all the visible cells."""
+        indices, centres, _ = self._builder.cells_in_range(self._area_range)
+        return pack_indices(indices), centres
+
+    def _entering(self, new_range: AreaRange, old_range: AreaRange) \
+            -> np.ndarray:
+        """Ids of the cells visible within 'new_range' only."""
+        found = []
+        for strip in range_difference(new_range, old_range, self._margin):
+            indices, _, bboxes = self._builder.cells_in_range(strip)
+            mask = bboxes_visible(bboxes, new_range) & \
+                ~bboxes_visible(bboxes, old_range)
+            found.append(pack_indices(indices[mask]))
+
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(found))
+
+    def update_viewport(self, new_range: AreaRange) \
+            -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Move the view to 'new_range' and return ids (see 'cellid') of the
+        cells that were added to the view and of those removed from it.
+        """
+        old_range = self._area_range
+        self._area_range = new_range
+        return self._entering(new_range, old_range), \
+            self._entering(old_range, new_range)
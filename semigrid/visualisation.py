@@ -1,13 +1,116 @@
 from semigrid.semiregulargrid import SemiregularGrid
+from semigrid.viewport import Viewport
+from semigrid.cellid import unpack_indices
+from semigrid.raster import rasterise
 
 import matplotlib.pyplot as plt
-from matplotlib.backend_bases import Event, KeyEvent
-from matplotlib.patches import Polygon
-from matplotlib.collections import LineCollection
+from matplotlib.backend_bases import Event, KeyEvent, MouseEvent, TimerBase
+from matplotlib.collections import Collection, LineCollection, \
+    PathCollection, PolyCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path
+from matplotlib.textpath import text_to_path
+from matplotlib.transforms import IdentityTransform
+from matplotlib.artist import Artist
 from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
 from matplotlib.axes import Axes
 
-from typing import Tuple, Any, Callable
+from typing import Tuple, Dict, List, Any, Callable, Optional, Sequence, \
+    cast
+import math
+import time
+import numpy as np
+
+
+# minimal time (in seconds) between two redraws while dragging, the motion
+# events in between are coalesced into one frame
+FRAME_INTERVAL = 1 / 30
+
+# level of detail - the views with fewer pixels per cell are rasterised
+RASTER_CELL_PIXELS = 16
+# size of the pixels of the raster (in pixels of the screen)
+RASTER_PIXEL_SIZE = 2
+# minimal size of the blocks outlined over the raster (in pixels)
+OUTLINE_BLOCK_PIXELS = 64
+
+
+def _segments(lines: np.ndarray) -> Sequence[np.ndarray]:
+    """
+    The (E, 2, 2) array of the 'lines' as the segments of a LineCollection
+    (matplotlib takes the array as it is, without a list of its rows).
+    """
+    return cast(Sequence[np.ndarray], lines)
+
+
+def _colours(rgba: np.ndarray) -> Sequence[Tuple[float, float, float, float]]:
+    """The (N, 4) array of the 'rgba' colours as the colours of artists."""
+    return cast(Sequence[Tuple[float, float, float, float]], rgba)
+
+
+class _TextCollection(PathCollection):
+    """
+    Many short texts drawn at once as the outlines of their glyphs, each
+    text centred horizontally on its offset (in data coordinates).
+    The outlines of the characters are computed once per collection.
+    """
+    def __init__(self, transform_offsets: Any, fontsize: float,
+                 fontweight: str = 'normal', **kwargs: Any) -> None:
+        # the paths are in points, the size 1 scales them to pixels
+        super().__init__([], sizes=[1], offsets=np.zeros((0, 2)),
+                         offset_transform=transform_offsets, **kwargs)
+        self.set_transform(IdentityTransform())
+        self._prop = FontProperties(size=fontsize, weight=fontweight)
+        self._glyphs: Dict[str, Tuple[np.ndarray, np.ndarray, float]] = {}
+
+    def _glyph(self, char: str) -> Tuple[np.ndarray, np.ndarray, float]:
+        """Vertices, codes and advance of the character's outline."""
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            vertices, codes = text_to_path.get_text_path(self._prop, char)
+            width = text_to_path.get_text_width_height_descent(
+                char, self._prop, ismath=False)[0]
+            glyph = (np.array(vertices, dtype=np.float64).reshape(-1, 2) *
+                     self._prop.get_size_in_points() /
+                     text_to_path.FONT_SCALE,
+                     np.array(codes, dtype=Path.code_type), width)
+            self._glyphs[char] = glyph
+        return glyph
+
+    def text_paths(self, texts: List[str]) -> List[Path]:
+        """Outlines of the 'texts', each centred horizontally on the origin."""
+        if not texts:
+            return []
+        chars = list(''.join(texts))
+        glyphs = {char: self._glyph(char) for char in set(chars)}
+        lengths = np.array([len(text) for text in texts], dtype=np.int64)
+        widths = np.array([glyphs[char][2] for char in chars])
+        counts = np.array([len(glyphs[char][1]) for char in chars],
+                          dtype=np.int64)
+
+        # the characters are shifted by their advance relative to the middle
+        # of their text
+        label = np.repeat(np.arange(len(texts)), lengths)
+        advances = np.concatenate(([0.0], np.cumsum(widths)))
+        text_ends = np.cumsum(lengths)
+        middles = (advances[text_ends - lengths] + advances[text_ends]) / 2
+        shifts = advances[:-1] - middles[label]
+
+        vertices = np.concatenate([glyphs[char][0] for char in chars] +
+                                  [np.zeros((0, 2))])
+        vertices[:, 0] += np.repeat(shifts, counts)
+        codes = np.concatenate([glyphs[char][1] for char in chars] +
+                               [np.zeros(0, dtype=Path.code_type)])
+        bounds = np.cumsum(np.bincount(label, weights=counts,
+                                       minlength=len(texts)))[:-1]
+        bounds = bounds.astype(np.int64)
+        return [Path(text_vertices, text_codes) for text_vertices, text_codes
+                in zip(np.split(vertices, bounds), np.split(codes, bounds))]
+
+    def set_texts(self, paths: List[Path], offsets: np.ndarray) -> None:
+        """Draw the texts (outlines by 'text_paths') at the 'offsets'."""
+        self.set_paths(paths)
+        self.set_offsets(offsets.reshape(-1, 2))
 
 
 class Visualisation:
@@ -25,15 +128,55 @@ class Visualisation:
         self.ylim_now = (area_range[0][1], area_range[1][1])
 
         self.dragging = False
+        # the redraw pipeline - frames of coalesced motion events, pans are
+        # blitted over the cached background of the axes
+        self._last_frame = 0.0
+        self._pending_frame = False
+        self._frame_timer: Optional[TimerBase] = None
+        # (x, y) of the press (in pixels), xlim and ylim at that time
+        self._pan_start: Optional[Tuple[float, float, Tuple[float, float],
+                                        Tuple[float, float]]] = None
+        self._background: Any = None
 
         self.show_index = False
         self.show_value = False
         self.show_centre = False
         self.show_dual = False
+        self.show_outlines = True
+        # whether the view is zoomed out so far it is rasterised
+        self._rasterised = False
 
         self.fig, self.ax = self._create_subplot(figure_name)
         self.colours = ['black', 'blue', 'green']
 
+        # for each grid: the view, its visible cells {index: centre} and
+        # the artists that are updated (not recreated) when the view moves
+        self._viewports = [Viewport(g, area_range) for g in self.grids]
+        self._cells: List[Dict[Tuple[int, int, int], Tuple[float, float]]] \
+            = [{} for _ in self.grids]
+        self._edge_collections: List[LineCollection] = []
+        # for each grid: {index: (E, 2, 2) array} of the edges owned by the
+        # visible cells (updated by the cells that entered or left the view)
+        self._cell_edges: List[Dict[Tuple[int, int, int], np.ndarray]] = [
+            {} for _ in self.grids]
+        self._coloured_collections: List[Optional[PolyCollection]] = [
+            None for _ in self.grids]
+        self._index_paths: List[Dict[Tuple[int, int, int], Path]] = [
+            {} for _ in self.grids]
+        self._index_collections: List[Optional[_TextCollection]] = [
+            None for _ in self.grids]
+        self._value_paths: List[Dict[str, Path]] = [{} for _ in self.grids]
+        self._value_collections: List[Optional[_TextCollection]] = [
+            None for _ in self.grids]
+        self._centre_collections: List[Optional[PathCollection]] = [
+            None for _ in self.grids]
+        self._dual_collections: List[Optional[LineCollection]] = [
+            None for _ in self.grids]
+        self._raster_images: List[Optional[AxesImage]] = [
+            None for _ in self.grids]
+        self._outline_collections: List[Optional[LineCollection]] = [
+            None for _ in self.grids]
+
     def _get_grid_names(self) -> str:
         names_lst = [g.notation for g in self.grids]
         if len(names_lst) == 1:
@@ -41,74 +184,303 @@ class Visualisation:
 
         return ", ".join(names_lst)
 
+    def _area_range(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """Return the area range of the current view."""
+        return ((self.xlim_now[0], self.ylim_now[0]),
+                (self.xlim_now[1], self.ylim_now[1]))
+
+    def _cell_indices(self, grid: SemiregularGrid) -> np.ndarray:
+        """(i, j, k) indices of the grid's visible cells as an array."""
+        cells = self._cells[self.grids.index(grid)]
+        return np.array(list(cells), dtype=np.int64).reshape(-1, 3)
+
+    def _add_cell_edges(self, g_i: int, indices: np.ndarray) -> None:
+        """Keep the edges owned by the cells with the (N, 3) 'indices'."""
+        edges, owners = self.grids[g_i]._get_tile_builder() \
+            .owned_edges_by_cell(indices)
+        order = np.argsort(owners, kind='stable')
+        bounds = np.searchsorted(owners[order], np.arange(1, len(indices)))
+        self._cell_edges[g_i].update(zip(map(tuple, indices.tolist()),
+                                         np.split(edges[order], bounds)))
+
+    def _edge_segments(self, g_i: int) -> np.ndarray:
+        """(E, 2, 2) array of the edges of the grid's visible cells."""
+        edges = list(self._cell_edges[g_i].values())
+        return np.concatenate(edges) if edges else np.zeros((0, 2, 2))
+
+    def _reset_cells(self, grid: SemiregularGrid) -> None:
+        """
+        Find all the grid's cells visible in the current view (none if the
+        view is rasterised) and forget the grid's artists.
+        """
+        g_i = self.grids.index(grid)
+        self._cells[g_i] = {}
+        self._cell_edges[g_i] = {}
+        if not self._rasterised:
+            viewport = Viewport(grid, self._area_range())
+            ids, centres = viewport.cells()
+            self._viewports[g_i] = viewport
+            self._cells[g_i] = dict(zip(
+                map(tuple, unpack_indices(ids).tolist()),
+                map(tuple, centres.tolist())))
+        self._coloured_collections[g_i] = None
+        self._index_paths[g_i] = {}
+        self._index_collections[g_i] = None
+        self._value_paths[g_i] = {}
+        self._value_collections[g_i] = None
+        self._centre_collections[g_i] = None
+        self._dual_collections[g_i] = None
+        self._raster_images[g_i] = None
+        self._outline_collections[g_i] = None
+
+    def _is_zoomed_out(self) -> bool:
+        """
+        Answer whether the view has fewer pixels per cell (of the grid with
+        the smallest cells) than RASTER_CELL_PIXELS.
+        """
+        (min_x, min_y), (max_x, max_y) = self._area_range()
+        area = abs((max_x - min_x) * (max_y - min_y))
+        cells = max(area / abs(grid._determinant) * grid.total_cell_types
+                    for grid in self.grids)
+        return self.ax.bbox.width * self.ax.bbox.height < \
+            cells * RASTER_CELL_PIXELS
+
+    def _vis_raster(self, grid: SemiregularGrid) -> None:
+        """
+        For a given grid, visualise the image of its RGBA values (and the
+        outlines of the blocks) in the zoomed-out view (or update them).
+        """
+        g_i = self.grids.index(grid)
+        area_range = self._area_range()
+        (min_x, min_y), (max_x, max_y) = area_range
+        shape = (max(1, int(self.ax.bbox.height / RASTER_PIXEL_SIZE)),
+                 max(1, int(self.ax.bbox.width / RASTER_PIXEL_SIZE)))
+        image = rasterise(grid, area_range, shape, 'rgba')
+        extent = (min_x, max_x, min_y, max_y)
+
+        raster = self._raster_images[g_i]
+        if raster is None:
+            raster = self.ax.imshow(image, origin='lower', extent=extent,
+                                    aspect='auto', interpolation='nearest',
+                                    zorder=0)
+            self._raster_images[g_i] = raster
+        else:
+            raster.set_data(image)
+            raster.set_extent(extent)
+
+        if self.show_outlines:
+            self._vis_outlines(grid)
+
+    def _vis_outlines(self, grid: SemiregularGrid) -> None:
+        """
+        For a given grid, visualise the outlines of the blocks of 2^L x 2^L
+        unit blocks (of at least OUTLINE_BLOCK_PIXELS) in the zoomed-out view
+        (or update them).
+        """
+        g_i = self.grids.index(grid)
+        area_range = self._area_range()
+        builder = grid._get_tile_builder()
+        unit_pixels = math.sqrt(abs(grid._determinant)) * \
+            self.ax.bbox.width / (area_range[1][0] - area_range[0][0])
+        size = 1 << max(0, math.ceil(math.log2(
+            OUTLINE_BLOCK_PIXELS / max(unit_pixels, 1e-9))))
+
+        min_i, max_i, min_j, max_j = builder._ij_bounds(area_range)
+        min_i, min_j = min_i // size * size, min_j // size * size
+        max_i, max_j = (max_i // size + 1) * size, (max_j // size + 1) * size
+        i = np.arange(min_i, max_i + 1, size)
+        j = np.arange(min_j, max_j + 1, size)
+        lines = np.concatenate((
+            np.stack((builder._block_origins(i, np.full_like(i, min_j)),
+                      builder._block_origins(i, np.full_like(i, max_j))),
+                     axis=1),
+            np.stack((builder._block_origins(np.full_like(j, min_i), j),
+                      builder._block_origins(np.full_like(j, max_i), j)),
+                     axis=1)))
+
+        line_collection = self._outline_collections[g_i]
+        if line_collection is None:
+            line_collection = LineCollection(
+                _segments(lines), colors=self.colours[g_i % len(self.colours)],
+                linewidths=0.5, alpha=0.5)
+            self.ax.add_collection(line_collection, autolim=False)
+            self._outline_collections[g_i] = line_collection
+        else:
+            line_collection.set_segments(_segments(lines))
+
+    def _update_cells(self, grid: SemiregularGrid) -> None:
+        """
+        Move the grid's view to the current limits and update its visible
+        cells, edges, coloured polygons and the shown overlays by the cells
+        that entered or left the view (only the edges of the entering cells
+        are computed).
+        """
+        g_i = self.grids.index(grid)
+        added, removed = self._viewports[g_i].update_viewport(
+            self._area_range())
+        cells = self._cells[g_i]
+        cell_edges = self._cell_edges[g_i]
+        index_paths = self._index_paths[g_i]
+        for index in map(tuple, unpack_indices(removed).tolist()):
+            del cells[index]
+            cell_edges.pop(index, None)
+            index_paths.pop(index, None)
+
+        builder = grid._get_tile_builder()
+        added = unpack_indices(added)
+        cells.update(zip(map(tuple, added.tolist()),
+                         map(tuple, builder.centres(added).tolist())))
+        self._add_cell_edges(g_i, added)
+        self._edge_collections[g_i].set_segments(
+            _segments(self._edge_segments(g_i)))
+        self._vis_colored_polygons(grid)
+
+        if self.show_index:
+            self._vis_indices(grid)
+        if self.show_value:
+            self._vis_num_values(grid)
+        if self.show_centre:
+            self._vis_centres(grid)
+        if self.show_dual:
+            self._vis_dual(grid)
+
     def _vis_edges(self, grid: SemiregularGrid) -> None:
         """
         For a given grid, visualise its edges. Add them to the plot.
         """
-        edges = grid.generate_edges((
-            (self.xlim_now[0], self.ylim_now[0]),
-            (self.xlim_now[1], self.ylim_now[1])))
         g_i = self.grids.index(grid)
-        line_collection = LineCollection(edges, colors=self.colours[g_i % len(
-            self.colours)], linewidths=1)
-        self.ax.add_collection(line_collection)
+        self._cell_edges[g_i] = {}
+        self._add_cell_edges(g_i, self._cell_indices(grid))
+        line_collection = LineCollection(
+            _segments(self._edge_segments(g_i)),
+            colors=self.colours[g_i % len(self.colours)], linewidths=1)
+        self.ax.add_collection(line_collection, autolim=False)
+        self._edge_collections.append(line_collection)
 
     def _vis_colored_polygons(self, grid: SemiregularGrid) -> None:
         """
-        For a given grid, visualise polygons that have a colour assigned.
-        Add them to the plot.
+        For a given grid, visualise polygons in the view that have a colour
+        assigned (or update the visualised ones).
         """
-        for index, rgba_value in grid._rgba_values.items():
-            dgn = grid.generated_cells.get(index)
-            if dgn is not None:
-                n = dgn.rdgnt_name[0]
-                rotation = grid._rdgnt_dic[dgn.rdgnt_name].polygon_rotation
-                polygon_vertices = grid._polygon_coords(dgn.coords, n,
-                                                        rotation)
-                self.ax.add_patch(Polygon(polygon_vertices,
-                                          color=rgba_value[:3],
-                                          alpha=rgba_value[-1]))
+        g_i = self.grids.index(grid)
+        ids, colours = grid.values_in_range(self._area_range(), 'rgba')
+        offsets, vertices = grid._get_tile_builder().polygons(
+            unpack_indices(ids))
+        polygons = np.split(vertices, offsets[1:-1]) if len(ids) else []
+
+        collection = self._coloured_collections[g_i]
+        if collection is None:
+            collection = PolyCollection(polygons, facecolors=colours,
+                                        edgecolors=colours)
+            self.ax.add_collection(collection, autolim=False)
+            self._coloured_collections[g_i] = collection
+        else:
+            collection.set_verts(polygons)
+            collection.set_facecolor(_colours(colours))
+            collection.set_edgecolor(_colours(colours))
 
     def _vis_num_values(self, grid: SemiregularGrid) -> None:
         """
-        For a given grid, visualise the numerical values of the cells.
-        Add them to the plot.
+        For a given grid, visualise the numerical values of the cells in the
+        view (or update the visualised ones).
         """
-        for index, num_value in grid._num_values.items():
-            x, y = grid.index_to_coords(index)
-            self.ax.text(x, y, str(num_value), fontsize=6,
-                         clip_on=True, ha='center', fontweight='bold')
+        g_i = self.grids.index(grid)
+        collection = self._value_collections[g_i]
+        if collection is None:
+            collection = _TextCollection(self.ax.transData, fontsize=6,
+                                         fontweight='bold', facecolors='black',
+                                         edgecolors='none', zorder=3)
+            self.ax.add_collection(collection, autolim=False)
+            self._value_collections[g_i] = collection
+
+        ids, values = grid.values_in_range(self._area_range(), 'num')
+        indices = unpack_indices(ids)
+        texts = [str(value) for value in values.tolist()]
+        # the outlines of the texts still shown are reused
+        old_paths = self._value_paths[g_i]
+        new = list(dict.fromkeys(text for text in texts
+                                 if text not in old_paths))
+        paths = dict(zip(new, collection.text_paths(new)))
+        paths.update((text, old_paths[text]) for text in texts
+                     if text in old_paths)
+        self._value_paths[g_i] = paths
+        collection.set_texts([paths[text] for text in texts],
+                             grid._get_tile_builder().centres(indices))
 
     def _vis_indices(self, grid: SemiregularGrid) -> None:
         """
-        For a given grid, visualise indices of the cells. Add them to the plot.
+        For a given grid, visualise indices of the cells (or update the
+        visualised ones).
         """
-        grid_i = self.grids.index(grid)
-        for ijk, dgn in grid.generated_cells.items():
-            x, y = dgn.coords
-            index = ijk if grid.notation not in ('4.4.4.4', '6.6.6') else \
-                ijk[:-1]
-            self.ax.text(x, y, str(index), fontsize=7, ha='center',
-                         color=self.colours[grid_i % len(self.colours)],
-                         clip_on=True)
+        g_i = self.grids.index(grid)
+        collection = self._index_collections[g_i]
+        if collection is None:
+            collection = _TextCollection(
+                self.ax.transData, fontsize=7, edgecolors='none',
+                facecolors=self.colours[g_i % len(self.colours)], zorder=3)
+            self.ax.add_collection(collection, autolim=False)
+            self._index_collections[g_i] = collection
+
+        cells = self._cells[g_i]
+        paths = self._index_paths[g_i]
+        short = grid.notation in ('4.4.4.4', '6.6.6')
+        new = [ijk for ijk in cells if ijk not in paths]
+        paths.update(zip(new, collection.text_paths(
+            [str(ijk[:-1] if short else ijk) for ijk in new])))
+        collection.set_texts(list(paths.values()), np.array(
+            [cells[ijk] for ijk in paths], dtype=np.float64))
 
     def _vis_centres(self, grid: SemiregularGrid) -> None:
         """
-        For a given grid, visualise centres of the cells. Add them to the plot.
+        For a given grid, visualise centres of the cells (or update the
+        visualised ones).
         """
-        grid_i = self.grids.index(grid)
-        for dgn in grid.generated_cells.values():
-            x, y = dgn.coords
-            self.ax.plot(x, y, marker='.', color=self.colours[grid_i % len(
-                self.colours)])
+        g_i = self.grids.index(grid)
+        centres = np.array(list(self._cells[g_i].values()),
+                           dtype=np.float64).reshape(-1, 2)
+        collection = self._centre_collections[g_i]
+        if collection is None:
+            collection = self.ax.scatter(
+                centres[:, 0], centres[:, 1], s=36, marker='.', zorder=2,
+                color=self.colours[g_i % len(self.colours)])
+            self._centre_collections[g_i] = collection
+        else:
+            collection.set_offsets(centres)
 
     def _vis_dual(self, grid: SemiregularGrid) -> None:
         """
-        For a given grid, visualise its dual grid.
+        For a given grid, visualise its dual grid (or update the visualised
+        one).
         """
-        line_collection = LineCollection(grid._dual_graph, colors='red',
-                                         linewidths=0.5)
-        self.ax.add_collection(line_collection)
+        g_i = self.grids.index(grid)
+        cells = self._cells[g_i]
+        dual_graph = grid._get_tile_builder().dual_edges(
+            self._cell_indices(grid),
+            np.array(list(cells.values())).reshape(-1, 2))
+        line_collection = self._dual_collections[g_i]
+        if line_collection is None:
+            line_collection = LineCollection(_segments(dual_graph),
+                                             colors='red', linewidths=0.5)
+            self.ax.add_collection(line_collection, autolim=False)
+            self._dual_collections[g_i] = line_collection
+        else:
+            line_collection.set_segments(_segments(dual_graph))
+
+    def _hide_overlay(self, key: str) -> None:
+        """Remove the collections of the overlay toggled by the 'key'."""
+        overlays: Dict[str, List[Any]] = {
+            't': self._centre_collections, 'i': self._index_collections,
+            'n': self._value_collections, 'd': self._dual_collections,
+            'o': self._outline_collections}
+        collections: List[Optional[Collection]] = overlays[key]
+        for g_i, collection in enumerate(collections):
+            if collection is not None:
+                collection.remove()
+            collections[g_i] = None
+        if key == 'i':
+            self._index_paths = [{} for _ in self.grids]
+        elif key == 'n':
+            self._value_paths = [{} for _ in self.grids]
 
     def _for_each_grid(self, func: Callable[[SemiregularGrid], None]) -> None:
         """
@@ -126,7 +498,14 @@ class Visualisation:
         self.ax.set_ylim(self.ylim_now)
         self.ax.set_title(self.grid_names)
 
+        self._rasterised = self._is_zoomed_out()
+        self._edge_collections = []
         for grid in self.grids:
+            self._reset_cells(grid)
+            if self._rasterised:
+                self._vis_raster(grid)
+                continue
+
             self._vis_edges(grid)
             self._vis_colored_polygons(grid)
 
@@ -139,17 +518,122 @@ class Visualisation:
             if self.show_value:
                 self._vis_num_values(grid)
 
+    def _grid_artists(self) -> List[Artist]:
+        """All the artists drawn in the axes."""
+        return [*self.ax.collections, *self.ax.patches, *self.ax.lines,
+                *self.ax.texts]
+
+    def _start_blit(self) -> None:
+        """
+        Cache the background of the axes (without the grid artists) so the
+        frames of the pan only draw the grid artists over it.
+        """
+        # the canvases supporting blitting add 'copy_from_bbox' and
+        # 'restore_region' to the base canvas
+        canvas: Any = self.fig.canvas
+        if not getattr(canvas, 'supports_blit', False):
+            return
+        for artist in self._grid_artists():
+            artist.set_animated(True)
+        canvas.draw()
+        self._background = canvas.copy_from_bbox(self.ax.bbox)
+        self._blit()
+
+    def _blit(self) -> None:
+        """Draw the grid artists over the cached background."""
+        canvas: Any = self.fig.canvas
+        canvas.restore_region(self._background)
+        for artist in self._grid_artists():
+            artist.set_animated(True)
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
+
+    def _stop_blit(self) -> None:
+        """Return the grid artists to the normal drawing."""
+        if self._background is None:
+            return
+        for artist in self._grid_artists():
+            artist.set_animated(False)
+        self._background = None
+
+    def _frame(self) -> None:
+        """Update the view to the current limits and redraw it."""
+        self._last_frame = time.perf_counter()
+        self._pending_frame = False
+        self.xlim_now = self.ax.get_xlim()
+        self.ylim_now = self.ax.get_ylim()
+        if self._is_zoomed_out() != self._rasterised:
+            # the level of detail has changed
+            self.ax.clear()
+            self._visualise_grid()
+            if self._background is not None:
+                self._start_blit()
+            else:
+                self.fig.canvas.draw_idle()
+            return
+
+        self._for_each_grid(self._vis_raster if self._rasterised else
+                            self._update_cells)
+        if self._background is not None:
+            self._blit()
+        else:
+            self.fig.canvas.draw_idle()
+
+    def _on_frame_timer(self) -> None:
+        if self._pending_frame:
+            self._frame()
+
+    def _request_frame(self) -> None:
+        """
+        Redraw the view now if the last frame is older than the frame
+        interval, otherwise at the end of the interval.
+        """
+        wait = FRAME_INTERVAL - (time.perf_counter() - self._last_frame)
+        if wait <= 0:
+            self._frame()
+            return
+
+        self._pending_frame = True
+        if self._frame_timer is None:
+            self._frame_timer = self.fig.canvas.new_timer(
+                interval=max(1, int(wait * 1000)))
+            self._frame_timer.single_shot = True
+            self._frame_timer.add_callback(self._on_frame_timer)
+        else:
+            self._frame_timer.interval = max(1, int(wait * 1000))
+        self._frame_timer.start()
+
+    def _is_own_pan(self) -> bool:
+        """Answer whether dragging pans the view (no toolbar mode is on)."""
+        toolbar = self.fig.canvas.toolbar
+        return toolbar is None or getattr(toolbar, 'mode', '') == ''
+
     def _on_press(self, event: Event) -> Any:
         self.dragging = True
+        if isinstance(event, MouseEvent) and event.inaxes is self.ax and \
+                self._is_own_pan():
+            self._pan_start = (event.x, event.y, self.ax.get_xlim(),
+                               self.ax.get_ylim())
+            self._start_blit()
 
     def _on_release(self, event: Event) -> Any:
         self.dragging = False
+        self._pan_start = None
+        self._stop_blit()
+        # the final frame (e.g. after a zoom to a rectangle) is drawn fully
+        self._frame()
 
     def _on_motion(self, event: Event) -> Any:
-        if self.dragging:
-            self.ax.clear()
-            self._visualise_grid()
-            plt.draw()
+        if not self.dragging:
+            return
+        if self._pan_start is not None and isinstance(event, MouseEvent):
+            x, y, xlim, ylim = self._pan_start
+            bbox = self.ax.bbox
+            dx = (event.x - x) * (xlim[1] - xlim[0]) / bbox.width
+            dy = (event.y - y) * (ylim[1] - ylim[0]) / bbox.height
+            self.ax.set_xlim(xlim[0] - dx, xlim[1] - dx)
+            self.ax.set_ylim(ylim[0] - dy, ylim[1] - dy)
+        self._request_frame()
 
     def _on_draw(self, event: Event) -> Any:
         self.xlim_now = self.ax.get_xlim()
@@ -165,27 +649,37 @@ class Visualisation:
                 self.show_value = not self.show_value
             elif event.key == 'd':
                 self.show_dual = not self.show_dual
-
-            if event.key in ('t', 'i', 'n', 'r', 'd'):
-                if event.key == 't' and self.show_centre:
-                    self._for_each_grid(self._vis_centres)
-                elif event.key == 'i' and self.show_index:
-                    self._for_each_grid(self._vis_indices)
-                elif event.key == 'n' and self.show_value:
-                    self._for_each_grid(self._vis_num_values)
-                elif event.key == 'd' and self.show_dual:
-                    self._for_each_grid(self._vis_dual)
-                else:
-                    self.ax.clear()
-                    self._visualise_grid()
-
-                plt.draw()
+            elif event.key == 'o':
+                self.show_outlines = not self.show_outlines
+
+            # the overlays of the cells are drawn in the zoomed-in view, the
+            # outlines of the blocks in the zoomed-out (rasterised) one
+            overlays: Dict[str, Tuple[bool, Callable[[SemiregularGrid],
+                                                     None]]] = {
+                't': (self.show_centre, self._vis_centres),
+                'i': (self.show_index, self._vis_indices),
+                'n': (self.show_value, self._vis_num_values),
+                'd': (self.show_dual, self._vis_dual),
+                'o': (self.show_outlines, self._vis_outlines)}
+            if event.key == 'r':
+                self.ax.clear()
+                self._visualise_grid()
+            elif event.key in overlays:
+                shown, vis_overlay = overlays[event.key]
+                if not shown:
+                    self._hide_overlay(event.key)
+                elif self._rasterised == (event.key == 'o'):
+                    self._for_each_grid(vis_overlay)
+            else:
+                return
+
+            self.fig.canvas.draw_idle()
 
     def _create_subplot(self, figure_name: str) -> Tuple[Figure, Axes]:
         """Create fig and ax and set them."""
         fig, ax = plt.subplots()
 
-        fig.text(0.33, 0.02, 'Show/hide: [i] [n] [t] [d]', ha='center',
+        fig.text(0.33, 0.02, 'Show/hide: [i] [n] [t] [d] [o]', ha='center',
                  fontsize=8)
         fig.text(0.66, 0.02, 'Reload: [r]', ha='center', fontsize=8)
 
@@ -238,7 +732,11 @@ def matplotlib_visualisation(*grids: SemiregularGrid,
         * 'n' to show/hide the cell's numerical values
         * 't' to show/hide the points representing the centres of the cells
         * 'd' to show/hide the dual graph of the grid
+        * 'o' to show/hide the outlines of the blocks when zoomed out
         * 'r' to reload the grid
+    Zoomed out so far that the cells are smaller than a few pixels, the grid
+    is drawn as an image of its RGBA values (the other overlays are shown
+    only when zoomed in).
     """
     min_xy, max_xy = area_range
     if min_xy[0] >= max_xy[0] or min_xy[1] >= max_xy[1]:
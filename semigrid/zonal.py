@@ -0,0 +1,426 @@
+"""
+Zonal statistics of the values of a grid over arbitrary polygons.
+
+A geometry is an (N, 2) array of the vertices of a ring, an (exterior,
+holes) tuple (see 'dissolve') or an object with '__geo_interface__' (e.g. a
+Polygon or MultiPolygon of Shapely, which is not imported). Its rings are
+tested by the even-odd rule.
+
+The geometries are processed in batches of neighbouring ones (in the Z-order
+of their centres) - the candidate cells of a batch are generated from the
+lattice once (see 'TileBuilder.cells_in_range') and shared by its zones. The
+containment of the points in a zone is vectorised over horizontal bands of
+the zone's edges, so each point is tested against the few edges of its band
+only. The weights of the cells in the zones are finally looked up and
+reduced for all the zones at once.
+
+Weighting:
+    * centre - a cell belongs to the zone if its centre is inside
+    * area - a cell is weighted by the fraction of its area inside the zone;
+        the cells crossed by the boundary (located at points sampled along
+        the zone's edges) are integrated by AREA_SUBDIVISION^2 points per
+        triangle of the cell (from its centre to each of its edges), the
+        other cells count wholly or not at all by their centres
+"""
+from typing import Tuple, List, Dict, Any, Optional, Sequence, \
+    TYPE_CHECKING
+
+import numpy as np
+
+from semigrid.cellid import IJ_BIAS, pack_indices
+from semigrid.parallel import GridConfig, TASKS_PER_WORKER, \
+    run_tasks, worker_grid
+from semigrid.pyramid import Layer
+
+if TYPE_CHECKING:
+    from semigrid.semiregulargrid import SemiregularGrid
+
+
+STATS = ('count', 'sum', 'mean', 'min', 'max', 'std', 'histogram')
+WEIGHTINGS = ('centre', 'area')
+
+AREA_SUBDIVISION = 6
+# spacing of the points sampled along the edges (in the edge sizes)
+BOUNDARY_SPACING = 0.25
+# batches of the zones whose bounding boxes cover at least this fraction of
+# the batch's bounding box (and at most MAX_BATCH of them)
+MIN_BATCH_COVER = 0.25
+MAX_BATCH = 64
+
+# (E, 4) array of the edges (x1, y1, x2, y2) of the rings of a zone
+ZoneEdges = np.ndarray
+Memberships = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _rings(geometry: Any) -> List[np.ndarray]:
+    """(N, 2) arrays of the vertices of the rings of the geometry."""
+    if hasattr(geometry, '__geo_interface__'):
+        geometry = geometry.__geo_interface__
+    if isinstance(geometry, dict):
+        if geometry['type'] == 'Polygon':
+            polygons = [geometry['coordinates']]
+        elif geometry['type'] == 'MultiPolygon':
+            polygons = geometry['coordinates']
+        else:
+            raise Exception(f"Geometry must be a polygon; "
+                            f"{geometry['type']} was given.")
+        return [np.asarray(ring, dtype=np.float64).reshape(-1, 2)
+                for polygon in polygons for ring in polygon]
+    if isinstance(geometry, tuple) and len(geometry) == 2 and \
+            isinstance(geometry[1], list):
+        exterior, holes = geometry
+        return [np.asarray(ring, dtype=np.float64).reshape(-1, 2)
+                for ring in [exterior, *holes]]
+    return [np.asarray(geometry, dtype=np.float64).reshape(-1, 2)]
+
+
+def _zone_edges(geometry: Any) -> ZoneEdges:
+    """Edges of the rings of the geometry (closed, without null edges)."""
+    edges = [np.concatenate((ring, np.roll(ring, -1, axis=0)), axis=1)
+             for ring in _rings(geometry) if len(ring) >= 3]
+    if not edges:
+        return np.zeros((0, 4))
+    zone_edges = np.concatenate(edges)
+    return zone_edges[np.any(zone_edges[:, :2] != zone_edges[:, 2:], axis=1)]
+
+
+def _inside(edges: ZoneEdges, points: np.ndarray) -> np.ndarray:
+    """
+    Even-odd test of the (P, 2) 'points' against the 'edges' of a zone -
+    the edges are split into horizontal bands and each point is tested
+    against the edges of its band only.
+    """
+    inside: np.ndarray = np.zeros(len(points), dtype=bool)
+    if len(edges) == 0 or len(points) == 0:
+        return inside
+    x1, y1, x2, y2 = edges.T
+    low, high = np.minimum(y1, y2), np.maximum(y1, y2)
+    min_y, max_y = low.min(), high.max()
+    bands = max(1, min(len(edges), len(points), 4096))
+    height = (max_y - min_y) / bands
+    if height <= 0:
+        return inside
+
+    # (edge, band) pairs sorted by the bands
+    first = np.clip(((low - min_y) / height).astype(np.int64), 0, bands - 1)
+    last = np.clip(((high - min_y) / height).astype(np.int64), 0, bands - 1)
+    spans = last - first + 1
+    offsets = np.cumsum(spans) - spans
+    band_edges = np.repeat(np.arange(len(edges)), spans)
+    band_of = np.repeat(first - offsets, spans) + np.arange(spans.sum())
+    order = np.argsort(band_of, kind='stable')
+    band_edges = band_edges[order]
+    band_starts = np.searchsorted(band_of[order], np.arange(bands))
+    band_counts = np.diff(np.append(band_starts, len(band_edges)))
+
+    # (point, edge) pairs of the edges of the points' bands
+    x, y = points[:, 0], points[:, 1]
+    within = (min_y <= y) & (y <= max_y)
+    band = np.clip(((y - min_y) / height).astype(np.int64), 0, bands - 1)
+    counts = np.where(within, band_counts[band], 0)
+    offsets = np.cumsum(counts) - counts
+    pair_points = np.repeat(np.arange(len(points)), counts)
+    pair_edges = band_edges[np.repeat(band_starts[band] - offsets, counts) +
+                            np.arange(counts.sum())]
+
+    px, py = x[pair_points], y[pair_points]
+    ex1, ey1, ex2, ey2 = edges[pair_edges].T
+    crossing = (ey1 > py) != (ey2 > py)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        at_x = ex1 + (py - ey1) * (ex2 - ex1) / (ey2 - ey1)
+    crossings = np.bincount(pair_points[crossing & (px < at_x)],
+                            minlength=len(points))
+    inside = crossings % 2 == 1
+    return inside
+
+
+def _quadrature(grid: 'SemiregularGrid') -> List[np.ndarray]:
+    """
+    Points (relative to the centre) of equal areas of each cell type - the
+    centroids of the AREA_SUBDIVISION^2 congruent parts of each triangle
+    from the centre to an edge of the cell.
+    """
+    n = AREA_SUBDIVISION
+    # barycentric coordinates of the centroids of the parts of a triangle
+    a, b = np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+    keep = a + b < n
+    upright = np.stack((a[keep] + 1 / 3, b[keep] + 1 / 3), axis=1)
+    keep = a + b < n - 1
+    inverted = np.stack((a[keep] + 2 / 3, b[keep] + 2 / 3), axis=1)
+    weights = np.concatenate((upright, inverted)) / n
+
+    points = []
+    for template in grid._get_tile_builder()._templates:
+        corners = np.stack((template, np.roll(template, -1, axis=0)), axis=1)
+        points.append((weights[:, 0, None, None] * corners[:, 0] +
+                       weights[:, 1, None, None] * corners[:, 1])
+                      .reshape(-1, 2))
+    return points
+
+
+def _boundary_cells(grid: 'SemiregularGrid', edges: ZoneEdges) \
+        -> np.ndarray:
+    """Sorted ids of the cells crossed by the edges (sampled)."""
+    lengths = np.hypot(edges[:, 2] - edges[:, 0], edges[:, 3] - edges[:, 1])
+    samples = np.ceil(lengths / (BOUNDARY_SPACING *
+                                 grid.edge_size)).astype(np.int64) + 1
+    offsets = np.cumsum(samples) - samples
+    rows = np.repeat(np.arange(len(edges)), samples)
+    t = (np.arange(samples.sum()) - np.repeat(offsets, samples)) / \
+        np.repeat(samples - 1, samples)
+    points = edges[rows, :2] + t[:, None] * (edges[rows, 2:] -
+                                             edges[rows, :2])
+    cells = grid._coords_to_indices(points)
+    ij = cells[:, :2]
+    located = (cells[:, 2] >= 0) & \
+        np.all((-IJ_BIAS <= ij) & (ij < IJ_BIAS), axis=1)
+    return np.unique(pack_indices(cells[located]))
+
+
+def _zone_weights(grid: 'SemiregularGrid', edges: ZoneEdges,
+                  cells: np.ndarray, ids: np.ndarray, centres: np.ndarray,
+                  weighting: str,
+                  quadrature: Optional[List[np.ndarray]]) -> np.ndarray:
+    """Weights of the candidate cells (with 'centres') in the zone."""
+    weights = _inside(edges, centres).astype(np.float64)
+    if weighting == 'centre' or quadrature is None:
+        return weights
+
+    boundary = np.flatnonzero(np.isin(ids, _boundary_cells(grid, edges)))
+    for k, points in enumerate(quadrature):
+        rows = boundary[cells[boundary, 2] == k]
+        if len(rows) == 0:
+            continue
+        inside = _inside(edges, (centres[rows][:, None, :] +
+                                 points).reshape(-1, 2))
+        weights[rows] = inside.reshape(len(rows), -1).mean(axis=1)
+    return weights
+
+
+def _batches(bboxes: np.ndarray) -> List[List[int]]:
+    """
+    Groups of neighbouring zones (with the (Z, 4) 'bboxes'), consecutive in
+    the Z-order of their centres.
+    """
+    valid = np.flatnonzero(np.all(np.isfinite(bboxes), axis=1))
+    if len(valid) == 0:
+        return []
+    centres = (bboxes[valid, :2] + bboxes[valid, 2:]) / 2
+    low, high = centres.min(axis=0), centres.max(axis=0)
+    quantised = ((centres - low) / np.maximum(high - low, 1e-9) *
+                 0xFFFF).astype(np.int64)
+    order = valid[np.argsort(pack_indices(np.stack(
+        (quantised[:, 0], quantised[:, 1], np.zeros(len(valid),
+                                                    dtype=np.int64)),
+        axis=1)), kind='stable')]
+
+    batches: List[List[int]] = []
+    batch: List[int] = []
+    union = np.zeros(4)
+    covered = 0.0
+    for zone in order.tolist():
+        bbox = bboxes[zone]
+        area = (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
+        if batch:
+            joined = np.concatenate((np.minimum(union[:2], bbox[:2]),
+                                     np.maximum(union[2:], bbox[2:])))
+            joined_area = (joined[2] - joined[0]) * (joined[3] - joined[1])
+            if len(batch) < MAX_BATCH and \
+                    covered + area >= MIN_BATCH_COVER * joined_area:
+                batch.append(zone)
+                union = joined
+                covered += area
+                continue
+            batches.append(batch)
+        batch, union, covered = [zone], bbox.copy(), area
+    batches.append(batch)
+    return batches
+
+
+def zone_memberships(grid: 'SemiregularGrid', zones: List[ZoneEdges],
+                     batches: List[List[int]], weighting: str) \
+        -> Memberships:
+    """
+    (zones, cell ids, weights) of the cells in the zones of the 'batches'
+    (with a positive weight).
+    """
+    builder = grid._get_tile_builder()
+    quadrature = _quadrature(grid) if weighting == 'area' else None
+    # the cells whose bounding boxes may overlap the zone's
+    reach = 0.0 if weighting == 'centre' else float(
+        np.abs(builder._template_bboxes).max())
+
+    zone_rows, zone_ids, zone_weights = [], [], []
+    for batch in batches:
+        bboxes = np.array([[*edges[:, :2].min(axis=0),
+                            *edges[:, :2].max(axis=0)]
+                           for edges in (zones[zone] for zone in batch)])
+        cells, centres, _ = builder.cells_in_range((
+            tuple(bboxes[:, :2].min(axis=0)),
+            tuple(bboxes[:, 2:].max(axis=0))))
+        ij = cells[:, :2]
+        packable = np.all((-IJ_BIAS <= ij) & (ij < IJ_BIAS), axis=1)
+        order = np.argsort(centres[packable, 0], kind='stable')
+        cells, centres = cells[packable][order], centres[packable][order]
+        ids = pack_indices(cells)
+
+        for zone, (min_x, min_y, max_x, max_y) in zip(batch, bboxes):
+            start, end = np.searchsorted(centres[:, 0],
+                                         (min_x - reach, max_x + reach))
+            rows = start + np.flatnonzero(
+                (min_y - reach <= centres[start:end, 1]) &
+                (centres[start:end, 1] <= max_y + reach))
+            weights = _zone_weights(grid, zones[zone], cells[rows],
+                                    ids[rows], centres[rows], weighting,
+                                    quadrature)
+            positive = weights > 0
+            zone_rows.append(np.full(positive.sum(), zone, dtype=np.int64))
+            zone_ids.append(ids[rows][positive])
+            zone_weights.append(weights[positive])
+
+    if not zone_rows:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), \
+            np.zeros(0)
+    return np.concatenate(zone_rows), np.concatenate(zone_ids), \
+        np.concatenate(zone_weights)
+
+
+def _zone_memberships_task(grid_class: type, config: GridConfig,
+                           zones: List[ZoneEdges], batches: List[List[int]],
+                           weighting: str) -> Memberships:
+    """'zone_memberships' of the batches (runs in the worker process)."""
+    return zone_memberships(worker_grid(grid_class, config), zones,
+                            batches, weighting)
+
+
+def _memberships(grid: 'SemiregularGrid', zones: List[ZoneEdges],
+                 weighting: str, workers: Optional[int]) -> Memberships:
+    bboxes = np.array([[*edges[:, :2].min(axis=0), *edges[:, :2].max(axis=0)]
+                       if len(edges) else [np.nan] * 4 for edges in zones])
+    batches = _batches(bboxes.reshape(-1, 4))
+    if workers is None or len(batches) < 2:
+        return zone_memberships(grid, zones, batches, weighting)
+
+    tasks = min(len(batches), workers * TASKS_PER_WORKER)
+    task_zones, arguments = [], []
+    for task in range(tasks):
+        task_batches = batches[task::tasks]
+        task_zones.append(sorted(zone for batch in task_batches
+                                 for zone in batch))
+        # only the zones of the task are sent (renumbered)
+        numbers = {zone: n for n, zone in enumerate(task_zones[-1])}
+        arguments.append((
+            type(grid), grid.config,
+            [zones[zone] for zone in task_zones[-1]],
+            [[numbers[zone] for zone in batch] for batch in task_batches],
+            weighting))
+
+    results = []
+    for zone_numbers, (zone_rows, ids, weights) in zip(
+            task_zones, run_tasks(workers, _zone_memberships_task,
+                                  arguments)):
+        results.append((np.array(zone_numbers, dtype=np.int64)[zone_rows],
+                        ids, weights))
+    zone_rows, ids, weights = (np.concatenate(arrays)
+                               for arrays in zip(*results))
+    return zone_rows, ids, weights
+
+
+def zonal_stats(grid: 'SemiregularGrid', geometries: Sequence[Any],
+                layer: Layer = 'num',
+                stats: Sequence[str] = ('count', 'sum', 'mean'),
+                weighting: str = 'centre',
+                bins: Optional[Sequence[float]] = None,
+                workers: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Statistics of the values of the 'layer' in each of the 'geometries' -
+    {stat: array over the geometries} of the 'stats' (see STATS):
+        * count - (weighted) number of the cells with a value
+        * sum - of the (weighted) values
+        * mean, min, max, std - of the values (weighted, NaN of the
+            geometries without values)
+        * histogram - (weighted) numbers of the values within the 'bins'
+            (their edges, the last bin includes its right edge)
+    The arrays are (Z,) of the numerical layer and (Z, 4) of the RGBA layer
+    (per channel), the histograms have one more axis of the bins.
+    If 'workers' is given, the cells of the zones are found by a pool of
+    'workers' processes.
+    """
+    if layer not in ('rgba', 'num'):
+        raise Exception("Layer must be 'rgba' or 'num'.")
+    if weighting not in WEIGHTINGS:
+        raise Exception(f"Weighting must be one of {', '.join(WEIGHTINGS)}.")
+    unknown = [stat for stat in stats if stat not in STATS]
+    if unknown:
+        raise Exception(f"Unknown statistics: {', '.join(unknown)}.")
+    if 'histogram' in stats and (bins is None or len(bins) < 2):
+        raise Exception("Histogram needs the edges of at least one bin.")
+
+    zones = [_zone_edges(geometry) for geometry in geometries]
+    zone_rows, ids, weights = _memberships(grid, zones, weighting, workers)
+    with grid._values_lock:
+        found, values = grid._value_index(layer).lookup(ids)
+    zone_rows, weights = zone_rows[found], weights[found]
+    values = values[found].reshape(len(weights), 4 if layer == 'rgba' else 1)
+    return _reduce(zone_rows, weights, values, len(zones), stats, bins,
+                   layer)
+
+
+def _reduce(zone_rows: np.ndarray, weights: np.ndarray, values: np.ndarray,
+            total: int, stats: Sequence[str],
+            bins: Optional[Sequence[float]], layer: Layer) \
+        -> Dict[str, np.ndarray]:
+    """Reduce the weighted (M, C) 'values' of the cells by their zones."""
+    columns = values.shape[1]
+    count = np.bincount(zone_rows, weights, minlength=total).astype(
+        np.float64)
+    sums = np.stack([np.bincount(zone_rows, weights * values[:, c],
+                                 minlength=total)
+                     for c in range(columns)], axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = sums / count[:, None]
+
+    results: Dict[str, np.ndarray] = {}
+    for stat in stats:
+        if stat == 'count':
+            results[stat] = count
+        elif stat == 'sum':
+            results[stat] = sums
+        elif stat == 'mean':
+            results[stat] = means
+        elif stat == 'std':
+            squares = np.stack([np.bincount(
+                zone_rows, weights * values[:, c] ** 2, minlength=total)
+                for c in range(columns)], axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                results[stat] = np.sqrt(np.maximum(
+                    squares / count[:, None] - means ** 2, 0))
+        elif stat in ('min', 'max'):
+            extreme = np.full((total, columns), np.nan)
+            if len(zone_rows):
+                order = np.argsort(zone_rows, kind='stable')
+                zones, starts = np.unique(zone_rows[order],
+                                          return_index=True)
+                reduce = np.minimum if stat == 'min' else np.maximum
+                extreme[zones] = reduce.reduceat(values[order], starts,
+                                                 axis=0)
+            results[stat] = extreme
+        elif stat == 'histogram':
+            edges = np.asarray(bins, dtype=np.float64)
+            bin_count = len(edges) - 1
+            histogram = np.zeros((total, columns, bin_count))
+            for c in range(columns):
+                bin_of = np.searchsorted(edges, values[:, c],
+                                         side='right') - 1
+                bin_of[values[:, c] == edges[-1]] = bin_count - 1
+                within = (bin_of >= 0) & (bin_of < bin_count)
+                histogram[:, c] = np.bincount(
+                    zone_rows[within] * bin_count + bin_of[within],
+                    weights[within], minlength=total * bin_count
+                ).reshape(total, bin_count)
+            results[stat] = histogram
+
+    if layer == 'num':
+        results = {stat: result if stat == 'count' else result[:, 0]
+                   for stat, result in results.items()}
+    return results